@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from crewai import Agent
+
+
+# ---- configuration (env) ----
+
+AGENT_POOL_MAX_IDLE_ENV = "AGENT_POOL_MAX_IDLE"
+
+# idle agents kept per (role, model); 0 disables pooling
+DEFAULT_MAX_IDLE = 8
+
+AgentBuilder = Callable[[str], "Agent"]
+PoolKey = Tuple[str, str]
+
+
+@dataclass
+class AgentPoolStats:
+    built: int = 0
+    reused: int = 0
+    discarded: int = 0
+
+
+def reset_agent(agent: Agent) -> None:
+    """
+    Clears the per-task state crewai leaves on an Agent after execute_task.
+    """
+    # crewai never resets this; a reused agent would run out of retries
+    agent._times_executed = 0
+    executor = getattr(agent, "agent_executor", None)
+    if executor is not None:
+        # the executor is reused across tasks and keeps appending to one
+        # transcript, so the next task would resend every earlier prompt
+        executor.messages = []
+        executor.iterations = 0
+
+
+class AgentPool:
+    """
+    Reusable crewai Agents keyed by (role, model).
+
+    An Agent is not safe to share between concurrent tasks: execute_task
+    replaces `agent_executor` and bumps a retry counter on the instance. So
+    agents are leased exclusively and returned afterwards; the pool only
+    removes the construction cost, never the isolation. Each builder makes
+    exactly one role, so the builder stands in for the role in the key.
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle = max_idle
+        self.stats = AgentPoolStats()
+        self._idle: Dict[PoolKey, List[Agent]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(builder: AgentBuilder, llm_model) -> PoolKey:
+        return (f"{builder.__module__}.{builder.__qualname__}", str(llm_model))
+
+    def _take_idle(self, key: PoolKey) -> Optional[Agent]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.stats.reused += 1
+                return idle.pop()
+        return None
+
+    def _built(self, agent: Agent) -> Agent:
+        with self._lock:
+            self.stats.built += 1
+        return agent
+
+    def acquire(self, builder: AgentBuilder, llm_model) -> Agent:
+        agent = self._take_idle(self.key(builder, llm_model))
+        if agent is None:
+            agent = self._built(builder(llm_model))
+        return agent
+
+    async def aacquire(self, builder: AgentBuilder, llm_model) -> Agent:
+        agent = self._take_idle(self.key(builder, llm_model))
+        if agent is None:
+            # construction is CPU work; keep it off the event loop
+            agent = self._built(await asyncio.to_thread(builder, llm_model))
+        return agent
+
+    def release(self, builder: AgentBuilder, llm_model, agent: Agent, healthy: bool = True) -> None:
+        key = self.key(builder, llm_model)
+        with self._lock:
+            if not healthy or len(self._idle[key]) >= self.max_idle:
+                self.stats.discarded += 1
+                return
+            reset_agent(agent)
+            self._idle[key].append(agent)
+
+    @contextmanager
+    def lease(self, builder: AgentBuilder, llm_model):
+        agent = self.acquire(builder, llm_model)
+        healthy = False
+        try:
+            yield agent
+            healthy = True
+        finally:
+            self.release(builder, llm_model, agent, healthy)
+
+    @asynccontextmanager
+    async def alease(self, builder: AgentBuilder, llm_model):
+        agent = await self.aacquire(builder, llm_model)
+        healthy = False
+        try:
+            yield agent
+            healthy = True
+        finally:
+            self.release(builder, llm_model, agent, healthy)
+
+    def warm(self, builders: Iterable[AgentBuilder], llm_model, per_role: int = 1) -> None:
+        """
+        Pre-builds `per_role` idle agents for each builder.
+        """
+        for builder in builders:
+            agents = [self._built(builder(llm_model)) for _ in range(per_role)]
+            for agent in agents:
+                self.release(builder, llm_model, agent)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = asdict(self.stats)
+            data["idle"] = sum(len(agents) for agents in self._idle.values())
+        return data
+
+
+_pool: Optional[AgentPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_agent_pool() -> AgentPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = AgentPool(max_idle=int(os.getenv(AGENT_POOL_MAX_IDLE_ENV, DEFAULT_MAX_IDLE)))
+    return _pool
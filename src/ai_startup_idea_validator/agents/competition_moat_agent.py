@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
 
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
 from ai_startup_idea_validator.tools.competition_signal_builder import (
@@ -19,6 +23,8 @@ class CompetitionMoatAnalysis:
 
 
 def build_competition_moat_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Competition & Moat Analyst",
         goal=(
@@ -34,13 +40,14 @@ def build_competition_moat_agent(llm):
     )
 
 
-def run_competition_moat_analysis(
+def _competition_moat_task(
     agent: Agent,
     startup: StartupIdea,
     signals: CompetitionSignals,
-) -> CompetitionMoatAnalysis:
+) -> Task:
+    from crewai import Task
 
-    task = Task(
+    return Task(
         description=f"""
 You are given structural competition signals for a startup.
 
@@ -82,12 +89,20 @@ Return your output STRICTLY as JSON with this shape:
         agent=agent,
     )
 
-    result = agent.execute_task(task)
 
+def _parse_competition_moat_output(result) -> CompetitionMoatAnalysis:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
-        raise ValueError(f"Failed to parse Market & Demand agent output: {result}") from e
+        raise ValueError(f"Failed to parse Competition & Moat agent output: {result}") from e
+
+    REQUIRED_KEYS = {"score", "strengths", "concerns", "rationale"}
+
+    missing = REQUIRED_KEYS - data.keys()
+    if missing:
+        raise ValueError(
+            f"Competition & Moat agent output missing keys {missing}. Output was: {data}"
+        )
 
     if not isinstance(data["concerns"], list):
         raise ValueError("concerns must be a list of strings")
@@ -102,3 +117,23 @@ Return your output STRICTLY as JSON with this shape:
         concerns=data["concerns"],
         rationale=data["rationale"],
     )
+
+
+def run_competition_moat_analysis(
+    agent: Agent,
+    startup: StartupIdea,
+    signals: CompetitionSignals,
+) -> CompetitionMoatAnalysis:
+
+    task = _competition_moat_task(agent, startup, signals)
+    return execute_structured(agent, task, _parse_competition_moat_output, stage="competition_analysis")
+
+
+async def run_competition_moat_analysis_async(
+    agent: Agent,
+    startup: StartupIdea,
+    signals: CompetitionSignals,
+) -> CompetitionMoatAnalysis:
+
+    task = _competition_moat_task(agent, startup, signals)
+    return await aexecute_structured(agent, task, _parse_competition_moat_output, stage="competition_analysis")
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
+from ai_startup_idea_validator.agents.prompt_packing import pack_payload
 
 @dataclass
 class DebateAgainstArgument:
@@ -13,6 +18,8 @@ class DebateAgainstArgument:
 
 
 def build_debate_against_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Debate challenger (AGAINST)",
         goal=(
@@ -28,17 +35,19 @@ def build_debate_against_agent(llm):
     )
 
 
-def run_debate_against(
+def _debate_against_task(
     agent: Agent,
-    analysis_bundle: dict)-> DebateAgainstArgument:
-    task= Task(
+    analysis_bundle: dict)-> Task:
+    from crewai import Task
+
+    return Task(
         description=f"""
         You are participating in a structured debate.
         You MUST argue AGAINST pursuing the startup idea.
         You are given structured analysis results (no raw data):
        
 
-        {json.dumps(analysis_bundle, indent=2)}
+        {pack_payload('debate_against', analysis_bundle)}
 
         Rules (STRICT):
         - Assume adverse conditions.
@@ -61,10 +70,10 @@ def run_debate_against(
         agent=agent,
     )
 
-    result= agent.execute_task(task)
 
+def _parse_debate_against_output(result) -> DebateAgainstArgument:
     try:
-        data=json.loads(result)
+        data = extract_json(result)
     except Exception as e:
         raise ValueError(f"Failed to parse AGAINST debate output: {result}") from e
 
@@ -85,4 +94,18 @@ def run_debate_against(
         core_thesis=data["core_thesis"],
         failure_modes=data["failure_modes"],
         critical_assumptions_attacked=data["critical_assumptions_attacked"],
-    )
\ No newline at end of file
+    )
+
+
+def run_debate_against(
+    agent: Agent,
+    analysis_bundle: dict)-> DebateAgainstArgument:
+    task = _debate_against_task(agent, analysis_bundle)
+    return execute_structured(agent, task, _parse_debate_against_output, stage="against_argument")
+
+
+async def run_debate_against_async(
+    agent: Agent,
+    analysis_bundle: dict)-> DebateAgainstArgument:
+    task = _debate_against_task(agent, analysis_bundle)
+    return await aexecute_structured(agent, task, _parse_debate_against_output, stage="against_argument")
\ No newline at end of file
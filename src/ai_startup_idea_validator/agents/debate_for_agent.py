@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
+from ai_startup_idea_validator.agents.prompt_packing import pack_payload
 
 @dataclass
 class DebateForArgument:
@@ -13,6 +18,8 @@ class DebateForArgument:
 
 
 def build_debate_for_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Debate Advocate (FOR)",
         goal=(
@@ -27,13 +34,15 @@ def build_debate_for_agent(llm):
         verbose=False,
     )
 
-def run_debate_for(agent: Agent, analysis_bundle: dict) -> DebateForArgument:
-    task= Task(
+def _debate_for_task(agent: Agent, analysis_bundle: dict) -> Task:
+    from crewai import Task
+
+    return Task(
         description=f"""
         You are participating in a structured debate.
         You MUST argue FOR pursuing the startup idea.
         You are given structured analysis results (no raw data):
-        {json.dumps(analysis_bundle, indent=2)}
+        {pack_payload('debate_for', analysis_bundle)}
 
         Rules (STRICT):
         - Assume competent execution.
@@ -55,10 +64,10 @@ def run_debate_for(agent: Agent, analysis_bundle: dict) -> DebateForArgument:
         agent=agent,
     )
 
-    result = agent.execute_task(task)
 
+def _parse_debate_for_output(result) -> DebateForArgument:
     try:
-        data=json.loads(result)
+        data = extract_json(result)
     except Exception as e:
         raise ValueError(f"Failed to parse FOR debate output: {result}") from e
     
@@ -73,4 +82,14 @@ def run_debate_for(agent: Agent, analysis_bundle: dict) -> DebateForArgument:
         core_thesis=data["core_thesis"],
         supporting_arguments=data["supporting_arguments"],
         acknowledged_risks=data["acknowledged_risks"],
-    )
\ No newline at end of file
+    )
+
+
+def run_debate_for(agent: Agent, analysis_bundle: dict) -> DebateForArgument:
+    task = _debate_for_task(agent, analysis_bundle)
+    return execute_structured(agent, task, _parse_debate_for_output, stage="for_argument")
+
+
+async def run_debate_for_async(agent: Agent, analysis_bundle: dict) -> DebateForArgument:
+    task = _debate_for_task(agent, analysis_bundle)
+    return await aexecute_structured(agent, task, _parse_debate_for_output, stage="for_argument")
\ No newline at end of file
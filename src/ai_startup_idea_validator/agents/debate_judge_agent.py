@@ -1,8 +1,17 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
+from ai_startup_idea_validator.agents.prompt_packing import pack_payloads
 
-from crewai import Agent, Task
+# the judge may move the base score by this fraction, nothing more
+MIN_CONFIDENCE_SHIFT = -0.25
+MAX_CONFIDENCE_SHIFT = 0.10
 
 @dataclass
 class DebateJudgement:
@@ -15,6 +24,8 @@ class DebateJudgement:
 
 
 def build_debate_judge_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Debate Judge (Consistency Auditor)",
         goal=(
@@ -31,16 +42,19 @@ def build_debate_judge_agent(llm):
     )
 
 
-def run_debate_judgement(agent: Agent, for_argument: dict, against_argument: dict, base_score: float,)-> DebateJudgement:
-    task= Task(
+def _debate_judge_task(agent: Agent, for_argument: dict, against_argument: dict, base_score: float,)-> Task:
+    from crewai import Task
+
+    packed = pack_payloads("debate_judge", {"for": for_argument, "against": against_argument})
+    return Task(
         description=f"""
         You are judging a structured debate about a startup idea.
 
         Inputs:
         
-        FOR argument: {json.dumps(for_argument, indent=2)}
+        FOR argument: {packed['for']}
 
-        AGAINST argument: {json.dumps(against_argument, indent=2)}
+        AGAINST argument: {packed['against']}
 
         Base Score (before debate): {base_score}
 
@@ -74,10 +88,10 @@ def run_debate_judgement(agent: Agent, for_argument: dict, against_argument: dic
         agent=agent,
     )
 
-    result=agent.execute_task(task)
 
+def _parse_debate_judge_output(result) -> DebateJudgement:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
         raise ValueError(f"Failed to parse Judge output: {result}") from e
 
@@ -95,7 +109,7 @@ def run_debate_judgement(agent: Agent, for_argument: dict, against_argument: dic
 
     # ---- hard safety clamps ----
     shift = float(data["confidence_shift"])
-    if shift < -0.25 or shift > 0.10:
+    if shift < MIN_CONFIDENCE_SHIFT or shift > MAX_CONFIDENCE_SHIFT:
         raise ValueError(f"confidence_shift out of bounds: {shift}")
 
     if data["argument_quality"] not in {"low", "medium", "high"}:
@@ -111,4 +125,14 @@ def run_debate_judgement(agent: Agent, for_argument: dict, against_argument: dic
         overlooked_strengths=data["overlooked_strengths"],
         argument_quality=data["argument_quality"],
         judge_rationale=data["judge_rationale"],
-    )
\ No newline at end of file
+    )
+
+
+def run_debate_judgement(agent: Agent, for_argument: dict, against_argument: dict, base_score: float,)-> DebateJudgement:
+    task = _debate_judge_task(agent, for_argument, against_argument, base_score)
+    return execute_structured(agent, task, _parse_debate_judge_output, stage="judgement")
+
+
+async def run_debate_judgement_async(agent: Agent, for_argument: dict, against_argument: dict, base_score: float,)-> DebateJudgement:
+    task = _debate_judge_task(agent, for_argument, against_argument, base_score)
+    return await aexecute_structured(agent, task, _parse_debate_judge_output, stage="judgement")
\ No newline at end of file
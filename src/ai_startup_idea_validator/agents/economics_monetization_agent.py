@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
-import json
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
-from ai_startup_idea_validator.tools.market_size_tool import MarketSizeResult
-from ai_startup_idea_validator.tools.cost_model_tool import CostModelResult
+from ai_startup_idea_validator.tools.market_size_tool import MarketSizeResult, format_band
+from ai_startup_idea_validator.tools.cost_model_tool import CostModelResult, format_scaling
 
 @dataclass
 class EconomicsMonetizationAnalysis:
@@ -16,6 +20,8 @@ class EconomicsMonetizationAnalysis:
 
 
 def build_economics_monetization_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Economics and Monetization Analyst",
         goal=(
@@ -31,9 +37,11 @@ def build_economics_monetization_agent(llm):
     )
 
 
-def run_economics_monetization_analysis(
-    agent:Agent, startup: StartupIdea, market: MarketSizeResult, cost: CostModelResult) -> EconomicsMonetizationAnalysis:
-    task=Task(description=f"""
+def _economics_monetization_task(
+    agent:Agent, startup: StartupIdea, market: MarketSizeResult, cost: CostModelResult) -> Task:
+    from crewai import Task
+
+    return Task(description=f"""
     You are given structured financial evidence about a startup.
 
     Startup summary:
@@ -41,16 +49,19 @@ def run_economics_monetization_analysis(
     - Monetization model: {startup.monetization_model}
 
     Market size:
-    - TAM (USD): {market.tam_usd}
-    - SAM (USD): {market.sam_usd}
-    - SOM (USD): {market.som_usd}
+    - TAM (USD): {market.tam_usd}{format_band(market.bands, "tam_usd")}
+    - SAM (USD): {market.sam_usd}{format_band(market.bands, "sam_usd")}
+    - SOM (USD): {market.som_usd}{format_band(market.bands, "som_usd")}
 
     Cost Model:
     - Monthly fixed cost (USD): {cost.monthly_fixed_cost_usd}
-    - Monthly variable cost (USD): {cost.total_monthly_cost_usd}
+    - Monthly variable cost (USD): {cost.monthly_variable_cost_usd}
     - Total monthly cost (USD): {cost.total_monthly_cost_usd}
     - Cost confidence: {cost.confidence}
 
+    Cost scaling:
+    {format_scaling(cost.scaling, indent="    ") or "- not available"}
+
     Instructions:
     1. Evaluate whether monetization is realistic for the given market.
     2. Assess scalability: do costs grow slower than potential revenue?
@@ -75,13 +86,20 @@ def run_economics_monetization_analysis(
     agent=agent,
     )
 
-    result=agent.execute_task(task)
-
 
+def _parse_economics_monetization_output(result) -> EconomicsMonetizationAnalysis:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
-        raise ValueError(f"Failed to parse Market & Demand agent output: {result}") from e
+        raise ValueError(f"Failed to parse Economics & Monetization agent output: {result}") from e
+
+    REQUIRED_KEYS = {"score", "strengths", "concerns", "rationale"}
+
+    missing = REQUIRED_KEYS - data.keys()
+    if missing:
+        raise ValueError(
+            f"Economics & Monetization agent output missing keys {missing}. Output was: {data}"
+        )
 
     if not isinstance(data["concerns"], list):
         raise ValueError("concerns must be a list of strings")
@@ -95,4 +113,16 @@ def run_economics_monetization_analysis(
         strengths=data["strengths"],
         concerns=data["concerns"],
         rationale=data["rationale"],
-    )
\ No newline at end of file
+    )
+
+
+def run_economics_monetization_analysis(
+    agent:Agent, startup: StartupIdea, market: MarketSizeResult, cost: CostModelResult) -> EconomicsMonetizationAnalysis:
+    task = _economics_monetization_task(agent, startup, market, cost)
+    return execute_structured(agent, task, _parse_economics_monetization_output, stage="economics_analysis")
+
+
+async def run_economics_monetization_analysis_async(
+    agent:Agent, startup: StartupIdea, market: MarketSizeResult, cost: CostModelResult) -> EconomicsMonetizationAnalysis:
+    task = _economics_monetization_task(agent, startup, market, cost)
+    return await aexecute_structured(agent, task, _parse_economics_monetization_output, stage="economics_analysis")
\ No newline at end of file
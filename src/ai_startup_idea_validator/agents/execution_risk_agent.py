@@ -1,7 +1,12 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-from crewai import Agent, Task
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
 
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
 
@@ -14,6 +19,8 @@ class ExecutionRiskAnalysis:
 
 
 def build_execution_risk_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Execution and risk analyst",
         goal=(
@@ -31,8 +38,10 @@ def build_execution_risk_agent(llm):
 
 
 
-def run_execution_risk_analysis(agent: Agent, startup: StartupIdea)-> ExecutionRiskAnalysis:
-    task=Task(
+def _execution_risk_task(agent: Agent, startup: StartupIdea)-> Task:
+    from crewai import Task
+
+    return Task(
         description=f"""
 
         You are given structured information about a startup.
@@ -71,13 +80,20 @@ def run_execution_risk_analysis(agent: Agent, startup: StartupIdea)-> ExecutionR
         agent=agent,
     )
 
-    result = agent.execute_task(task)
 
+def _parse_execution_risk_output(result) -> ExecutionRiskAnalysis:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
-        raise ValueError(f"Failed to parse Market & Demand agent output: {result}") from e
+        raise ValueError(f"Failed to parse Execution Risk agent output: {result}") from e
 
+    REQUIRED_KEYS = {"score", "strengths", "concerns", "rationale"}
+
+    missing = REQUIRED_KEYS - data.keys()
+    if missing:
+        raise ValueError(
+            f"Execution Risk agent output missing keys {missing}. Output was: {data}"
+        )
 
     if not isinstance(data["concerns"], list):
         raise ValueError("concerns must be a list of strings")
@@ -94,4 +110,14 @@ def run_execution_risk_analysis(agent: Agent, startup: StartupIdea)-> ExecutionR
     )
 
 
+def run_execution_risk_analysis(agent: Agent, startup: StartupIdea)-> ExecutionRiskAnalysis:
+    task = _execution_risk_task(agent, startup)
+    return execute_structured(agent, task, _parse_execution_risk_output, stage="execution_analysis")
+
+
+async def run_execution_risk_analysis_async(agent: Agent, startup: StartupIdea)-> ExecutionRiskAnalysis:
+    task = _execution_risk_task(agent, startup)
+    return await aexecute_structured(agent, task, _parse_execution_risk_output, stage="execution_analysis")
+
+
     
\ No newline at end of file
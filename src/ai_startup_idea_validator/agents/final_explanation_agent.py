@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Dict
-import json
+from typing import List, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
+from ai_startup_idea_validator.agents.prompt_packing import pack_payload
 from ai_startup_idea_validator.scoring.final_aggregator import FinalDecision
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
 
@@ -18,6 +23,8 @@ class FinalExplanation:
 
 
 def build_final_explanation_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Startup Evaluation Explainer",
         goal=(
@@ -33,8 +40,10 @@ def build_final_explanation_agent(llm):
     )
 
 
-def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: FinalDecision) -> FinalExplanation:
-    task=Task(
+def _final_explanation_task(agent: Agent, startup: StartupIdea, final_decision: FinalDecision) -> Task:
+    from crewai import Task
+
+    return Task(
         description=f"""
 
         You are explaining the final evaluation of a startup idea.
@@ -46,7 +55,7 @@ def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: Fi
         - Industry: {startup.industry}
 
         Final decision (already computed, DO NOT change it):
-        {json.dumps(final_decision.__dict__, indent=2)}
+        {pack_payload('final_explanation', final_decision.__dict__)}
 
         Rules (STRICT):
         - Do NOT rescore or second-guess the decision.
@@ -76,10 +85,10 @@ def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: Fi
         agent=agent,
     )
 
-    result= agent.execute_task(task)
 
+def _parse_final_explanation_output(result) -> FinalExplanation:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
         raise ValueError(f"Failed to parse Final Explanation output: {result}") from e
 
@@ -90,6 +99,7 @@ def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: Fi
         "summary",
         "key_reasons_for_score",
         "key_risks",
+        "recommended_next_steps",
         "confidence_level",
     }
 
@@ -108,3 +118,13 @@ def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: Fi
         confidence_level=data["confidence_level"]
     )
 
+
+def run_final_explanation(agent: Agent, startup: StartupIdea, final_decision: FinalDecision) -> FinalExplanation:
+    task = _final_explanation_task(agent, startup, final_decision)
+    return execute_structured(agent, task, _parse_final_explanation_output, stage="final_explanation")
+
+
+async def run_final_explanation_async(agent: Agent, startup: StartupIdea, final_decision: FinalDecision) -> FinalExplanation:
+    task = _final_explanation_task(agent, startup, final_decision)
+    return await aexecute_structured(agent, task, _parse_final_explanation_output, stage="final_explanation")
+
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List
-import json
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-from crewai import Agent, Task
+from ai_startup_idea_validator.agents.structured_output import aexecute_structured, execute_structured, extract_json
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
-from ai_startup_idea_validator.tools.market_size_tool import MarketSizeResult
+from ai_startup_idea_validator.tools.market_size_tool import MarketSizeResult, format_band
 from ai_startup_idea_validator.tools.demand_signal_tool import DemandSignalResult
 
 
@@ -17,6 +21,8 @@ class MarketDemandAnalysis:
 
 
 def build_market_demand_agent(llm):
+    from crewai import Agent
+
     return Agent(
         role="Market and demand analyst",
         goal=(
@@ -32,8 +38,10 @@ def build_market_demand_agent(llm):
     )
 
 
-def run_market_demand_analysis(agent:Agent, startup: StartupIdea, market: MarketSizeResult, demand: DemandSignalResult) -> MarketDemandAnalysis:
-    task = Task(
+def _market_demand_task(agent:Agent, startup: StartupIdea, market: MarketSizeResult, demand: DemandSignalResult) -> Task:
+    from crewai import Task
+
+    return Task(
         description=f"""
             You are given structured evidence about a startup idea.
 
@@ -43,9 +51,9 @@ def run_market_demand_analysis(agent:Agent, startup: StartupIdea, market: Market
             - Geography: {startup.geography}
 
             Market size evidence:
-            - TAM (USD): {market.tam_usd}
-            - SAM (USD): {market.sam_usd}
-            - SOM (USD): {market.som_usd}
+            - TAM (USD): {market.tam_usd}{format_band(market.bands, "tam_usd")}
+            - SAM (USD): {market.sam_usd}{format_band(market.bands, "sam_usd")}
+            - SOM (USD): {market.som_usd}{format_band(market.bands, "som_usd")}
             - confidence: {market.confidence}
 
             Demand Signals:
@@ -76,11 +84,10 @@ def run_market_demand_analysis(agent:Agent, startup: StartupIdea, market: Market
         agent=agent,
     )
 
-    result = agent.execute_task(task)
-
 
+def _parse_market_demand_output(result) -> MarketDemandAnalysis:
     try:
-        data = json.loads(result)
+        data = extract_json(result)
     except Exception as e:
         raise ValueError(f"Failed to parse Market & Demand agent output: {result}") from e
 
@@ -106,3 +113,13 @@ def run_market_demand_analysis(agent:Agent, startup: StartupIdea, market: Market
         rationale=data["rationale"],
     )
 
+
+def run_market_demand_analysis(agent:Agent, startup: StartupIdea, market: MarketSizeResult, demand: DemandSignalResult) -> MarketDemandAnalysis:
+    task = _market_demand_task(agent, startup, market, demand)
+    return execute_structured(agent, task, _parse_market_demand_output, stage="market_analysis")
+
+
+async def run_market_demand_analysis_async(agent:Agent, startup: StartupIdea, market: MarketSizeResult, demand: DemandSignalResult) -> MarketDemandAnalysis:
+    task = _market_demand_task(agent, startup, market, demand)
+    return await aexecute_structured(agent, task, _parse_market_demand_output, stage="market_analysis")
+
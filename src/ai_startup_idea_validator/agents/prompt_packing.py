@@ -0,0 +1,190 @@
+import copy
+import json
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ---- configuration (env) ----
+
+PROMPT_PACKING_ENV = "PROMPT_PACKING"
+# per stage, e.g. PROMPT_TOKEN_BUDGET_DEBATE_JUDGE=600; 0 disables truncation
+PROMPT_TOKEN_BUDGET_ENV_PREFIX = "PROMPT_TOKEN_BUDGET_"
+
+# tokens allowed for the structured payload a stage embeds in its prompt
+DEFAULT_STAGE_BUDGETS = {
+    "debate_for": 1500,
+    "debate_against": 1500,
+    "debate_judge": 1000,
+    "final_explanation": 1000,
+}
+
+# a truncated rationale keeps at least this much of its opening
+MIN_RATIONALE_TOKENS = 40
+FLOAT_DIGITS = 3
+TOKENIZER_ENCODING = "o200k_base"
+
+
+# ---- token counting ----
+
+@lru_cache(maxsize=1)
+def _encoder():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Exact count when tiktoken is installed, else ~4 characters per token.
+    """
+    encoder = _encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+# ---- stats ----
+
+@dataclass
+class PackingStats:
+    calls: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    truncated_fields: int = 0
+
+
+_stats: Dict[str, PackingStats] = {}
+_stats_lock = threading.Lock()
+
+
+def packing_snapshot() -> Dict[str, dict]:
+    with _stats_lock:
+        snapshot = {stage: asdict(stats) for stage, stats in _stats.items()}
+    for data in snapshot.values():
+        before = data["tokens_before"]
+        data["saved_pct"] = round(100 * (1 - data["tokens_after"] / before), 1) if before else 0.0
+    return snapshot
+
+
+def _record(stage: str, before: int, after: int, truncated: int) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(stage, PackingStats())
+        stats.calls += 1
+        stats.tokens_before += before
+        stats.tokens_after += after
+        stats.truncated_fields += truncated
+    logger.debug("prompt packing %s: %d -> %d tokens (%d fields truncated)", stage, before, after, truncated)
+
+
+# ---- packing ----
+
+def packing_enabled() -> bool:
+    return os.getenv(PROMPT_PACKING_ENV, "1").lower() not in {"0", "false", "no", "off"}
+
+
+def stage_budget(stage: str) -> Optional[int]:
+    budget = int(os.getenv(PROMPT_TOKEN_BUDGET_ENV_PREFIX + stage.upper(), DEFAULT_STAGE_BUDGETS.get(stage, 0)))
+    return budget or None
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    if isinstance(value, dict):
+        return {key: _compact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_compact(item) for item in value]
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _rationale_fields(value: Any, path: Tuple = ()) -> List[Tuple]:
+    if isinstance(value, dict):
+        found = []
+        for key, item in value.items():
+            if isinstance(item, str) and key.endswith("rationale"):
+                found.append(path + (key,))
+            else:
+                found.extend(_rationale_fields(item, path + (key,)))
+        return found
+    if isinstance(value, list):
+        return [p for i, item in enumerate(value) for p in _rationale_fields(item, path + (i,))]
+    return []
+
+
+def _get(value: Any, path: Tuple) -> Any:
+    for key in path:
+        value = value[key]
+    return value
+
+
+def _set(value: Any, path: Tuple, new: Any) -> None:
+    _get(value, path[:-1])[path[-1]] = new
+
+
+def truncate_text(text: str, max_tokens: int) -> str:
+    """
+    Keeps the opening of `text` within `max_tokens`, ending on a sentence
+    boundary when one is close to the cut.
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    cut = max(1, int(len(text) * max_tokens / tokens))
+    head = text[:cut]
+    sentence_end = head.rfind(". ")
+    if sentence_end >= cut // 2:
+        head = head[:sentence_end + 1]
+    return head.rstrip() + " …"
+
+
+def pack_payloads(stage: str, payloads: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Serializes the structured inputs of one prompt compactly (no indentation,
+    rounded floats). If they still exceed the stage's token budget, the
+    longest *rationale fields are shortened, longest first. Inputs are not
+    modified. Returns the JSON text for each payload name.
+    """
+    before = sum(estimate_tokens(json.dumps(payload, indent=2)) for payload in payloads.values())
+    if not packing_enabled():
+        _record(stage, before, before, 0)
+        return {name: json.dumps(payload, indent=2) for name, payload in payloads.items()}
+
+    packed = {name: _compact(copy.deepcopy(payload)) for name, payload in payloads.items()}
+    total = sum(estimate_tokens(_dumps(payload)) for payload in packed.values())
+
+    truncated = 0
+    budget = stage_budget(stage)
+    if budget is not None and total > budget:
+        fields = [(name, path) for name, payload in packed.items() for path in _rationale_fields(payload)]
+        fields.sort(key=lambda field: -len(_get(packed[field[0]], field[1])))
+        for name, path in fields:
+            over = total - budget
+            if over <= 0:
+                break
+            text = _get(packed[name], path)
+            shortened = truncate_text(text, max(MIN_RATIONALE_TOKENS, estimate_tokens(text) - over))
+            if shortened != text:
+                _set(packed[name], path, shortened)
+                total += estimate_tokens(shortened) - estimate_tokens(text)
+                truncated += 1
+
+    texts = {name: _dumps(payload) for name, payload in packed.items()}
+    _record(stage, before, sum(estimate_tokens(text) for text in texts.values()), truncated)
+    return texts
+
+
+def pack_payload(stage: str, payload: Any) -> str:
+    return pack_payloads(stage, {"payload": payload})["payload"]
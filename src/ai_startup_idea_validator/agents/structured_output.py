@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar
+
+from ai_startup_idea_validator.agents.agent_pool import reset_agent
+from ai_startup_idea_validator.cache.llm_cache import (
+    acached_execute_task,
+    cached_execute_task,
+    invalidate_task,
+)
+from ai_startup_idea_validator.monitoring.metrics import stage_retried
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ---- configuration (env) ----
+
+STRUCTURED_OUTPUT_MAX_RETRIES_ENV = "STRUCTURED_OUTPUT_MAX_RETRIES"
+
+# re-asks per stage after the first answer; 0 fails on the first bad output
+DEFAULT_MAX_RETRIES = 2
+
+# how much of the rejection reason is echoed back to the agent
+MAX_FEEDBACK_CHARS = 300
+
+# what a parser raises for output that is not the promised schema
+OUTPUT_ERRORS = (ValueError, KeyError, TypeError)
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+_FINAL_ANSWER = re.compile(r"final answer\s*:", re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+_decoder = json.JSONDecoder()
+
+
+# ---- extraction ----
+
+def _first_object(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    # prose around the object: take the first '{' that starts a complete one
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+            return value
+        except ValueError:
+            start = text.find("{", start + 1)
+    return None
+
+
+def extract_json(result) -> Dict[str, Any]:
+    """
+    The JSON object in an agent answer, tolerating markdown fences, a leading
+    "Final Answer:", surrounding prose and trailing commas.
+    """
+    if isinstance(result, dict):
+        return result
+    text = str(result).strip()
+
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+    marker = None
+    for marker in _FINAL_ANSWER.finditer(text):
+        pass
+    if marker is not None:
+        text = text[marker.end():].strip()
+
+    data = _first_object(text)
+    if data is None:
+        data = _first_object(_TRAILING_COMMA.sub(r"\1", text))
+    if not isinstance(data, dict):
+        raise ValueError("no JSON object found in agent output")
+    return data
+
+
+# ---- retries ----
+
+def max_retries() -> int:
+    return max(0, int(os.getenv(STRUCTURED_OUTPUT_MAX_RETRIES_ENV, DEFAULT_MAX_RETRIES)))
+
+
+def _retry_task(task: Task, error: Exception) -> Task:
+    """
+    The same task with the rejection reason appended, so the re-ask is a new
+    prompt (and cache key) rather than a replay of the rejected one.
+    """
+    reason = str(error)
+    if len(reason) > MAX_FEEDBACK_CHARS:
+        reason = reason[:MAX_FEEDBACK_CHARS] + "..."
+    note = (
+        "\n\nYour previous answer was rejected: "
+        f"{reason}\n"
+        "Reply with ONLY the JSON object in the exact shape requested above, with no other text."
+    )
+    return task.model_copy(update={"description": task.description + note})
+
+
+def _rejected(stage: str, attempt: int, retries: int, error: Exception) -> None:
+    logger.warning(
+        "%s output rejected (attempt %d of %d): %s",
+        stage, attempt + 1, retries + 1, str(error)[:MAX_FEEDBACK_CHARS],
+    )
+
+
+def execute_structured(agent: Agent, task: Task, parse: Callable[[str], T], stage: str) -> T:
+    """
+    Runs `task` and parses the answer; an answer that fails `parse` is evicted
+    from the LLM cache and only this stage is asked again, up to
+    STRUCTURED_OUTPUT_MAX_RETRIES times.
+    """
+    retries = max_retries()
+    attempt_task = task
+    for attempt in range(retries + 1):
+        result = cached_execute_task(agent, attempt_task)
+        try:
+            parsed = parse(result)
+        except OUTPUT_ERRORS as e:
+            invalidate_task(agent, attempt_task)
+            _rejected(stage, attempt, retries, e)
+            if attempt == retries:
+                if attempt:
+                    stage_retried(stage, "exhausted")
+                raise
+            reset_agent(agent)
+            attempt_task = _retry_task(task, e)
+            continue
+        if attempt:
+            stage_retried(stage, "recovered")
+        return parsed
+
+
+async def aexecute_structured(agent: Agent, task: Task, parse: Callable[[str], T], stage: str) -> T:
+    """
+    Async variant of `execute_structured`.
+    """
+    retries = max_retries()
+    attempt_task = task
+    for attempt in range(retries + 1):
+        result = await acached_execute_task(agent, attempt_task)
+        try:
+            parsed = parse(result)
+        except OUTPUT_ERRORS as e:
+            await asyncio.to_thread(invalidate_task, agent, attempt_task)
+            _rejected(stage, attempt, retries, e)
+            if attempt == retries:
+                if attempt:
+                    stage_retried(stage, "exhausted")
+                raise
+            reset_agent(agent)
+            attempt_task = _retry_task(task, e)
+            continue
+        if attempt:
+            stage_retried(stage, "recovered")
+        return parsed
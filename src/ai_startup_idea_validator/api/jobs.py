@@ -0,0 +1,450 @@
+import http.client
+import ipaddress
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import urllib.request
+import uuid
+from urllib.parse import urlsplit
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ai_startup_idea_validator.models.startup_idea import StartupIdea
+from ai_startup_idea_validator.pipeline.run_full_validation import (
+    run_full_validation,
+    serialize_stage_output,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ---- configuration (env) ----
+
+JOBS_DB_PATH_ENV = "JOBS_DB_PATH"
+JOBS_WORKERS_ENV = "JOBS_WORKERS"
+JOBS_MAX_QUEUE_DEPTH_ENV = "JOBS_MAX_QUEUE_DEPTH"
+JOBS_HEARTBEAT_TIMEOUT_ENV = "JOBS_HEARTBEAT_TIMEOUT"
+JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV = "JOBS_WEBHOOK_ALLOWED_NETWORKS"
+
+DEFAULT_JOBS_DB_PATH = Path.home() / ".cache" / "ai_startup_idea_validator" / "jobs.sqlite3"
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE_DEPTH = 100
+
+# used for Retry-After until a few jobs have finished
+DEFAULT_JOB_SECONDS = 60.0
+WEBHOOK_TIMEOUT_SECONDS = 10
+WEBHOOK_SCHEMES = ("http", "https")
+
+# a running job whose owner has not heartbeated for this long is requeued
+DEFAULT_HEARTBEAT_TIMEOUT = 60.0
+HEARTBEAT_INTERVAL_FRACTION = 0.25
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    def __init__(self, depth: int, retry_after: int):
+        super().__init__(f"Job queue is full ({depth} queued)")
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+class WebhookNotAllowedError(ValueError):
+    pass
+
+
+# ---- persistent queue ----
+
+class JobStore:
+    """
+    SQLite-backed job table; doubles as the work queue, so queued jobs
+    survive a restart. Several processes may share one database: a claim is
+    a single conditional UPDATE, and each store records itself as the owner
+    of the jobs it runs and heartbeats them, so only jobs whose owner went
+    quiet are requeued.
+    """
+
+    def __init__(self, path: Path, heartbeat_timeout: float = DEFAULT_HEARTBEAT_TIMEOUT):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.heartbeat_timeout = heartbeat_timeout
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " request TEXT NOT NULL,"
+            " webhook_url TEXT,"
+            " partial TEXT NOT NULL DEFAULT '{}',"
+            " result TEXT,"
+            " error TEXT,"
+            " created_at REAL NOT NULL,"
+            " started_at REAL,"
+            " finished_at REAL,"
+            " owner TEXT,"
+            " heartbeat_at REAL)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("heartbeat_at", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs(status, created_at)")
+        self._conn.commit()
+        self.requeue_stale()
+
+    def create(self, request: Dict[str, Any], webhook_url: Optional[str]) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, request, webhook_url, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(request), webhook_url, time.time()),
+            )
+            self._conn.commit()
+        return job_id
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Takes the oldest queued job. The UPDATE only succeeds while the row is
+        still queued, so when another process claims it first (rowcount 0)
+        the next candidate is tried.
+        """
+        with self._lock:
+            while True:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row is None:
+                    return None
+                now = time.time()
+                cur = self._conn.execute(
+                    "UPDATE jobs SET status = ?, owner = ?, started_at = ?, heartbeat_at = ?"
+                    " WHERE id = ? AND status = ?",
+                    (RUNNING, self.owner, now, now, row[0], QUEUED),
+                )
+                self._conn.commit()
+                if cur.rowcount == 1:
+                    break
+        return self.get(row[0])
+
+    def heartbeat(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = ?", (time.time(), self.owner, RUNNING)
+            )
+            self._conn.commit()
+
+    def requeue_stale(self) -> int:
+        """
+        Puts running jobs whose owner stopped heartbeating (a crashed or
+        killed process) back on the queue. Returns how many were requeued.
+        """
+        cutoff = time.time() - self.heartbeat_timeout
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = NULL, partial = '{}'"
+                " WHERE status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                (QUEUED, RUNNING, cutoff),
+            )
+            self._conn.commit()
+        if cur.rowcount:
+            logger.warning("Requeued %d job(s) whose worker stopped heartbeating", cur.rowcount)
+        return cur.rowcount
+
+    def record_stage(self, job_id: str, stage: str, output: Any, seconds: float) -> None:
+        with self._lock:
+            (partial,) = self._conn.execute("SELECT partial FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            partial = json.loads(partial)
+            partial[stage] = {"output": output, "seconds": round(seconds, 4)}
+            self._conn.execute(
+                "UPDATE jobs SET partial = ? WHERE id = ? AND owner = ?", (json.dumps(partial), job_id, self.owner)
+            )
+            self._conn.commit()
+
+    def finish(self, job_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> bool:
+        """
+        Records the outcome; False if the job was requeued (and possibly
+        claimed elsewhere) after this store lost ownership of it.
+        """
+        status = FAILED if error is not None else SUCCEEDED
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ? AND owner = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id, self.owner),
+            )
+            self._conn.commit()
+        if cur.rowcount == 0:
+            logger.warning("Job %s is no longer owned by this worker; dropping its outcome", job_id)
+        return cur.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cur = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            job = dict(zip([c[0] for c in cur.description], row))
+        job["request"] = json.loads(job["request"])
+        job["partial"] = json.loads(job["partial"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def queue_depth(self) -> int:
+        with self._lock:
+            (depth,) = self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (QUEUED,)).fetchone()
+        return depth
+
+    def recent_durations(self, limit: int = 50) -> List[float]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT finished_at - started_at FROM jobs WHERE status = ? AND started_at IS NOT NULL"
+                " ORDER BY finished_at DESC LIMIT ?",
+                (SUCCEEDED, limit),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+
+# ---- webhooks ----
+
+def _allowed_networks() -> List[Any]:
+    value = os.getenv(JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV, "")
+    return [ipaddress.ip_network(part.strip(), strict=False) for part in value.split(",") if part.strip()]
+
+
+def check_webhook_address(address: str) -> None:
+    """
+    Rejects loopback, private, link-local (cloud metadata), multicast and
+    reserved addresses unless JOBS_WEBHOOK_ALLOWED_NETWORKS lists them.
+    """
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if getattr(ip, "ipv4_mapped", None) is not None:
+        ip = ip.ipv4_mapped
+    if any(ip in network for network in _allowed_networks()):
+        return
+    if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast or ip.is_reserved or ip.is_unspecified:
+        raise WebhookNotAllowedError(f"webhook address {ip} is not publicly routable")
+
+
+def check_webhook_url(url: str) -> None:
+    """
+    Submit-time check: http(s) only, and no literal non-public IP host.
+    Hostnames are checked again against the address actually connected to.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in WEBHOOK_SCHEMES:
+        raise WebhookNotAllowedError(f"webhook scheme must be http or https, not {parts.scheme!r}")
+    if not parts.hostname:
+        raise WebhookNotAllowedError("webhook URL has no host")
+    try:
+        ipaddress.ip_address(parts.hostname)
+    except ValueError:
+        return
+    check_webhook_address(parts.hostname)
+
+
+class _CheckedHTTPConnection(http.client.HTTPConnection):
+    def connect(self):
+        super().connect()
+        try:
+            # the peer, not the name: a hostname re-resolving to an internal address is caught too
+            check_webhook_address(self.sock.getpeername()[0])
+        except WebhookNotAllowedError:
+            self.close()
+            raise
+
+
+class _CheckedHTTPSConnection(http.client.HTTPSConnection):
+    def connect(self):
+        super().connect()
+        try:
+            check_webhook_address(self.sock.getpeername()[0])
+        except WebhookNotAllowedError:
+            self.close()
+            raise
+
+
+class _CheckedHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(_CheckedHTTPConnection, req)
+
+
+class _CheckedHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_CheckedHTTPSConnection, req, context=self._context)
+
+
+def _webhook_opener() -> urllib.request.OpenerDirector:
+    """
+    Only the checked http(s) handlers: no file://, ftp:// or data:, no
+    environment proxies and no redirects.
+    """
+    opener = urllib.request.OpenerDirector()
+    for handler in (
+        _CheckedHTTPHandler(),
+        _CheckedHTTPSHandler(),
+        urllib.request.HTTPDefaultErrorHandler(),
+        urllib.request.HTTPErrorProcessor(),
+    ):
+        opener.add_handler(handler)
+    return opener
+
+
+def _post_webhook(url: str, payload: Dict[str, Any]) -> None:
+    try:
+        check_webhook_url(url)
+        req = urllib.request.Request(
+            url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with _webhook_opener().open(req, timeout=WEBHOOK_TIMEOUT_SECONDS):
+            pass
+    except WebhookNotAllowedError as e:
+        logger.warning("Webhook to %s refused: %s", url, e)
+    except Exception:
+        logger.exception("Webhook delivery failed for %s", url)
+
+
+# ---- worker pool ----
+
+class JobManager:
+    """
+    Fixed pool of worker threads draining the JobStore. The pool size is the
+    upper bound on concurrent validations (and therefore on LLM concurrency).
+    """
+
+    def __init__(self, store: JobStore, workers: int = DEFAULT_WORKERS, max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH):
+        self.store = store
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self._wakeup = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        thread = threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _heartbeat(self) -> None:
+        interval = self.store.heartbeat_timeout * HEARTBEAT_INTERVAL_FRACTION
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            try:
+                self.store.heartbeat()
+                if self.store.requeue_stale():
+                    with self._wakeup:
+                        self._wakeup.notify_all()
+            except Exception:
+                logger.exception("Job heartbeat failed")
+            time.sleep(interval)
+
+    def stop(self) -> None:
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+
+    def retry_after(self, depth: int) -> int:
+        durations = self.store.recent_durations()
+        per_job = (sum(durations) / len(durations)) if durations else DEFAULT_JOB_SECONDS
+        return max(1, int(per_job * (depth + 1) / self.workers))
+
+    def submit(self, request: Dict[str, Any], webhook_url: Optional[str] = None) -> str:
+        depth = self.store.queue_depth()
+        if depth >= self.max_queue_depth:
+            raise QueueFullError(depth, self.retry_after(depth))
+
+        job_id = self.store.create(request, webhook_url)
+        with self._wakeup:
+            self._wakeup.notify()
+        return job_id
+
+    def _worker(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            job = self.store.claim_next()
+            if job is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=1.0)
+                continue
+            self._run(job)
+
+    def _run(self, job: Dict[str, Any]) -> None:
+        job_id = job["id"]
+
+        def on_stage_complete(stage: str, output: Any, seconds: float) -> None:
+            try:
+                self.store.record_stage(job_id, stage, serialize_stage_output(output), seconds)
+            except Exception:
+                logger.exception("Could not record stage %s for job %s", stage, job_id)
+
+        try:
+            startup = StartupIdea(**job["request"])
+            result = run_full_validation(startup, on_stage_complete=on_stage_complete)
+            finished = self.store.finish(job_id, result=result)
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            finished = self.store.finish(job_id, error=str(e))
+
+        # a job this worker lost is reported by whoever runs it now
+        if finished and job.get("webhook_url"):
+            _post_webhook(job["webhook_url"], job_view(self.store.get(job_id)))
+
+
+def job_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Public representation of a job (what GET /jobs/{id} and webhooks return).
+    """
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "partial": job["partial"],
+        "result": job["result"],
+        "error": job["error"],
+    }
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Process-wide manager, started on first use.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                manager = JobManager(
+                    JobStore(
+                        Path(os.getenv(JOBS_DB_PATH_ENV, DEFAULT_JOBS_DB_PATH)),
+                        heartbeat_timeout=float(os.getenv(JOBS_HEARTBEAT_TIMEOUT_ENV, DEFAULT_HEARTBEAT_TIMEOUT)),
+                    ),
+                    workers=int(os.getenv(JOBS_WORKERS_ENV, DEFAULT_WORKERS)),
+                    max_queue_depth=int(os.getenv(JOBS_MAX_QUEUE_DEPTH_ENV, DEFAULT_MAX_QUEUE_DEPTH)),
+                )
+                manager.start()
+                _manager = manager
+    return _manager
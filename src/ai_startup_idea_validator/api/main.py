@@ -1,15 +1,43 @@
-from signal import valid_signals
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, HttpUrl, field_validator
+from typing import Annotated, Any, Dict, List, Optional
 
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
-from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation
+from ai_startup_idea_validator.pipeline.run_full_validation import (
+    InvalidChangesError,
+    UnknownRunError,
+    revalidate_async,
+    run_full_validation_async,
+    serialize_stage_output,
+)
+from ai_startup_idea_validator.scoring.final_aggregator import verdict_from_score
+from ai_startup_idea_validator.api.jobs import QueueFullError, check_webhook_url, get_job_manager, job_view
+from ai_startup_idea_validator.monitoring.metrics import CONTENT_TYPE, render_metrics
+from ai_startup_idea_validator.pipeline.warmup import load_environment, warm_state, warm_up, warm_up_enabled
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_environment()
+    warming=None
+    if warm_up_enabled():
+        # serve /ready (503) while the heavy imports and agent builds happen
+        warming=asyncio.create_task(asyncio.to_thread(warm_up))
+    yield
+    if warming is not None and not warming.done():
+        warming.cancel()
+
 
 app = FastAPI(
     title="AI Startup Idea Validator",
     description="Evaluates startup ideas using evidence, multi-agent analysis, debate and scoring.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -30,18 +58,56 @@ class StartupIdeaRequest(BaseModel):
 
 
 
+class JobRequest(StartupIdeaRequest):
+    # http(s) only; literal internal addresses are refused here, resolved ones at delivery
+    webhook_url: Optional[HttpUrl]=None
+
+    @field_validator("webhook_url")
+    @classmethod
+    def _public_webhook(cls, url: Optional[HttpUrl]) -> Optional[HttpUrl]:
+        if url is not None:
+            check_webhook_url(str(url))
+        return url
+
+
+class RevalidationRequest(BaseModel):
+    run_id: str
+    changes: Dict[str, Any]
+
+
 class ValidationResponse(BaseModel):
     final_score: float
     verdict: str
     confidence_level: str
     explanation: dict
+    run_id: Optional[str] = None
+    # fast mode: the base score settled the verdict and no debate ran
+    debate_skipped: bool = False
+
+
+class RevalidationResponse(ValidationResponse):
+    parent_run_id: str
+    recomputed_stages: List[str]
+
+
+@app.get("/ready")
+def readiness():
+    state=warm_state()
+    if not warm_up_enabled():
+        state["ready"]=True
+    return JSONResponse(status_code=200 if state["ready"] else 503, content=state)
+
+
+@app.get("/metrics")
+def metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
 
 
 @app.post("/validate",response_model=ValidationResponse)
-def validate_startup(idea: StartupIdeaRequest):
+async def validate_startup(idea: StartupIdeaRequest):
     try:
         startup=StartupIdea(**idea.dict())
-        result=run_full_validation(startup)
+        result=await run_full_validation_async(startup, save_run=True)
 
         final_decision=result["final_decision"]
         final_explanation=result["final_explanation"]
@@ -52,6 +118,128 @@ def validate_startup(idea: StartupIdeaRequest):
             "verdict":final_decision["verdict"],
             "confidence_level":final_decision["confidence_level"],
             "explanation":final_explanation,
+            "run_id":result["run_id"],
+            "debate_skipped":final_decision["debate_skipped"],
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/revalidate",response_model=RevalidationResponse)
+async def revalidate_startup(request: RevalidationRequest):
+    """
+    Applies a field diff to a previous run and reruns only the stages it reaches.
+    """
+    try:
+        result=await revalidate_async(request.run_id, request.changes)
+    except UnknownRunError:
+        raise HTTPException(status_code=404, detail=f"Unknown run: {request.run_id}")
+    except InvalidChangesError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    final_decision=result["final_decision"]
+    return {
+        "final_score":final_decision["final_score"],
+        "verdict":final_decision["verdict"],
+        "confidence_level":final_decision["confidence_level"],
+        "explanation":result["final_explanation"],
+        "run_id":result["run_id"],
+        "debate_skipped":final_decision["debate_skipped"],
+        "parent_run_id":result["parent_run_id"],
+        "recomputed_stages":result["recomputed_stages"],
+    }
+
+
+@app.post("/jobs", status_code=202)
+def submit_job(request: JobRequest):
+    idea=request.dict(exclude={"webhook_url"})
+    try:
+        job_id=get_job_manager().submit(idea, webhook_url=str(request.webhook_url) if request.webhook_url else None)
+    except QueueFullError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job=get_job_manager().store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_view(job)
+
+
+# stages that only reshape other outputs are not worth an event
+SILENT_STAGES = {"analysis_bundle"}
+
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/validate/stream")
+async def validate_startup_stream(idea: Annotated[StartupIdeaRequest, Query()]):
+    """
+    Server-Sent Events: one `stage` event per completed stage (with its
+    result and timing), then a `result` event, or `error` if the run fails.
+    """
+    startup=StartupIdea(**idea.dict())
+    events: asyncio.Queue = asyncio.Queue()
+    started=time.perf_counter()
+
+    def on_stage_complete(stage: str, output, seconds: float) -> None:
+        if stage in SILENT_STAGES:
+            return
+        data={
+            "stage": stage,
+            "seconds": round(seconds, 4),
+            "elapsed": round(time.perf_counter() - started, 4),
+            "result": serialize_stage_output(output),
+        }
+        if stage == "base_score":
+            # verdict before the debate adjusts it
+            data["provisional_verdict"]=verdict_from_score(output)
+        events.put_nowait(sse_event("stage", data))
+
+    async def run():
+        try:
+            result=await run_full_validation_async(
+                startup, on_stage_complete=on_stage_complete, save_run=True
+            )
+            final_decision=result["final_decision"]
+            events.put_nowait(sse_event("result", {
+                "final_score":final_decision["final_score"],
+                "verdict":final_decision["verdict"],
+                "confidence_level":final_decision["confidence_level"],
+                "explanation":result["final_explanation"],
+                "run_id":result["run_id"],
+                "debate_skipped":final_decision["debate_skipped"],
+                "elapsed": round(time.perf_counter() - started, 4),
+            }))
+        except Exception as e:
+            events.put_nowait(sse_event("error", {"detail": str(e)}))
+        finally:
+            events.put_nowait(None)
+
+    async def stream():
+        task=asyncio.create_task(run())
+        try:
+            while True:
+                event=await events.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            # client went away: stop paying for the remaining stages
+            task.cancel()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,64 @@
+"""
+Per-validation agent setup cost: building the eight crewai Agents from
+scratch vs leasing them from a warm AgentPool. No LLM calls are made.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_agent_pool --iterations 50
+"""
+import argparse
+import os
+import time
+
+from ai_startup_idea_validator.benchmarks.fake_llm import latency_summary
+
+
+def bench_build(builders, llm_model: str, iterations: int):
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for builder in builders:
+            builder(llm_model)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_pool(builders, llm_model: str, iterations: int):
+    from ai_startup_idea_validator.agents.agent_pool import AgentPool
+
+    pool = AgentPool()
+    pool.warm(builders, llm_model)
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for builder in builders:
+            with pool.lease(builder, llm_model):
+                pass
+        latencies.append(time.perf_counter() - start)
+    return latencies, pool.snapshot()
+
+
+def report(label: str, latencies) -> None:
+    pct = latency_summary(latencies)
+    print(
+        f"{label:<6} per validation: p50={pct['p50'] * 1000:8.2f}ms "
+        f"p95={pct['p95'] * 1000:8.2f}ms p99={pct['p99'] * 1000:8.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--llm-model", default="gpt-4o-mini")
+    args = parser.parse_args()
+
+    # agents build an LLM client but never call it here
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    from ai_startup_idea_validator.pipeline.run_full_validation import AGENT_BUILDERS
+
+    report("build", bench_build(AGENT_BUILDERS, args.llm_model, args.iterations))
+    latencies, stats = bench_pool(AGENT_BUILDERS, args.llm_model, args.iterations)
+    report("pool", latencies)
+    print(f"pool stats: {stats}")
+
+
+if __name__ == "__main__":
+    main()
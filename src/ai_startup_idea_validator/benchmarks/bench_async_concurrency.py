@@ -0,0 +1,86 @@
+"""
+Sync vs async pipeline under concurrent load, with LLM calls replaced by
+fixed-latency fakes so only the serving model is measured.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_async_concurrency --requests 200 --latency 0.2
+
+The sync path is capped by the request thread pool (Starlette's default is 40);
+the async path keeps every validation in flight on one event loop.
+"""
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_startup_idea_validator.benchmarks.fake_llm import fake_agent_llm, latency_summary
+from ai_startup_idea_validator.models.startup_idea import StartupIdea
+
+
+def make_startup(i: int) -> StartupIdea:
+    return StartupIdea(
+        problem=f"Small retail businesses manually reconcile inventory across channels, which is time consuming ({i})",
+        solution="A SaaS platform that synchronizes inventory and sales data in real time",
+        geography="India",
+        target_user="Small retail business owners",
+        industry="saas",
+        monetization_model="Monthly subscription",
+    )
+
+
+def bench_sync(n_requests: int, threads: int):
+    from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation
+
+    def one(i):
+        start = time.perf_counter()
+        run_full_validation(make_startup(i))
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(one, range(n_requests)))
+    return time.perf_counter() - start, latencies
+
+
+async def bench_async(n_requests: int):
+    from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation_async
+
+    async def one(i):
+        start = time.perf_counter()
+        await run_full_validation_async(make_startup(i))
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return time.perf_counter() - start, latencies
+
+
+def report(label: str, n_requests: int, wall: float, latencies) -> None:
+    pct = latency_summary(latencies)
+    print(
+        f"{label:<6} wall={wall:7.2f}s  throughput={n_requests / wall:7.2f} validations/s  "
+        f"p50={pct['p50']:.2f}s p95={pct['p95']:.2f}s p99={pct['p99']:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated seconds per LLM call")
+    parser.add_argument("--threads", type=int, default=40, help="request thread pool for the sync path")
+    args = parser.parse_args()
+
+    # offline and uncached: every validation pays the full simulated latency
+    os.environ.setdefault("SEMANTIC_MATCHER_BACKEND", "local")
+    os.environ["LLM_CACHE_ENABLED"] = "0"
+
+    with fake_agent_llm(latency_s=args.latency):
+        wall, latencies = bench_sync(args.requests, args.threads)
+        report("sync", args.requests, wall, latencies)
+
+        wall, latencies = asyncio.run(bench_async(args.requests))
+        report("async", args.requests, wall, latencies)
+
+
+if __name__ == "__main__":
+    main()
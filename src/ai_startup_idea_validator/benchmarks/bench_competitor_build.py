@@ -0,0 +1,132 @@
+"""
+Catalogue refresh time against a local HTTP fixture server: a cold build,
+a warm rebuild where every page answers 304, and a rebuild after one page
+changes.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_competitor_build --pages 40 --latency-ms 150
+"""
+import argparse
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+CATEGORIES = ("fintech", "healthtech", "enterprise_software", "ecommerce")
+SUFFIXES = ("", " Inc.", ", Ltd", " Corporation")
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "vo", "zi", "pe", "qu", "sa", "do")
+
+
+class FixturePages:
+    """
+    Synthetic list pages; names overlap across pages with different
+    corporate suffixes, so deduplication has work to do.
+    """
+
+    def __init__(self, pages: int, names_per_page: int):
+        self.names_per_page = names_per_page
+        self.revisions = [0] * pages
+        self.modified = [time.time()] * pages
+
+    @staticmethod
+    def name(n: int) -> str:
+        syllables = []
+        for _ in range(3):
+            n, digit = divmod(n, len(SYLLABLES))
+            syllables.append(SYLLABLES[digit])
+        return "".join(syllables).capitalize() + " Labs"
+
+    def body(self, page: int) -> bytes:
+        # consecutive pages share half their names
+        items = "".join(
+            f'<li><a href="/wiki/x">{self.name(page * self.names_per_page // 2 + i)}'
+            f"{SUFFIXES[(page + i) % len(SUFFIXES)]}</a></li>"
+            for i in range(self.names_per_page)
+        )
+        return f'<html><body><div class="mw-parser-output"><ul>{items}</ul><p>rev {self.revisions[page]}</p></div></body></html>'.encode()
+
+    def touch(self, page: int) -> None:
+        self.revisions[page] += 1
+        self.modified[page] = time.time()
+
+
+def serve(fixture: FixturePages, latency_s: float):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_s)
+            page = int(self.path.rsplit("/", 1)[-1])
+            body = fixture.body(page)
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(fixture.modified[page], usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--names-per-page", type=int, default=80)
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="server-side delay per request")
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--parse-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from ai_startup_idea_validator.scripts.build_known_competitors import build_known_competitors
+    from ai_startup_idea_validator.tools.reference_data import KNOWN_COMPETITORS_FILE, PACKAGE_DATA_DIR
+
+    fixture = FixturePages(args.pages, args.names_per_page)
+    server = serve(fixture, args.latency_ms / 1000)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    pages = {
+        category: [f"{base}/list/{page}" for page in range(args.pages) if page % len(CATEGORIES) == c]
+        for c, category in enumerate(CATEGORIES)
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [
+            ("sequential cold", 1, 0, False),
+            ("cold", args.fetch_workers, args.parse_workers, False),
+            ("warm (all 304)", args.fetch_workers, args.parse_workers, False),
+            ("one page changed", args.fetch_workers, args.parse_workers, True),
+        ]
+        for label, fetch_workers, parse_workers, touch in runs:
+            if label.endswith("cold"):
+                shutil.rmtree(Path(tmp) / "http", ignore_errors=True)
+                shutil.copy(PACKAGE_DATA_DIR / KNOWN_COMPETITORS_FILE, Path(tmp) / KNOWN_COMPETITORS_FILE)
+            if touch:
+                fixture.touch(0)
+            report = build_known_competitors(
+                Path(tmp) / KNOWN_COMPETITORS_FILE,
+                pages=pages,
+                cache_dir=Path(tmp) / "http",
+                fetch_workers=fetch_workers,
+                parse_workers=parse_workers,
+            )
+            print(
+                f"{label:>17}: {report.seconds:6.2f}s  statuses={report.statuses}  parsed={report.parsed}  "
+                f"scraped={report.scraped_names}  added={report.added}  total={report.total}"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
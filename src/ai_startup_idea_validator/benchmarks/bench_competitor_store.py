@@ -0,0 +1,87 @@
+"""
+Start-up and per-industry signal cost of the compiled competitor store
+against building columns from JSON records, on a synthetic catalogue.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_competitor_store --competitors 10000,1000000
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from ai_startup_idea_validator.benchmarks.fake_llm import latency_summary
+
+LEVELS = ("low", "medium", "high", "extreme")
+STYLES = ("fragmented", "oligopoly", "winner_takes_most", "winner_takes_all")
+
+
+def synthetic_catalogue(size: int, categories: int = 200, seed: int = 0):
+    rng = random.Random(seed)
+    moats = [f"moat_{i}" for i in range(40)]
+    barriers = [f"barrier_{i}" for i in range(40)]
+    return [
+        {
+            "name": f"competitor {i}",
+            "primary_category": f"category_{rng.randrange(categories)}",
+            "secondary_categories": [f"category_{rng.randrange(categories)}" for _ in range(rng.randrange(3))],
+            "dominance_level": rng.choice(LEVELS),
+            "competition_style": rng.choice(STYLES),
+            "moat_sources": rng.sample(moats, rng.randrange(4)),
+            "entry_barriers": rng.sample(barriers, rng.randrange(4)),
+        }
+        for i in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--competitors", default="10000,1000000", help="comma-separated catalogue sizes")
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    from ai_startup_idea_validator.tools.competition_signal_builder import _signals_for
+    from ai_startup_idea_validator.tools.competitor_store import CompetitorStore, write_competitor_store
+    from ai_startup_idea_validator.tools.reference_data import load_reference_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.competitors.split(",")):
+            records = synthetic_catalogue(size)
+            json_path = Path(tmp) / "known_competitors.json"
+            cols_path = Path(tmp) / "known_competitors.cols"
+            json_path.write_text(json.dumps(records), encoding="utf-8")
+            write_competitor_store(records, cols_path)
+            del records
+
+            start = time.perf_counter()
+            with open(json_path, "r", encoding="utf-8") as f:
+                from_json = CompetitorStore.from_records(json.load(f))
+            json_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            mapped = CompetitorStore.open(cols_path)
+            open_s = time.perf_counter() - start
+
+            # what each process pays for its reference-data snapshot
+            start = time.perf_counter()
+            load_reference_data(Path(tmp))
+            reference_s = time.perf_counter() - start
+
+            print(
+                f"competitors={size:>9,}  json load+build={json_s * 1000:9.1f}ms  "
+                f"mmap open={open_s * 1000:7.3f}ms  reference load={reference_s * 1000:7.3f}ms  "
+                f"file={cols_path.stat().st_size / 1e6:7.1f}MB"
+            )
+            for label, store in (("built", from_json), ("mapped", mapped)):
+                latencies = []
+                for i in range(args.queries):
+                    start = time.perf_counter()
+                    _signals_for(store, f"category_{i % 200}")
+                    latencies.append(time.perf_counter() - start)
+                pct = latency_summary(latencies)
+                print(f"  {label:>6} signals  p50={pct['p50'] * 1000:7.3f}ms  p95={pct['p95'] * 1000:7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
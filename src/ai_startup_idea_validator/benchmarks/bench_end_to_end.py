@@ -0,0 +1,147 @@
+"""
+End-to-end throughput against the offline OpenAI stub: real crewai agents,
+real OpenAI clients and HTTP, no spend. Drives `run_full_validation`
+directly and `POST /validate` on a live uvicorn server at several
+concurrency levels.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_end_to_end \\
+        --concurrency 1,4,16 --requests 32 --latency-distribution lognormal --latency-mean 0.5
+
+Point --stub-url at an already running openai_stub to benchmark against it
+instead of an in-process one.
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Callable, List, Tuple
+
+from ai_startup_idea_validator.benchmarks.bench_async_concurrency import make_startup
+from ai_startup_idea_validator.benchmarks.fake_llm import latency_summary
+from ai_startup_idea_validator.benchmarks.openai_stub import (
+    LATENCY_DISTRIBUTIONS,
+    StubConfig,
+    create_stub_app,
+    serve_in_background,
+)
+
+TARGETS = ("pipeline", "api")
+
+
+def drive(call: Callable[[int], None], n_requests: int, concurrency: int) -> Tuple[float, List[float], int]:
+    """
+    Runs `call(i)` for i in range(n_requests) on `concurrency` threads.
+    Returns (wall seconds, latencies of successful calls, error count).
+    """
+    def one(i):
+        start = time.perf_counter()
+        try:
+            call(i)
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one, range(n_requests)))
+    latencies = [seconds for seconds in outcomes if seconds is not None]
+    return time.perf_counter() - start, latencies, len(outcomes) - len(latencies)
+
+
+def pipeline_call(i: int) -> None:
+    from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation
+
+    run_full_validation(make_startup(i))
+
+
+def api_call_factory(client) -> Callable[[int], None]:
+    def call(i: int) -> None:
+        response = client.post("/validate", json=make_startup(i).model_dump())
+        response.raise_for_status()
+
+    return call
+
+
+def wait_until_ready(client, timeout: float = 120.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if client.get("/ready").status_code == 200:
+            return
+        time.sleep(0.2)
+    raise RuntimeError(f"API not ready: {client.get('/ready').json()}")
+
+
+def report(target: str, concurrency: int, n_requests: int, wall: float, latencies: List[float], errors: int) -> None:
+    pct = latency_summary(latencies)
+    print(
+        f"{target:<9} {concurrency:>5} {n_requests:>6} {errors:>6} "
+        f"{pct['p50']:>8.2f} {pct['p95']:>8.2f} {pct['p99']:>8.2f} {len(latencies) / wall:>10.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=32, help="validations per level")
+    parser.add_argument("--targets", default=",".join(TARGETS))
+    parser.add_argument("--stub-url", help="base URL of a running stub (default: start one in-process)")
+    parser.add_argument("--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-mean", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="share of non-JSON answers (exercises stage retries)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    targets = [target for target in args.targets.split(",") if target]
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets {sorted(unknown)}; choose from {TARGETS}")
+
+    with ExitStack() as stack:
+        stub_url = args.stub_url
+        if stub_url is None:
+            config = StubConfig(
+                latency_distribution=args.latency_distribution,
+                latency_mean=args.latency_mean,
+                failure_rate=args.failure_rate,
+                malformed_rate=args.malformed_rate,
+                seed=args.seed,
+            )
+            stub_url = stack.enter_context(serve_in_background(create_stub_app(config)))
+
+        # every LLM call goes to the stub, uncached, and nothing is written to ~/.cache
+        scratch = stack.enter_context(tempfile.TemporaryDirectory())
+        os.environ["OPENAI_BASE_URL"] = stub_url.rstrip("/") + ("" if stub_url.rstrip("/").endswith("/v1") else "/v1")
+        os.environ["OPENAI_API_KEY"] = "stub"
+        os.environ["LLM_CACHE_ENABLED"] = "0"
+        os.environ.setdefault("SEMANTIC_MATCHER_BACKEND", "openai")
+        os.environ["RUN_STORE_PATH"] = os.path.join(scratch, "runs.sqlite3")
+        os.environ["JOBS_DB_PATH"] = os.path.join(scratch, "jobs.sqlite3")
+
+        print(f"stub: {os.environ['OPENAI_BASE_URL']}  latency: {args.latency_distribution} mean={args.latency_mean}s")
+        print(f"{'target':<9} {'conc':>5} {'reqs':>6} {'errors':>6} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'valid/s':>10}")
+
+        for target in targets:
+            if target == "pipeline":
+                call = pipeline_call
+            else:
+                import httpx
+                from ai_startup_idea_validator.api.main import app
+
+                api_url = stack.enter_context(serve_in_background(app))
+                client = stack.enter_context(httpx.Client(base_url=api_url, timeout=600))
+                wait_until_ready(client)
+                call = api_call_factory(client)
+
+            # first validation pays imports and agent construction; keep it out of the numbers
+            call(-1)
+            for concurrency in levels:
+                wall, latencies, errors = drive(call, args.requests, concurrency)
+                report(target, concurrency, args.requests, wall, latencies, errors)
+
+
+if __name__ == "__main__":
+    main()
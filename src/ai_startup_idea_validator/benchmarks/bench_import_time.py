@@ -0,0 +1,78 @@
+"""
+Cold import cost of the serving entry point, measured with `python -X importtime`
+in a fresh interpreter, checked against a budget.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_import_time --budget-ms 800
+
+Exits non-zero if the import exceeds the budget or pulls in a module that
+should only load on first use (crewai, openai, numpy).
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULE = "ai_startup_idea_validator.api.main"
+DEFAULT_BUDGET_MS = 800.0
+DEFERRED_MODULES = ("crewai", "openai", "numpy")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[List[Tuple[str, int, int]], List[str]]:
+    """
+    Returns ([(module, self_us, cumulative_us)], sorted loaded top-level packages).
+    """
+    code = f"import sys, json, {module}; print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            timings.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return timings, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="best of N fresh interpreters")
+    parser.add_argument("--top", type=int, default=15, help="heaviest imports to list")
+    args = parser.parse_args()
+
+    best_ms = None
+    best_timings: List[Tuple[str, int, int]] = []
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        timings, loaded = measure(args.module)
+        total_ms = next(cum for name, _, cum in timings if name == args.module) / 1000
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_timings = total_ms, timings
+
+    by_package: Dict[str, int] = {}
+    for name, self_us, _ in best_timings:
+        root = name.split(".")[0]
+        by_package[root] = by_package.get(root, 0) + self_us
+
+    print(f"import {args.module}: {best_ms:.1f}ms (best of {args.runs}, budget {args.budget_ms:.0f}ms)")
+    for root, self_us in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {root:<32} {self_us / 1000:8.1f}ms")
+
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    if eager:
+        print(f"FAIL: imported at startup instead of on first use: {', '.join(eager)}")
+    if best_ms > args.budget_ms:
+        print(f"FAIL: over budget by {best_ms - args.budget_ms:.1f}ms")
+    return 1 if eager or best_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
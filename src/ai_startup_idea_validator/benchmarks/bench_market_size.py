@@ -0,0 +1,48 @@
+"""
+Per-idea cost of market_size_tool with and without the Monte Carlo bands.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_market_size --samples 0,20000,100000
+"""
+import argparse
+import time
+
+from ai_startup_idea_validator.benchmarks.fake_llm import latency_summary
+
+GEOGRAPHIES = ("india", "usa", "europe", "global", "brazil")
+INDUSTRIES = ("saas", "fintech", "healthtech", "edtech", None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", default="0,20000,100000", help="comma-separated draw counts")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    from ai_startup_idea_validator.tools.market_size_tool import market_size_tool
+
+    # numpy import and reference data load are one-off costs
+    market_size_tool("india", "saas", "smb", samples=1)
+
+    for samples in (int(s) for s in args.samples.split(",")):
+        latencies = []
+        for i in range(args.iterations):
+            start = time.perf_counter()
+            result = market_size_tool(
+                GEOGRAPHIES[i % len(GEOGRAPHIES)],
+                INDUSTRIES[i % len(INDUSTRIES)],
+                "smb",
+                avg_annual_price_usd=50.0 + i,
+                samples=samples,
+            )
+            latencies.append(time.perf_counter() - start)
+        pct = latency_summary(latencies)
+        print(
+            f"samples={samples:>7}  p50={pct['p50'] * 1000:7.3f}ms  p95={pct['p95'] * 1000:7.3f}ms  "
+            f"p99={pct['p99'] * 1000:7.3f}ms"
+        )
+        if result.bands is not None:
+            print(f"  last SOM band: {result.bands.som_usd}")
+
+
+if __name__ == "__main__":
+    main()
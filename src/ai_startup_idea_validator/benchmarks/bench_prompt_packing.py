@@ -0,0 +1,41 @@
+"""
+Input tokens of the payload-heavy prompts (debate, judge, explanation)
+before and after prompt packing, over a few offline validations.
+
+    python -m ai_startup_idea_validator.benchmarks.bench_prompt_packing --runs 5
+
+Token counts are exact when tiktoken is installed, estimated otherwise.
+"""
+import argparse
+import os
+
+from ai_startup_idea_validator.benchmarks.bench_async_concurrency import make_startup
+from ai_startup_idea_validator.benchmarks.fake_llm import fake_agent_llm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SEMANTIC_MATCHER_BACKEND", "local")
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    os.environ["LLM_CACHE_ENABLED"] = "0"
+
+    from ai_startup_idea_validator.agents.prompt_packing import packing_snapshot
+    from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation
+
+    with fake_agent_llm(latency_s=0.0):
+        for i in range(args.runs):
+            run_full_validation(make_startup(i))
+
+    print(f"{'stage':<20} {'calls':>5} {'before':>8} {'after':>8} {'saved':>7} {'truncated':>9}")
+    for stage, stats in sorted(packing_snapshot().items()):
+        print(
+            f"{stage:<20} {stats['calls']:>5} {stats['tokens_before']:>8} {stats['tokens_after']:>8} "
+            f"{stats['saved_pct']:>6.1f}% {stats['truncated_fields']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
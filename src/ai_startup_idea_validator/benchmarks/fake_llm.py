@@ -0,0 +1,106 @@
+import asyncio
+import json
+import re
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+# ---- canned, schema-valid completions ----
+
+def fake_completion(prompt: str) -> str:
+    """
+    Returns a JSON answer that satisfies whichever agent or matcher
+    schema the prompt asks for.
+    """
+    if '"similarity_score"' in prompt:
+        return json.dumps({"similarity_score": 0.5})
+
+    if "Concept buckets:" in prompt:
+        buckets = re.findall(r'^\s*"(\w+)": number between 0 and 1', prompt, flags=re.MULTILINE)
+        return json.dumps({name: 0.5 for name in buckets})
+
+    if '"confidence_shift"' in prompt:
+        return json.dumps({
+            "debate_winner": "tie",
+            "confidence_shift": -0.05,
+            "unresolved_risks": ["Customer acquisition cost is unproven"],
+            "overlooked_strengths": ["Clear operational pain"],
+            "argument_quality": "medium",
+            "judge_rationale": "Both sides stayed within the analysis.",
+        })
+
+    if '"failure_modes"' in prompt:
+        return json.dumps({
+            "position": "against",
+            "core_thesis": "Incumbents can copy the feature set.",
+            "failure_modes": ["Slow sales cycles", "Price pressure", "Churn"],
+            "critical_assumptions_attacked": ["Willingness to pay"],
+        })
+
+    if '"supporting_arguments"' in prompt:
+        return json.dumps({
+            "position": "for",
+            "core_thesis": "The pain is frequent and costly.",
+            "supporting_arguments": ["Large market", "Simple product", "Clear ROI"],
+            "acknowledged_risks": ["Competition"],
+        })
+
+    if '"recommended_next_steps"' in prompt:
+        return json.dumps({
+            "verdict": "HIGH RISK/ ITERATE",
+            "final_score": 55.0,
+            "summary": "The idea addresses a real problem but faces entrenched competition.",
+            "key_reasons_for_score": ["Real demand", "Crowded market"],
+            "key_risks": ["Distribution"],
+            "recommended_next_steps": ["Interview 20 target users"],
+            "confidence_level": "medium",
+        })
+
+    return json.dumps({
+        "score": 6,
+        "strengths": ["Clear problem", "Reachable customers"],
+        "concerns": ["Unproven pricing", "Competition"],
+        "rationale": "Evidence is moderate and consistent.",
+    })
+
+
+# ---- patching crewai agents ----
+
+@contextmanager
+def fake_agent_llm(latency_s: float = 0.0):
+    """
+    Replaces crewai Agent.execute_task / aexecute_task with canned answers
+    after `latency_s` of simulated network time (blocking vs awaited sleep).
+    """
+    from crewai import Agent
+
+    original_sync = Agent.execute_task
+    original_async = Agent.aexecute_task
+
+    def execute_task(self, task, context=None, tools=None):
+        time.sleep(latency_s)
+        return fake_completion(task.prompt())
+
+    async def aexecute_task(self, task, context=None, tools=None):
+        await asyncio.sleep(latency_s)
+        return fake_completion(task.prompt())
+
+    Agent.execute_task = execute_task
+    Agent.aexecute_task = aexecute_task
+    try:
+        yield
+    finally:
+        Agent.execute_task = original_sync
+        Agent.aexecute_task = original_async
+
+
+def latency_summary(latencies) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+    return {"p50": pct(50), "p95": pct(95), "p99": pct(99)}
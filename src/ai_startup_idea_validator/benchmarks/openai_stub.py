@@ -0,0 +1,190 @@
+"""
+Offline OpenAI-compatible chat-completions server. Answers every agent and
+semantic-matcher prompt with schema-valid JSON (see fake_llm.fake_completion),
+after a configurable latency, and fails a configurable share of requests.
+
+    python -m ai_startup_idea_validator.benchmarks.openai_stub --port 8811 \\
+        --latency-distribution lognormal --latency-mean 0.8 --failure-rate 0.02
+
+    OPENAI_BASE_URL=http://127.0.0.1:8811/v1 OPENAI_API_KEY=stub <anything that calls OpenAI>
+"""
+import argparse
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from ai_startup_idea_validator.benchmarks.fake_llm import fake_completion
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class StubConfig:
+    latency_distribution: str = "fixed"
+    # mean seconds per completion; uniform spans [0, 2 * mean]
+    latency_mean: float = 0.0
+    # lognormal shape (sigma of the underlying normal)
+    latency_sigma: float = 0.5
+    # share of requests answered with `failure_status`
+    failure_rate: float = 0.0
+    failure_status: int = 500
+    # share of requests answered 200 with content that is not JSON
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class StubBehaviour:
+    def __init__(self, config: StubConfig):
+        if config.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency_distribution must be one of {LATENCY_DISTRIBUTIONS}")
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def latency(self) -> float:
+        c = self.config
+        with self._lock:
+            if c.latency_mean <= 0 or c.latency_distribution == "fixed":
+                return max(0.0, c.latency_mean)
+            if c.latency_distribution == "uniform":
+                return self._random.uniform(0, 2 * c.latency_mean)
+            if c.latency_distribution == "exponential":
+                return self._random.expovariate(1 / c.latency_mean)
+            # lognormal with the requested mean
+            mu = math.log(c.latency_mean) - c.latency_sigma ** 2 / 2
+            return self._random.lognormvariate(mu, c.latency_sigma)
+
+    def outcome(self) -> str:
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+            if roll < self.config.failure_rate:
+                self.failures += 1
+                return "fail"
+            if roll < self.config.failure_rate + self.config.malformed_rate:
+                return "malformed"
+        return "ok"
+
+
+def _prompt_text(messages) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(content or "")
+    return "\n".join(parts)
+
+
+def create_stub_app(config: Optional[StubConfig] = None):
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
+    from ai_startup_idea_validator.agents.prompt_packing import estimate_tokens
+
+    behaviour = StubBehaviour(config or StubConfig())
+    app = FastAPI(title="OpenAI stub")
+    app.state.behaviour = behaviour
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = _prompt_text(body.get("messages", []))
+        await asyncio.sleep(behaviour.latency())
+
+        outcome = behaviour.outcome()
+        if outcome == "fail":
+            return JSONResponse(
+                status_code=behaviour.config.failure_status,
+                content={"error": {"message": "stub failure", "type": "server_error"}},
+            )
+
+        content = "Sure! Here is my analysis." if outcome == "malformed" else fake_completion(prompt)
+        if "Final Answer:" in prompt:
+            # crewai agents are prompted for the ReAct format
+            content = f"Thought: I now know the final answer\nFinal Answer: {content}"
+
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(content)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.get("/v1/models")
+    def models():
+        return {"object": "list", "data": [{"id": "gpt-4o-mini", "object": "model", "owned_by": "stub"}]}
+
+    return app
+
+
+@contextmanager
+def serve_in_background(app, host: str = "127.0.0.1", port: int = 0):
+    """
+    Runs an ASGI app with uvicorn on a daemon thread; yields its base URL.
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning", access_log=False))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("server failed to start")
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{bound_port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8811)
+    parser.add_argument("--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-mean", type=float, default=0.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=500)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = StubConfig(
+        latency_distribution=args.latency_distribution,
+        latency_mean=args.latency_mean,
+        latency_sigma=args.latency_sigma,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
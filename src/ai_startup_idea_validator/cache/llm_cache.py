@@ -0,0 +1,342 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ai_startup_idea_validator.monitoring.metrics import record_llm_call, timed_llm_call
+
+
+# ---- configuration (env) ----
+
+LLM_CACHE_ENABLED_ENV = "LLM_CACHE_ENABLED"
+LLM_CACHE_PATH_ENV = "LLM_CACHE_PATH"
+LLM_CACHE_TTL_ENV = "LLM_CACHE_TTL_SECONDS"
+LLM_CACHE_MEMORY_ENTRIES_ENV = "LLM_CACHE_MAX_MEMORY_ENTRIES"
+LLM_CACHE_DISK_ENTRIES_ENV = "LLM_CACHE_MAX_DISK_ENTRIES"
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "ai_startup_idea_validator" / "llm_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_MEMORY_ENTRIES = 1024
+DEFAULT_MAX_DISK_ENTRIES = 100_000
+
+# expired / over-cap rows are purged every N disk writes rather than on each one
+PURGE_EVERY_N_WRITES = 100
+
+
+def make_cache_key(model: str, temperature: Optional[float], prompt: str) -> str:
+    payload = json.dumps([model, temperature, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class LLMCache:
+    """
+    Two-tier completion cache: an in-process LRU in front of a SQLite file.
+    Entries expire after `ttl_seconds`; both tiers are capped by entry count.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes_since_purge = 0
+
+    # ---- sqlite tier ----
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache(last_access)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _purge_disk(self, db: sqlite3.Connection, now: float) -> None:
+        cur = db.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        evicted = cur.rowcount
+        cur = db.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            " SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+        evicted += cur.rowcount
+        db.commit()
+        self.stats.evictions += max(evicted, 0)
+
+    # ---- memory tier ----
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    # ---- public api ----
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+            db = self._db()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if now - created_at <= self.ttl_seconds:
+                        db.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+                        db.commit()
+                        self._remember(key, created_at, value)
+                        self.stats.disk_hits += 1
+                        return value
+                    db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    db.commit()
+                    self.stats.evictions += 1
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            self.stats.writes += 1
+
+            db = self._db()
+            if db is None:
+                return
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            db.commit()
+
+            self._writes_since_purge += 1
+            if self._writes_since_purge >= PURGE_EVERY_N_WRITES:
+                self._writes_since_purge = 0
+                self._purge_disk(db, now)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+            db = self._db()
+            if db is not None:
+                db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            db = self._db()
+            if db is not None:
+                db.execute("DELETE FROM llm_cache")
+                db.commit()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            data = asdict(self.stats)
+            data["hit_rate"] = round(self.stats.hit_rate, 4)
+            data["memory_entries"] = len(self._memory)
+            return data
+
+
+# ---- process-wide cache ----
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.getenv(LLM_CACHE_ENABLED_ENV, "1").lower() not in {"0", "false", "no", "off"}
+
+
+def get_llm_cache() -> LLMCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.getenv(LLM_CACHE_PATH_ENV)
+                _cache = LLMCache(
+                    # LLM_CACHE_PATH="" keeps the cache in memory only
+                    path=DEFAULT_CACHE_PATH if path is None else (Path(path) if path else None),
+                    ttl_seconds=float(os.getenv(LLM_CACHE_TTL_ENV, DEFAULT_TTL_SECONDS)),
+                    max_memory_entries=int(os.getenv(LLM_CACHE_MEMORY_ENTRIES_ENV, DEFAULT_MAX_MEMORY_ENTRIES)),
+                    max_disk_entries=int(os.getenv(LLM_CACHE_DISK_ENTRIES_ENV, DEFAULT_MAX_DISK_ENTRIES)),
+                )
+    return _cache
+
+
+def cached_completion(
+    model: str,
+    temperature: Optional[float],
+    prompt: str,
+    compute: Callable[[], str],
+) -> str:
+    """
+    Returns the cached completion for (model, temperature, prompt), calling
+    `compute` and storing its result on a miss.
+    """
+    if not cache_enabled():
+        with timed_llm_call(model, prompt) as call:
+            call["completion"] = compute()
+        return call["completion"]
+
+    cache = get_llm_cache()
+    key = make_cache_key(model, temperature, prompt)
+
+    value = cache.get(key)
+    if value is not None:
+        record_llm_call(model, prompt, value, None, cached=True)
+        return value
+
+    with timed_llm_call(model, prompt) as call:
+        value = call["completion"] = compute()
+    if isinstance(value, str):
+        cache.set(key, value)
+    return value
+
+
+async def acached_completion(
+    model: str,
+    temperature: Optional[float],
+    prompt: str,
+    compute: Callable[[], Awaitable[str]],
+) -> str:
+    """
+    Async variant of `cached_completion`; the SQLite tier is consulted off the event loop.
+    """
+    if not cache_enabled():
+        with timed_llm_call(model, prompt) as call:
+            call["completion"] = await compute()
+        return call["completion"]
+
+    cache = get_llm_cache()
+    key = make_cache_key(model, temperature, prompt)
+
+    value = await asyncio.to_thread(cache.get, key)
+    if value is not None:
+        record_llm_call(model, prompt, value, None, cached=True)
+        return value
+
+    with timed_llm_call(model, prompt) as call:
+        value = call["completion"] = await compute()
+    if isinstance(value, str):
+        await asyncio.to_thread(cache.set, key, value)
+    return value
+
+
+def invalidate_completion(model: str, temperature: Optional[float], prompt: str) -> None:
+    """
+    Drops the cached completion for (model, temperature, prompt), e.g. once it failed to parse.
+    """
+    if not cache_enabled():
+        return
+    get_llm_cache().invalidate(make_cache_key(model, temperature, prompt))
+
+
+def render_agent_prompt(agent, task) -> str:
+    """
+    Everything that shapes an agent's completion: its persona plus the task prompt.
+    """
+    return "\n\n".join([
+        f"role: {agent.role}",
+        f"goal: {agent.goal}",
+        f"backstory: {agent.backstory}",
+        task.prompt(),
+    ])
+
+
+def agent_model(agent) -> Tuple[str, Optional[float]]:
+    llm = agent.llm
+    if isinstance(llm, str):
+        return llm, None
+    return str(getattr(llm, "model", llm)), getattr(llm, "temperature", None)
+
+
+def invalidate_task(agent, task) -> None:
+    """
+    Drops the cached completion for (agent, task), e.g. once it failed validation.
+    """
+    if not cache_enabled():
+        return
+    model, temperature = agent_model(agent)
+    get_llm_cache().invalidate(make_cache_key(model, temperature, render_agent_prompt(agent, task)))
+
+
+def cached_execute_task(agent, task) -> str:
+    """
+    Cache-aware replacement for `agent.execute_task(task)`.
+    """
+    model, temperature = agent_model(agent)
+    return cached_completion(
+        model,
+        temperature,
+        render_agent_prompt(agent, task),
+        lambda: agent.execute_task(task),
+    )
+
+
+async def acached_execute_task(agent, task) -> str:
+    """
+    Cache-aware replacement for `await agent.aexecute_task(task)`.
+    """
+    model, temperature = agent_model(agent)
+    return await acached_completion(
+        model,
+        temperature,
+        render_agent_prompt(agent, task),
+        lambda: agent.aexecute_task(task),
+    )
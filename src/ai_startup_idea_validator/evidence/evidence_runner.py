@@ -1,18 +1,35 @@
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
-from ai_startup_idea_validator.tools.market_size_tool import market_size_tool, MarketSizeResult
+from ai_startup_idea_validator.tools.market_size_tool import (
+    DEFAULT_AVG_ANNUAL_PRICE_USD,
+    market_size_tool,
+    MarketSizeResult,
+)
 from ai_startup_idea_validator.tools.competitor_discovery_tool import (
     competitor_discovery_tool,
     CompetitorDiscoveryResult
 )
-from ai_startup_idea_validator.tools.demand_signal_tool import demand_signal_tool, DemandSignalResult
+from ai_startup_idea_validator.tools.demand_signal_tool import (
+    demand_signal_tool,
+    demand_signal_tool_async,
+    DemandSignalResult,
+)
 from ai_startup_idea_validator.tools.cost_model_tool import cost_model_tool, CostModelResult
-from ai_startup_idea_validator.tools.semantic_matcher import semantic_matcher
-
-
+from ai_startup_idea_validator.tools.reference_data import get_reference_data
+from ai_startup_idea_validator.tools.semantic_matcher import get_semantic_matcher
 
 
+# per-tool wall-clock limits (seconds); only the demand tool touches the network
+DEFAULT_TOOL_TIMEOUTS = {
+    "market_size": 5.0,
+    "competitors": 5.0,
+    "demand": 60.0,
+    "cost_model": 5.0,
+}
 
 
 @dataclass
@@ -21,6 +38,50 @@ class EvidenceBundle:
     competitors: CompetitorDiscoveryResult
     demand: DemandSignalResult
     cost_model: CostModelResult
+    # seconds spent in each tool
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class EvidenceToolTimeout(TimeoutError):
+    pass
+
+
+def _evidence_tools(startup: StartupIdea) -> Dict[str, Callable[[], object]]:
+    # pinned up front so a reload mid-phase cannot mix versions
+    reference = get_reference_data()
+    return {
+        "market_size": lambda: market_size_tool(
+            geography=startup.geography,
+            industry=startup.industry,
+            target_user=startup.target_user,
+            reference=reference,
+        ),
+        "competitors": lambda: competitor_discovery_tool(
+            problem=startup.problem,
+            solution=startup.solution,
+            geography=startup.geography,
+            industry=startup.industry,
+            reference=reference,
+        ),
+        "demand": lambda: demand_signal_tool(
+            problem_text=startup.problem,
+            solution_text=startup.solution,
+            semantic_matcher=get_semantic_matcher(),
+        ),
+        "cost_model": lambda: cost_model_tool(
+            solution=startup.solution,
+            industry=startup.industry,
+            geography=startup.geography,
+            # the same price the market sizing assumes
+            price_per_user_month=DEFAULT_AVG_ANNUAL_PRICE_USD / 12,
+        ),
+    }
+
+
+def _timed(fn: Callable[[], object]):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
 
 
 def run_evidence_phase(startup: StartupIdea) -> EvidenceBundle:
@@ -29,34 +90,93 @@ def run_evidence_phase(startup: StartupIdea) -> EvidenceBundle:
     Here there is no LLm reasoning.
     """
 
-    market_size=market_size_tool(
-        geography=startup.geography,
-        industry=startup.industry,
-        target_user=startup.target_user,
-    )
-    competitors = competitor_discovery_tool(
-        problem=startup.problem,
-        solution=startup.solution,
-        geography=startup.geography,
-        industry=startup.industry,
-    )
+    results = {}
+    timings = {}
+    for name, tool in _evidence_tools(startup).items():
+        results[name], timings[name] = _timed(tool)
 
-    demand = demand_signal_tool(
-        problem_text=startup.problem,
-        solution_text=startup.solution,
-        semantic_matcher=semantic_matcher,
-    )
+    return EvidenceBundle(**results, timings=timings)
 
-    cost_model = cost_model_tool(
-        solution=startup.solution,
-        industry=startup.industry,
-        geography=startup.geography,
-    )
+
+def run_evidence_phase_concurrent(
+    startup: StartupIdea,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> EvidenceBundle:
+    """
+    Same evidence as `run_evidence_phase`, but every tool runs on its own thread,
+    so the phase takes as long as the slowest tool instead of the sum.
+    Raises EvidenceToolTimeout if a tool exceeds its limit.
+    """
+    timeouts = {**DEFAULT_TOOL_TIMEOUTS, **(timeouts or {})}
+    tools = _evidence_tools(startup)
+
+    executor = ThreadPoolExecutor(max_workers=len(tools), thread_name_prefix="evidence")
+    try:
+        futures = {name: executor.submit(_timed, tool) for name, tool in tools.items()}
+        phase_start = time.perf_counter()
+
+        results = {}
+        timings = {}
+        for name, future in futures.items():
+            # deadlines are measured from submission, not from when we start waiting
+            remaining = timeouts[name] - (time.perf_counter() - phase_start)
+            try:
+                results[name], timings[name] = future.result(timeout=max(remaining, 0.0))
+            except FutureTimeoutError as e:
+                raise EvidenceToolTimeout(
+                    f"Evidence tool '{name}' exceeded {timeouts[name]}s"
+                ) from e
+    finally:
+        # never block on a hung tool; its thread finishes in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return EvidenceBundle(**results, timings=timings)
+
+
+async def _timed_async(coro):
+    start = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - start
 
 
-    return EvidenceBundle(
-    market_size=market_size,
-    competitors=competitors,
-    demand=demand,
-    cost_model=cost_model,
+async def run_evidence_phase_async(
+    startup: StartupIdea,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> EvidenceBundle:
+    """
+    Event-loop version of the evidence phase: the demand tool awaits the async
+    matcher, the CPU-only tools run on worker threads, all concurrently.
+    """
+    timeouts = {**DEFAULT_TOOL_TIMEOUTS, **(timeouts or {})}
+    tools = _evidence_tools(startup)
+
+    coros = {
+        name: asyncio.to_thread(_timed, tool)
+        for name, tool in tools.items()
+        if name != "demand"
+    }
+    coros["demand"] = _timed_async(
+        demand_signal_tool_async(
+            problem_text=startup.problem,
+            solution_text=startup.solution,
+            semantic_matcher=get_semantic_matcher(),
+        )
     )
+
+    async def bounded(name, coro):
+        try:
+            return await asyncio.wait_for(coro, timeout=timeouts[name])
+        except asyncio.TimeoutError as e:
+            raise EvidenceToolTimeout(
+                f"Evidence tool '{name}' exceeded {timeouts[name]}s"
+            ) from e
+
+    names = list(coros)
+    outcomes = await asyncio.gather(*(bounded(name, coros[name]) for name in names))
+
+    results = {}
+    timings = {}
+    for name, (result, elapsed) in zip(names, outcomes):
+        results[name], timings[name] = result, elapsed
+
+    return EvidenceBundle(**results, timings=timings)
@@ -0,0 +1,318 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Counters, gauges and histograms are plain thread-safe objects, so recording
+a sample costs a lock and a dict update and needs no client library. Values
+owned by other components (cache hit counts, job queue depth) are read at
+scrape time by collectors instead of being mirrored on every event.
+"""
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# seconds; stages span sub-millisecond scoring to multi-second LLM calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """
+        Mirrors a monotonically increasing total kept elsewhere (read by a
+        collector at scrape time); a drop is seen by Prometheus as a reset.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self.set_total(value, **labels)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (non-cumulative) ..., +Inf overflow], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        # called at scrape time, before rendering
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics)
+        for collect in collectors:
+            try:
+                collect()
+            except Exception:
+                # a broken collector must not take the whole scrape down
+                pass
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ---- validator metrics ----
+
+STAGE_DURATION = REGISTRY.register(Histogram(
+    "validator_stage_duration_seconds", "Wall time of each pipeline stage.", ("stage",)
+))
+STAGE_ERRORS = REGISTRY.register(Counter(
+    "validator_stage_errors_total",
+    "Pipeline stage failures by exception type (ValueError is an unparseable agent output).",
+    ("stage", "error"),
+))
+STAGE_RETRIES = REGISTRY.register(Counter(
+    "validator_stage_retries_total",
+    "Stage runs that re-asked their agent after an output failed JSON extraction or validation, by final outcome.",
+    ("stage", "outcome"),
+))
+PIPELINES_IN_FLIGHT = REGISTRY.register(Gauge(
+    "validator_pipelines_in_flight", "Validations currently running in this process."
+))
+PIPELINES_TOTAL = REGISTRY.register(Counter(
+    "validator_pipelines_total", "Finished validations by outcome.", ("kind", "outcome")
+))
+DEBATES_SKIPPED = REGISTRY.register(Counter(
+    "validator_debates_skipped_total",
+    "Fast-mode validations whose base score settled the verdict, so no debate ran.",
+    ("verdict",),
+))
+DEMAND_PRESCORES = REGISTRY.register(Counter(
+    "validator_demand_prescores_total",
+    "Texts the demand tool scored lexically, by whether the semantic matcher was still called.",
+    ("outcome",),
+))
+LLM_REQUESTS = REGISTRY.register(Counter(
+    "validator_llm_requests_total", "LLM completions requested, by whether the cache answered.", ("model", "cached")
+))
+LLM_DURATION = REGISTRY.register(Histogram(
+    "validator_llm_request_duration_seconds", "Latency of LLM calls that reached the provider.", ("model",)
+))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "validator_llm_tokens_total",
+    "Tokens sent to / received from the provider (tiktoken when installed, else estimated).",
+    ("model", "direction"),
+))
+LLM_CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "validator_llm_cache_lookups_total", "LLM cache lookups since start, by tier result.", ("result",)
+))
+JOB_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "validator_job_queue_depth", "Background validation jobs waiting for a worker."
+))
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    STAGE_DURATION.observe(seconds, stage=stage)
+
+
+def stage_failed(stage: str, error: BaseException) -> None:
+    STAGE_ERRORS.inc(stage=stage, error=type(error).__name__)
+
+
+def stage_retried(stage: str, outcome: str) -> None:
+    STAGE_RETRIES.inc(stage=stage, outcome=outcome)
+
+
+def debate_skipped(verdict: str) -> None:
+    DEBATES_SKIPPED.inc(verdict=verdict)
+
+
+def demand_prescored(outcome: str) -> None:
+    DEMAND_PRESCORES.inc(outcome=outcome)
+
+
+@contextmanager
+def track_pipeline(kind: str = "full"):
+    PIPELINES_IN_FLIGHT.inc()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        PIPELINES_IN_FLIGHT.dec()
+        PIPELINES_TOTAL.inc(kind=kind, outcome=outcome)
+
+
+def record_llm_call(model: str, prompt: str, completion: Optional[str], seconds: Optional[float], cached: bool) -> None:
+    """
+    One completion request; `seconds` and token counts only apply when the
+    provider was actually called.
+    """
+    LLM_REQUESTS.inc(model=model, cached="true" if cached else "false")
+    if cached:
+        return
+    from ai_startup_idea_validator.agents.prompt_packing import estimate_tokens
+
+    if seconds is not None:
+        LLM_DURATION.observe(seconds, model=model)
+    LLM_TOKENS.inc(estimate_tokens(prompt), model=model, direction="input")
+    if isinstance(completion, str):
+        LLM_TOKENS.inc(estimate_tokens(completion), model=model, direction="output")
+
+
+@contextmanager
+def timed_llm_call(model: str, prompt: str):
+    """
+    Times a provider call; the body stores the completion in the yielded dict.
+    """
+    call: Dict[str, Optional[str]] = {"completion": None}
+    start = time.perf_counter()
+    try:
+        yield call
+    finally:
+        record_llm_call(model, prompt, call["completion"], time.perf_counter() - start, cached=False)
+
+
+def _collect_llm_cache() -> None:
+    from ai_startup_idea_validator.cache import llm_cache
+
+    if llm_cache._cache is None:
+        return
+    stats = llm_cache._cache.snapshot()
+    for result in ("memory_hits", "disk_hits", "misses"):
+        LLM_CACHE_LOOKUPS.set_total(stats[result], result=result)
+
+
+def _collect_job_queue() -> None:
+    from ai_startup_idea_validator.api import jobs
+
+    # never start the worker pool just to answer a scrape
+    if jobs._manager is not None:
+        JOB_QUEUE_DEPTH.set(jobs._manager.store.queue_depth())
+
+
+REGISTRY.add_collector(_collect_llm_cache)
+REGISTRY.add_collector(_collect_job_queue)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
@@ -1,40 +1,65 @@
-from typing import Dict
+import asyncio
+import functools
+import inspect
+import os
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
+from ai_startup_idea_validator.agents.agent_pool import get_agent_pool
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
+from ai_startup_idea_validator.monitoring.metrics import debate_skipped, track_pipeline
+from ai_startup_idea_validator.pipeline.run_store import get_run_store
+from ai_startup_idea_validator.pipeline.stage_graph import (
+    Stage,
+    StageCallback,
+    affected_stages,
+    run_stage_graph,
+    run_stage_graph_async,
+)
 
 # Evidence
-from ai_startup_idea_validator.evidence.evidence_runner import run_evidence_phase
+from ai_startup_idea_validator.evidence.evidence_runner import (
+    run_evidence_phase_concurrent,
+    run_evidence_phase_async,
+)
 
 # Analysis agents
 from ai_startup_idea_validator.agents.market_demand_agent import (
     build_market_demand_agent,
     run_market_demand_analysis,
+    run_market_demand_analysis_async,
 )
 from ai_startup_idea_validator.agents.competition_moat_agent import (
     build_competition_moat_agent,
     run_competition_moat_analysis,
+    run_competition_moat_analysis_async,
 )
 from ai_startup_idea_validator.agents.economics_monetization_agent import (
     build_economics_monetization_agent,
     run_economics_monetization_analysis,
+    run_economics_monetization_analysis_async,
 )
 from ai_startup_idea_validator.agents.execution_risk_agent import (
     build_execution_risk_agent,
     run_execution_risk_analysis,
+    run_execution_risk_analysis_async,
 )
 
 # Debate
 from ai_startup_idea_validator.agents.debate_for_agent import (
     build_debate_for_agent,
     run_debate_for,
+    run_debate_for_async,
 )
 from ai_startup_idea_validator.agents.debate_against_agent import (
     build_debate_against_agent,
     run_debate_against,
+    run_debate_against_async,
 )
 from ai_startup_idea_validator.agents.debate_judge_agent import (
     build_debate_judge_agent,
     run_debate_judgement,
+    run_debate_judgement_async,
 )
 
 # Competition signals
@@ -46,46 +71,56 @@ from ai_startup_idea_validator.tools.competition_signal_builder import (
 from ai_startup_idea_validator.scoring.final_aggregator import (
     aggregate_base_score,
     build_final_decision,
+    settled_verdict,
 )
 
 # Final explanation
 from ai_startup_idea_validator.agents.final_explanation_agent import (
     build_final_explanation_agent,
     run_final_explanation,
+    run_final_explanation_async,
 )
 
 
-def run_full_validation(startup: StartupIdea, llm_model: str = "gpt-4o-mini")-> Dict:
-    """
-    Runs the complete startup idea validation pipeline. 
-    Returns a fully serializable result dictionary
-    """
+PIPELINE_MAX_WORKERS_ENV = "PIPELINE_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 4
+
+# skip the debate when the base score already fixes the verdict
+VALIDATION_FAST_MODE_ENV = "VALIDATION_FAST_MODE"
+
+
+def fast_mode_enabled() -> bool:
+    return os.getenv(VALIDATION_FAST_MODE_ENV, "0").lower() in {"1", "true", "yes", "on"}
+
+
+# ---- stage functions ----
+
+def _market_analysis(startup, evidence, llm_model):
+    with get_agent_pool().lease(build_market_demand_agent, llm_model) as agent:
+        return run_market_demand_analysis(agent, startup, evidence.market_size, evidence.demand)
+
+
+def _competition_analysis(startup, competition_signals, llm_model):
+    with get_agent_pool().lease(build_competition_moat_agent, llm_model) as agent:
+        return run_competition_moat_analysis(agent, startup, competition_signals)
+
 
-    # evidence
-    evidence=run_evidence_phase(startup)
+def _economics_analysis(startup, evidence, llm_model):
+    with get_agent_pool().lease(build_economics_monetization_agent, llm_model) as agent:
+        return run_economics_monetization_analysis(agent, startup, evidence.market_size, evidence.cost_model)
 
-    # competition signals
-    competition_signals = build_competition_signals(startup)
 
-    # Build agents
-    market_agent = build_market_demand_agent(llm_model)
-    competition_agent=build_competition_moat_agent(llm_model)
-    economics_agent = build_economics_monetization_agent(llm_model)
-    execution_agent=build_execution_risk_agent(llm_model)
+def _execution_analysis(startup, llm_model):
+    with get_agent_pool().lease(build_execution_risk_agent, llm_model) as agent:
+        return run_execution_risk_analysis(agent, startup)
 
-    # expert analysis
-    market_analysis = run_market_demand_analysis(market_agent, startup, evidence.market_size, evidence.demand)
-    competition_analysis=run_competition_moat_analysis(competition_agent, startup, competition_signals)
-    economics_analysis= run_economics_monetization_analysis(economics_agent, startup, evidence.market_size, evidence.cost_model)
-    execution_analysis = run_execution_risk_analysis(execution_agent, startup)
 
+def _base_score(market_analysis, competition_analysis, economics_analysis, execution_analysis):
+    return aggregate_base_score(market_analysis, competition_analysis, economics_analysis, execution_analysis)
 
-    # base score
-    base_score=aggregate_base_score(
-        market_analysis, competition_analysis, economics_analysis, execution_analysis)
-    
 
-    analysis_bundle={
+def _analysis_bundle(market_analysis, competition_analysis, economics_analysis, execution_analysis, base_score):
+    return {
         "market_demand":market_analysis.__dict__,
         "competition_moat":competition_analysis.__dict__,
         "economics":economics_analysis.__dict__,
@@ -93,44 +128,439 @@ def run_full_validation(startup: StartupIdea, llm_model: str = "gpt-4o-mini")->
         "base_score":base_score
     }
 
-    # debate
-    for_agent = build_debate_for_agent(llm_model)
-    against_agent=build_debate_against_agent(llm_model)
 
-    for_argument=run_debate_for(for_agent, analysis_bundle)
-    against_argument=run_debate_against(against_agent, analysis_bundle)
+def _settled_verdict(base_score, fast_mode):
+    if not fast_mode:
+        return None
+    verdict = settled_verdict(base_score)
+    if verdict is not None:
+        debate_skipped(verdict)
+    return verdict
 
 
-    # judge
-    judge_agent=build_debate_judge_agent(llm_model)
-    judgement=run_debate_judgement(judge_agent, for_argument.__dict__, against_argument.__dict__, base_score)
+def _unless_settled(fn):
+    """
+    Wraps a debate stage so it returns None without calling the LLM once
+    `settled_verdict` says no judge adjustment could change the verdict.
+    """
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def debate_stage(settled_verdict, **inputs):
+            if settled_verdict is not None:
+                return None
+            return await fn(**inputs)
+    else:
+        @functools.wraps(fn)
+        def debate_stage(settled_verdict, **inputs):
+            if settled_verdict is not None:
+                return None
+            return fn(**inputs)
+    return debate_stage
+
+
+def _for_argument(analysis_bundle, llm_model):
+    with get_agent_pool().lease(build_debate_for_agent, llm_model) as agent:
+        return run_debate_for(agent, analysis_bundle)
+
+
+def _against_argument(analysis_bundle, llm_model):
+    with get_agent_pool().lease(build_debate_against_agent, llm_model) as agent:
+        return run_debate_against(agent, analysis_bundle)
 
-    # final aggregation
-    final_decision=build_final_decision(
-        market_analysis,
-        competition_analysis,
-        economics_analysis,
-        execution_analysis,
-        judgement,
-    )
 
+def _judgement(for_argument, against_argument, base_score, llm_model):
+    with get_agent_pool().lease(build_debate_judge_agent, llm_model) as agent:
+        return run_debate_judgement(agent, for_argument.__dict__, against_argument.__dict__, base_score)
 
-    # final explanation
-    explanation_agent=build_final_explanation_agent(llm_model)
-    final_explanation=run_final_explanation(
-        explanation_agent, startup, final_decision
+
+def _final_decision(market_analysis, competition_analysis, economics_analysis, execution_analysis, judgement):
+    return build_final_decision(
+        market_analysis, competition_analysis, economics_analysis, execution_analysis, judgement
     )
 
 
-    # serializable output
+def _final_explanation(startup, final_decision, llm_model):
+    with get_agent_pool().lease(build_final_explanation_agent, llm_model) as agent:
+        return run_final_explanation(agent, startup, final_decision)
+
+
+# ---- async stage functions (same inputs, awaitable LLM calls) ----
+
+async def _market_analysis_async(startup, evidence, llm_model):
+    async with get_agent_pool().alease(build_market_demand_agent, llm_model) as agent:
+        return await run_market_demand_analysis_async(agent, startup, evidence.market_size, evidence.demand)
+
+
+async def _competition_analysis_async(startup, competition_signals, llm_model):
+    async with get_agent_pool().alease(build_competition_moat_agent, llm_model) as agent:
+        return await run_competition_moat_analysis_async(agent, startup, competition_signals)
+
+
+async def _economics_analysis_async(startup, evidence, llm_model):
+    async with get_agent_pool().alease(build_economics_monetization_agent, llm_model) as agent:
+        return await run_economics_monetization_analysis_async(agent, startup, evidence.market_size, evidence.cost_model)
+
+
+async def _execution_analysis_async(startup, llm_model):
+    async with get_agent_pool().alease(build_execution_risk_agent, llm_model) as agent:
+        return await run_execution_risk_analysis_async(agent, startup)
+
+
+async def _for_argument_async(analysis_bundle, llm_model):
+    async with get_agent_pool().alease(build_debate_for_agent, llm_model) as agent:
+        return await run_debate_for_async(agent, analysis_bundle)
+
+
+async def _against_argument_async(analysis_bundle, llm_model):
+    async with get_agent_pool().alease(build_debate_against_agent, llm_model) as agent:
+        return await run_debate_against_async(agent, analysis_bundle)
+
+
+async def _judgement_async(for_argument, against_argument, base_score, llm_model):
+    async with get_agent_pool().alease(build_debate_judge_agent, llm_model) as agent:
+        return await run_debate_judgement_async(agent, for_argument.__dict__, against_argument.__dict__, base_score)
+
+
+async def _final_explanation_async(startup, final_decision, llm_model):
+    async with get_agent_pool().alease(build_final_explanation_agent, llm_model) as agent:
+        return await run_final_explanation_async(agent, startup, final_decision)
+
+
+AGENT_BUILDERS = (
+    build_market_demand_agent,
+    build_competition_moat_agent,
+    build_economics_monetization_agent,
+    build_execution_risk_agent,
+    build_debate_for_agent,
+    build_debate_against_agent,
+    build_debate_judge_agent,
+    build_final_explanation_agent,
+)
+
+
+SYNC_STAGE_FNS = {
+    "evidence": run_evidence_phase_concurrent,
+    "market_analysis": _market_analysis,
+    "competition_analysis": _competition_analysis,
+    "economics_analysis": _economics_analysis,
+    "execution_analysis": _execution_analysis,
+    "for_argument": _for_argument,
+    "against_argument": _against_argument,
+    "judgement": _judgement,
+    "final_explanation": _final_explanation,
+}
+
+ASYNC_STAGE_FNS = {
+    "evidence": run_evidence_phase_async,
+    "market_analysis": _market_analysis_async,
+    "competition_analysis": _competition_analysis_async,
+    "economics_analysis": _economics_analysis_async,
+    "execution_analysis": _execution_analysis_async,
+    "for_argument": _for_argument_async,
+    "against_argument": _against_argument_async,
+    "judgement": _judgement_async,
+    "final_explanation": _final_explanation_async,
+}
+
+
+def _startup(*fields: str) -> Tuple[str, ...]:
+    return tuple(f"startup.{field}" for field in fields)
+
+
+def build_validation_stages(asynchronous: bool = False) -> List[Stage]:
+    """
+    The validation pipeline as a dependency graph. Each stage names the
+    initial values ("startup", "llm_model", "fast_mode") or stage outputs it consumes,
+    and which StartupIdea fields its tools / prompt actually read.
+    `asynchronous` swaps the I/O-bound stages for their coroutine versions;
+    the graph itself is identical.
+    """
+    fns = ASYNC_STAGE_FNS if asynchronous else SYNC_STAGE_FNS
+
+    return [
+        # evidence + structural signals
+        Stage(
+            "evidence",
+            fns["evidence"],
+            ("startup",),
+            _startup("problem", "solution", "geography", "industry", "target_user"),
+        ),
+        Stage("competition_signals", build_competition_signals, ("startup",), _startup("industry")),
+
+        # expert analysis
+        Stage(
+            "market_analysis",
+            fns["market_analysis"],
+            ("startup", "evidence", "llm_model"),
+            _startup("problem", "solution", "geography"),
+        ),
+        Stage(
+            "competition_analysis",
+            fns["competition_analysis"],
+            ("startup", "competition_signals", "llm_model"),
+            _startup("problem", "solution", "differentiation"),
+        ),
+        Stage(
+            "economics_analysis",
+            fns["economics_analysis"],
+            ("startup", "evidence", "llm_model"),
+            _startup("solution", "monetization_model"),
+        ),
+        Stage(
+            "execution_analysis",
+            fns["execution_analysis"],
+            ("startup", "llm_model"),
+            _startup(
+                "problem", "solution", "geography", "founder_expertise",
+                "customer_acquisition", "regulatory_constraints", "constraints",
+            ),
+        ),
+
+        # base score
+        Stage(
+            "base_score",
+            _base_score,
+            ("market_analysis", "competition_analysis", "economics_analysis", "execution_analysis"),
+        ),
+        Stage(
+            "analysis_bundle",
+            _analysis_bundle,
+            ("market_analysis", "competition_analysis", "economics_analysis", "execution_analysis", "base_score"),
+        ),
+
+        # fast mode: None, or the verdict every possible judge adjustment agrees on
+        Stage("settled_verdict", _settled_verdict, ("base_score", "fast_mode")),
+
+        # debate (each returns None when the verdict is settled)
+        Stage(
+            "for_argument",
+            _unless_settled(fns["for_argument"]),
+            ("analysis_bundle", "llm_model", "settled_verdict"),
+        ),
+        Stage(
+            "against_argument",
+            _unless_settled(fns["against_argument"]),
+            ("analysis_bundle", "llm_model", "settled_verdict"),
+        ),
+
+        # judge
+        Stage(
+            "judgement",
+            _unless_settled(fns["judgement"]),
+            ("for_argument", "against_argument", "base_score", "llm_model", "settled_verdict"),
+        ),
+
+        # final aggregation
+        Stage(
+            "final_decision",
+            _final_decision,
+            ("market_analysis", "competition_analysis", "economics_analysis", "execution_analysis", "judgement"),
+        ),
+
+        # final explanation
+        Stage(
+            "final_explanation",
+            fns["final_explanation"],
+            ("startup", "final_decision", "llm_model"),
+            _startup("problem", "solution", "geography", "industry"),
+        ),
+    ]
+
+
+def serialize_stage_output(value: Any) -> Any:
+    """
+    JSON-friendly form of a single stage output (dataclasses, pydantic models, plain values).
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return value
+
+
+def serialize_validation(results: Dict) -> Dict:
     return {
-        "startup":startup.__dict__,
-        "analysis":analysis_bundle,
+        "startup":results["startup"].__dict__,
+        "analysis":results["analysis_bundle"],
         "debate":{
-            "for":for_argument.__dict__,
-            "against":against_agent.__dict__,
-            "judge":judgement.__dict__,
+            "for":serialize_stage_output(results["for_argument"]),
+            "against":serialize_stage_output(results["against_argument"]),
+            "judge":serialize_stage_output(results["judgement"]),
+            "skipped":results["judgement"] is None,
+            "settled_verdict":results["settled_verdict"],
         },
-        "final_decision":final_decision.__dict__,
-        "final_explanation":final_explanation.__dict__,
-    }
\ No newline at end of file
+        "final_decision":results["final_decision"].__dict__,
+        "final_explanation":results["final_explanation"].__dict__,
+    }
+
+
+def _finish(results: Dict[str, Any], save_run: bool, parent_run_id: Optional[str] = None) -> Dict:
+    output = serialize_validation(results)
+    if save_run:
+        output["run_id"] = get_run_store().save(results, parent_id=parent_run_id)
+    return output
+
+
+def run_full_validation(
+    startup: StartupIdea,
+    llm_model: str = "gpt-4o-mini",
+    max_workers: Optional[int] = None,
+    on_stage_complete: Optional[StageCallback] = None,
+    save_run: bool = False,
+    fast_mode: Optional[bool] = None,
+)-> Dict:
+    """
+    Runs the complete startup idea validation pipeline. 
+    Independent stages run concurrently, at most `max_workers` at a time
+    (default: PIPELINE_MAX_WORKERS env var, else 4). `on_stage_complete`
+    is called with (stage_name, output, seconds) as each stage finishes.
+    With `save_run` the stage outputs are kept for `revalidate` and the
+    result carries their "run_id".
+    With `fast_mode` (default: VALIDATION_FAST_MODE env var) the debate and
+    judge are skipped when the base score alone fixes the verdict; the result
+    then has debate.skipped and final_decision.debate_skipped set.
+    Returns a fully serializable result dictionary
+    """
+    if max_workers is None:
+        max_workers = int(os.getenv(PIPELINE_MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+    if fast_mode is None:
+        fast_mode = fast_mode_enabled()
+
+    with track_pipeline():
+        results = run_stage_graph(
+            build_validation_stages(),
+            initial={"startup": startup, "llm_model": llm_model, "fast_mode": fast_mode},
+            max_workers=max_workers,
+            on_stage_complete=on_stage_complete,
+        )
+
+    # serializable output
+    return _finish(results, save_run)
+
+
+async def run_full_validation_async(
+    startup: StartupIdea,
+    llm_model: str = "gpt-4o-mini",
+    max_concurrency: Optional[int] = None,
+    on_stage_complete: Optional[StageCallback] = None,
+    save_run: bool = False,
+    fast_mode: Optional[bool] = None,
+) -> Dict:
+    """
+    Non-blocking version of `run_full_validation`: LLM calls are awaited on the
+    event loop, so one process can hold many validations in flight.
+    """
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv(PIPELINE_MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+    if fast_mode is None:
+        fast_mode = fast_mode_enabled()
+
+    with track_pipeline():
+        results = await run_stage_graph_async(
+            build_validation_stages(asynchronous=True),
+            initial={"startup": startup, "llm_model": llm_model, "fast_mode": fast_mode},
+            max_concurrency=max_concurrency,
+            on_stage_complete=on_stage_complete,
+        )
+
+    if save_run:
+        # the run store is SQLite; keep the write off the event loop
+        return await asyncio.to_thread(_finish, results, save_run)
+    return _finish(results, save_run)
+
+
+# ---- incremental re-validation ----
+
+class UnknownRunError(KeyError):
+    pass
+
+
+class InvalidChangesError(ValueError):
+    pass
+
+
+def plan_revalidation(
+    run_id: str,
+    changes: Dict[str, Any],
+    llm_model: Optional[str] = None,
+    asynchronous: bool = False,
+) -> Tuple[List[Stage], Dict[str, Any]]:
+    """
+    Stages to rerun after applying `changes` (StartupIdea field -> new value)
+    to a stored run, and the initial values for them: the edited startup plus
+    the stored output of every stage the changes cannot reach.
+    """
+    previous = get_run_store().load(run_id)
+    if previous is None:
+        raise UnknownRunError(run_id)
+
+    unknown = set(changes) - set(StartupIdea.model_fields)
+    if unknown:
+        raise InvalidChangesError(f"Unknown StartupIdea fields: {sorted(unknown)}")
+
+    old_startup = previous["startup"]
+    try:
+        startup = StartupIdea(**{**old_startup.__dict__, **changes})
+    except ValueError as e:
+        raise InvalidChangesError(str(e)) from e
+    changed = {
+        f"startup.{field}" for field in changes
+        if getattr(startup, field) != getattr(old_startup, field)
+    }
+    llm_model = llm_model or previous["llm_model"]
+    if llm_model != previous["llm_model"]:
+        changed.add("llm_model")
+
+    stages = build_validation_stages(asynchronous)
+    # runs stored before a stage existed have no output for it to reuse
+    missing = {stage.name for stage in stages if stage.name not in previous}
+    affected = affected_stages(stages, changed | missing) | missing
+    initial = {"startup": startup, "llm_model": llm_model, "fast_mode": previous.get("fast_mode", False)}
+    initial.update({stage.name: previous[stage.name] for stage in stages if stage.name not in affected})
+    return [stage for stage in stages if stage.name in affected], initial
+
+
+def _finish_revalidation(results: Dict[str, Any], run_id: str, rerun: List[Stage]) -> Dict:
+    output = _finish(results, save_run=True, parent_run_id=run_id)
+    output["parent_run_id"] = run_id
+    output["recomputed_stages"] = [stage.name for stage in rerun]
+    return output
+
+
+def revalidate(
+    run_id: str,
+    changes: Dict[str, Any],
+    llm_model: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    on_stage_complete: Optional[StageCallback] = None,
+) -> Dict:
+    """
+    Re-runs a stored validation with some idea fields changed, recomputing
+    only the stages those fields reach. The result is saved as a new run.
+    """
+    if max_workers is None:
+        max_workers = int(os.getenv(PIPELINE_MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+
+    rerun, initial = plan_revalidation(run_id, changes, llm_model)
+    with track_pipeline("revalidate"):
+        results = run_stage_graph(rerun, initial, max_workers=max_workers, on_stage_complete=on_stage_complete)
+    return _finish_revalidation(results, run_id, rerun)
+
+
+async def revalidate_async(
+    run_id: str,
+    changes: Dict[str, Any],
+    llm_model: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    on_stage_complete: Optional[StageCallback] = None,
+) -> Dict:
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv(PIPELINE_MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+
+    # loading the stored run is a SQLite read
+    rerun, initial = await asyncio.to_thread(plan_revalidation, run_id, changes, llm_model, True)
+    with track_pipeline("revalidate"):
+        results = await run_stage_graph_async(
+            rerun, initial, max_concurrency=max_concurrency, on_stage_complete=on_stage_complete
+        )
+    return await asyncio.to_thread(_finish_revalidation, results, run_id, rerun)
@@ -0,0 +1,81 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# ---- configuration (env) ----
+
+RUN_STORE_PATH_ENV = "RUN_STORE_PATH"
+RUN_STORE_MAX_RUNS_ENV = "RUN_STORE_MAX_RUNS"
+
+DEFAULT_RUN_STORE_PATH = Path.home() / ".cache" / "ai_startup_idea_validator" / "runs.sqlite3"
+DEFAULT_MAX_RUNS = 10_000
+
+
+class RunStore:
+    """
+    Raw stage outputs of finished validations, keyed by run id, so a later
+    re-validation can reuse every stage its changes do not touch.
+
+    Outputs are the live dataclasses the stages exchange, so they are
+    pickled; the file is process-local state, never user input.
+    """
+
+    def __init__(self, path: Path, max_runs: int = DEFAULT_MAX_RUNS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_runs = max_runs
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " id TEXT PRIMARY KEY,"
+            " parent_id TEXT,"
+            " results BLOB NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS runs_created ON runs(created_at)")
+        self._conn.commit()
+
+    def save(self, results: Dict[str, Any], parent_id: Optional[str] = None) -> str:
+        run_id = uuid.uuid4().hex
+        blob = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO runs (id, parent_id, results, created_at) VALUES (?, ?, ?, ?)",
+                (run_id, parent_id, blob, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM runs WHERE id IN ("
+                " SELECT id FROM runs ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_runs,),
+            )
+            self._conn.commit()
+        return run_id
+
+    def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT results FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+
+_store: Optional[RunStore] = None
+_store_lock = threading.Lock()
+
+
+def get_run_store() -> RunStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = RunStore(
+                    Path(os.getenv(RUN_STORE_PATH_ENV, DEFAULT_RUN_STORE_PATH)),
+                    max_runs=int(os.getenv(RUN_STORE_MAX_RUNS_ENV, DEFAULT_MAX_RUNS)),
+                )
+    return _store
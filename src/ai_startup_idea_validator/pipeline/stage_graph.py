@@ -0,0 +1,204 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ai_startup_idea_validator.monitoring.metrics import observe_stage, stage_failed
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of the pipeline graph.
+    `fn` is called with the named `inputs` as keyword arguments and its return
+    value is published under the stage's own `name`.
+    `reads` optionally narrows an input to the attributes the stage actually
+    uses ("startup.industry"); an input with no entry there counts as read whole.
+    """
+    name: str
+    fn: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    reads: Tuple[str, ...] = ()
+
+    def depends_on(self, changed: Set[str]) -> bool:
+        """
+        Whether any of `changed` (input names or dotted attributes) feeds this stage.
+        """
+        for name in self.inputs:
+            if name in changed:
+                return True
+            changed_attrs = {c for c in changed if c.startswith(name + ".")}
+            if not changed_attrs:
+                continue
+            declared = {r for r in self.reads if r.startswith(name + ".")}
+            if not declared or declared & changed_attrs:
+                return True
+        return False
+
+
+class StageGraphError(ValueError):
+    pass
+
+
+# called as on_stage_complete(stage_name, output, seconds) after each stage
+StageCallback = Callable[[str, Any, float], None]
+
+
+def _timed_call(stage: Stage, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    try:
+        result = stage.fn(**kwargs)
+    except Exception as e:
+        stage_failed(stage.name, e)
+        raise
+    elapsed = time.perf_counter() - start
+    observe_stage(stage.name, elapsed)
+    return result, elapsed
+
+
+def validate_stage_graph(stages: Iterable[Stage], initial: Iterable[str]) -> List[Stage]:
+    """
+    Checks names are unique, every input is produced by something, and there
+    are no cycles. Returns the stages in a valid topological order.
+    """
+    stages = list(stages)
+    available = set(initial)
+    by_name: Dict[str, Stage] = {}
+
+    for stage in stages:
+        if stage.name in by_name or stage.name in available:
+            raise StageGraphError(f"Duplicate stage output: {stage.name}")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        unknown = set(stage.inputs) - available - by_name.keys()
+        if unknown:
+            raise StageGraphError(f"Stage '{stage.name}' has unknown inputs {unknown}")
+
+    ordered: List[Stage] = []
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if set(s.inputs) <= available]
+        if not ready:
+            raise StageGraphError(f"Cycle between stages {[s.name for s in remaining]}")
+        for stage in ready:
+            ordered.append(stage)
+            available.add(stage.name)
+        remaining = [s for s in remaining if s.name not in available]
+
+    return ordered
+
+
+def affected_stages(stages: Iterable[Stage], changed: Iterable[str]) -> Set[str]:
+    """
+    Names of the stages whose output can differ once `changed` inputs change,
+    i.e. the stages that read them plus everything downstream of those.
+    """
+    stages = list(stages)
+    changed = set(changed)
+    affected: Set[str] = set()
+    grew = True
+    while grew:
+        grew = False
+        for stage in stages:
+            if stage.name in affected:
+                continue
+            if affected & set(stage.inputs) or stage.depends_on(changed):
+                affected.add(stage.name)
+                grew = True
+    return affected
+
+
+def run_stage_graph(
+    stages: Iterable[Stage],
+    initial: Dict[str, Any],
+    max_workers: int = 4,
+    on_stage_complete: Optional[StageCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every stage as soon as its inputs exist, at most `max_workers` at a time.
+    Returns `initial` plus every stage output. The first stage exception is
+    re-raised after in-flight stages are cancelled where possible.
+    """
+    pending = validate_stage_graph(stages, initial)
+    results: Dict[str, Any] = dict(initial)
+    running: Dict[Future, Stage] = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage")
+    try:
+        while pending or running:
+            ready = [s for s in pending if all(i in results for i in s.inputs)]
+            for stage in ready:
+                pending.remove(stage)
+                kwargs = {name: results[name] for name in stage.inputs}
+                running[executor.submit(_timed_call, stage, kwargs)] = stage
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                results[stage.name], elapsed = future.result()
+                if on_stage_complete is not None:
+                    on_stage_complete(stage.name, results[stage.name], elapsed)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+async def _call_stage(stage: Stage, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    try:
+        if inspect.iscoroutinefunction(stage.fn):
+            result = await stage.fn(**kwargs)
+        else:
+            # plain functions must not block the event loop
+            result = await asyncio.to_thread(stage.fn, **kwargs)
+    except Exception as e:
+        stage_failed(stage.name, e)
+        raise
+    elapsed = time.perf_counter() - start
+    observe_stage(stage.name, elapsed)
+    return result, elapsed
+
+
+async def run_stage_graph_async(
+    stages: Iterable[Stage],
+    initial: Dict[str, Any],
+    max_concurrency: int = 4,
+    on_stage_complete: Optional[StageCallback] = None,
+) -> Dict[str, Any]:
+    """
+    asyncio counterpart of `run_stage_graph`. Coroutine stages are awaited
+    directly, plain stages run on a worker thread. On failure every other
+    running stage is cancelled and the first exception is re-raised.
+    """
+    pending = validate_stage_graph(stages, initial)
+    results: Dict[str, Any] = dict(initial)
+    running: Dict["asyncio.Task[Any]", Stage] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(stage: Stage, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+        async with semaphore:
+            return await _call_stage(stage, kwargs)
+
+    try:
+        while pending or running:
+            ready = [s for s in pending if all(i in results for i in s.inputs)]
+            for stage in ready:
+                pending.remove(stage)
+                kwargs = {name: results[name] for name in stage.inputs}
+                running[asyncio.create_task(bounded(stage, kwargs), name=stage.name)] = stage
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                stage = running.pop(task)
+                results[stage.name], elapsed = task.result()
+                if on_stage_complete is not None:
+                    on_stage_complete(stage.name, results[stage.name], elapsed)
+    finally:
+        for task in running:
+            task.cancel()
+
+    return results
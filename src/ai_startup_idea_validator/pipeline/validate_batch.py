@@ -0,0 +1,222 @@
+"""
+Bulk validation: StartupIdea records in as JSONL, results out as JSONL.
+
+    validate-batch ideas.jsonl -o results.jsonl --workers 8
+    cat ideas.jsonl | validate-batch - --ordered > results.jsonl
+
+Each input line is a StartupIdea object, optionally with an "id"; lines
+without one are keyed by their 1-based line number. Every successful record
+is appended to the checkpoint file (default: <output>.checkpoint) after its
+result is written, so rerunning the same command skips what is already done
+and retries the records that failed (timeouts, rate limits, bad input); the
+retry's line is appended after the earlier error line, so the last line for
+an id is the current one.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, TextIO, Tuple
+
+from ai_startup_idea_validator.models.startup_idea import StartupIdea
+from ai_startup_idea_validator.pipeline.warmup import load_environment
+
+DEFAULT_WORKERS = 4
+# records read ahead of the slowest in-flight one, per worker
+READ_AHEAD_PER_WORKER = 2
+
+
+class Checkpoint:
+    """
+    Append-only list of successfully validated record ids, one per line.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.completed: Set[str] = set()
+        self._file: Optional[TextIO] = None
+        if path is None:
+            return
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.completed = {line.strip() for line in f if line.strip()}
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self.completed
+
+    def mark(self, record_id: str) -> None:
+        self.completed.add(record_id)
+        if self._file is None:
+            return
+        self._file.write(record_id + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def read_records(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Yields (record_id, record, parse_error) for every non-blank line.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            yield str(line_number), None, f"invalid JSON on line {line_number}: {e}"
+            continue
+        record_id = str(record.pop("id", line_number))
+        yield record_id, record, None
+
+
+def validate_record(record: Dict[str, Any], llm_model: str) -> Dict[str, Any]:
+    """
+    Runs one validation; top-level so it can be shipped to a process pool.
+    """
+    from ai_startup_idea_validator.pipeline.run_full_validation import run_full_validation
+
+    start = time.perf_counter()
+    try:
+        result = run_full_validation(StartupIdea(**record), llm_model=llm_model)
+        outcome = {"status": "ok", "result": result}
+    except Exception as e:
+        outcome = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    outcome["seconds"] = round(time.perf_counter() - start, 3)
+    return outcome
+
+
+def run_batch(
+    lines: Iterable[str],
+    out: TextIO,
+    checkpoint: Checkpoint,
+    workers: int = DEFAULT_WORKERS,
+    use_processes: bool = False,
+    ordered: bool = False,
+    llm_model: str = "gpt-4o-mini",
+) -> Dict[str, int]:
+    """
+    Validates every record not already in the checkpoint and writes one
+    JSON line per record, in completion order or (ordered=True) input order.
+    Only workers * READ_AHEAD_PER_WORKER records are held in memory at once.
+    """
+    stats = {"written": 0, "skipped": 0, "errors": 0}
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    window = max(1, workers) * READ_AHEAD_PER_WORKER
+
+    pending = {}            # future -> record_id
+    finished = {}           # record_id -> output line, waiting for its turn
+    order = deque()         # record ids in input order (ordered mode)
+
+    def emit(record_id: str, outcome: Dict[str, Any]) -> None:
+        if outcome["status"] != "ok":
+            stats["errors"] += 1
+        out.write(json.dumps({"id": record_id, **outcome}) + "\n")
+        out.flush()
+        # errors stay out of the checkpoint so a resumed run retries them
+        if outcome["status"] == "ok":
+            checkpoint.mark(record_id)
+        stats["written"] += 1
+
+    def collect(outcome_by_id: Dict[str, Dict[str, Any]]) -> None:
+        if not ordered:
+            for record_id, outcome in outcome_by_id.items():
+                emit(record_id, outcome)
+            return
+        finished.update(outcome_by_id)
+        while order and order[0] in finished:
+            record_id = order.popleft()
+            emit(record_id, finished.pop(record_id))
+
+    def drain(block_until_below: int) -> None:
+        while pending and len(pending) + len(finished) >= block_until_below:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect({pending.pop(future): future.result() for future in done})
+
+    executor = executor_cls(max_workers=max(1, workers))
+    try:
+        for record_id, record, parse_error in read_records(lines):
+            if record_id in checkpoint:
+                stats["skipped"] += 1
+                continue
+            if ordered:
+                order.append(record_id)
+            if parse_error is not None:
+                collect({record_id: {"status": "error", "error": parse_error}})
+                continue
+            drain(window)
+            pending[executor.submit(validate_record, record, llm_model)] = record_id
+        drain(1)
+    finally:
+        # on interrupt, drop queued work; successful records are already checkpointed
+        executor.shutdown(wait=False, cancel_futures=True)
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="validate-batch",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file of StartupIdea records, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL results file, or - for stdout")
+    parser.add_argument("--checkpoint", help="finished-id file (default: <output>.checkpoint; none for stdout)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="validations in flight at once")
+    parser.add_argument("--processes", action="store_true", help="use a process pool instead of threads")
+    parser.add_argument("--ordered", action="store_true", help="write results in input order")
+    parser.add_argument("--llm-model", default="gpt-4o-mini")
+    args = parser.parse_args(argv)
+    load_environment()
+
+    checkpoint_path = args.checkpoint
+    if checkpoint_path is None and args.output != "-":
+        checkpoint_path = args.output + ".checkpoint"
+    checkpoint = Checkpoint(checkpoint_path)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    # resuming appends to the results we already have
+    out_mode = "a" if checkpoint.completed else "w"
+    out = sys.stdout if args.output == "-" else open(args.output, out_mode, encoding="utf-8")
+
+    start = time.perf_counter()
+    try:
+        stats = run_batch(
+            source,
+            out,
+            checkpoint,
+            workers=args.workers,
+            use_processes=args.processes,
+            ordered=args.ordered,
+            llm_model=args.llm_model,
+        )
+    except KeyboardInterrupt:
+        print("interrupted; rerun the same command to resume", file=sys.stderr)
+        return 130
+    finally:
+        checkpoint.close()
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"written={stats['written']} skipped={stats['skipped']} errors={stats['errors']} "
+        f"elapsed={time.perf_counter() - start:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
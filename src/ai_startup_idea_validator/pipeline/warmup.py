@@ -0,0 +1,121 @@
+"""
+Process warm-up. Importing the package is kept cheap (crewai, openai and
+numpy load on first use), so a serving process calls `warm_up()` once
+before taking traffic to pay those costs up front.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+WARMUP_ON_STARTUP_ENV = "WARMUP_ON_STARTUP"
+
+
+@dataclass
+class WarmStep:
+    status: str = "pending"   # pending | ok | error
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+_state: Dict[str, WarmStep] = {}
+_state_lock = threading.Lock()
+_env_loaded = False
+
+
+def load_environment() -> None:
+    """
+    Loads `.env` into os.environ once; entry points call this, library
+    modules never do.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _env_loaded = True
+
+
+def _warm_reference_data() -> None:
+    from ai_startup_idea_validator.tools.competition_signal_builder import get_competitor_index
+    from ai_startup_idea_validator.tools.competitor_discovery_tool import get_search_index
+    from ai_startup_idea_validator.tools.reference_data import get_reference_data
+
+    get_competitor_index()
+    # over a compiled store the search index decodes every record; leave that to the first discovery call
+    if get_reference_data().competitor_store is None:
+        get_search_index()
+
+
+def _warm_semantic_matcher() -> None:
+    from ai_startup_idea_validator.tools import semantic_matcher
+    from ai_startup_idea_validator.tools.lexical_matcher import get_demand_automaton
+
+    get_demand_automaton()
+    matcher = semantic_matcher.get_semantic_matcher()
+    if matcher is semantic_matcher.semantic_matcher:
+        semantic_matcher._get_client()
+        semantic_matcher._get_async_client()
+
+
+def _warm_llm_cache() -> None:
+    from ai_startup_idea_validator.cache.llm_cache import cache_enabled, get_llm_cache
+
+    if cache_enabled():
+        get_llm_cache().get("warm-up")
+
+
+def _warm_agents(llm_model: str) -> None:
+    from ai_startup_idea_validator.agents.agent_pool import get_agent_pool
+    from ai_startup_idea_validator.pipeline.run_full_validation import AGENT_BUILDERS
+
+    get_agent_pool().warm(AGENT_BUILDERS, llm_model)
+
+
+def _steps(llm_model: str) -> List[Tuple[str, Callable[[], None]]]:
+    return [
+        ("environment", load_environment),
+        ("reference_data", _warm_reference_data),
+        ("semantic_matcher", _warm_semantic_matcher),
+        ("llm_cache", _warm_llm_cache),
+        ("agents", lambda: _warm_agents(llm_model)),
+    ]
+
+
+def warm_up(llm_model: str = "gpt-4o-mini") -> Dict[str, dict]:
+    """
+    Runs every warm-up step, recording failures instead of raising so a
+    misconfigured step shows up on the readiness endpoint.
+    """
+    steps = _steps(llm_model)
+    with _state_lock:
+        for name, _ in steps:
+            _state[name] = WarmStep()
+
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+            result = WarmStep(status="ok")
+        except Exception as e:
+            result = WarmStep(status="error", error=f"{type(e).__name__}: {e}")
+        result.seconds = round(time.perf_counter() - start, 4)
+        with _state_lock:
+            _state[name] = result
+    return warm_state()["steps"]
+
+
+def warm_state() -> dict:
+    with _state_lock:
+        steps = {name: asdict(step) for name, step in _state.items()}
+    return {
+        "ready": bool(steps) and all(step["status"] == "ok" for step in steps.values()),
+        "steps": steps,
+    }
+
+
+def warm_up_enabled() -> bool:
+    return os.getenv(WARMUP_ON_STARTUP_ENV, "1").lower() not in {"0", "false", "no", "off"}
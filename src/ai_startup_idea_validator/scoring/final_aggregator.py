@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from ai_startup_idea_validator.agents.debate_judge_agent import DebateJudgement
+from ai_startup_idea_validator.agents.debate_judge_agent import (
+    DebateJudgement,
+    MAX_CONFIDENCE_SHIFT,
+    MIN_CONFIDENCE_SHIFT,
+)
 from ai_startup_idea_validator.agents.market_demand_agent import MarketDemandAnalysis
 from ai_startup_idea_validator.agents.competition_moat_agent import CompetitionMoatAnalysis
 from ai_startup_idea_validator.agents.economics_monetization_agent import EconomicsMonetizationAnalysis
@@ -16,6 +20,8 @@ class FinalDecision:
     key_positive_factors: List[str]
     key_negative_factors: List[str]
     confidence_level: str
+    # True when the base score already fixed the verdict and no debate ran
+    debate_skipped: bool = False
 
 
 def aggregate_base_score(market: MarketDemandAnalysis, competition: CompetitionMoatAnalysis, economics: EconomicsMonetizationAnalysis, execution: ExecutionRiskAnalysis) -> float:
@@ -55,6 +61,31 @@ def verdict_from_score(score: float) -> str:
     return "DO NOT PROCEED"
 
 
+def reachable_score_range(base_score: float) -> Tuple[float, float]:
+    """
+    Lowest and highest final score any judge confidence_shift can produce.
+    """
+    return (
+        round(base_score * (1 + MIN_CONFIDENCE_SHIFT), 2),
+        round(base_score * (1 + MAX_CONFIDENCE_SHIFT), 2),
+    )
+
+
+def settled_verdict(base_score: float) -> Optional[str]:
+    """
+    The verdict if no possible judge adjustment can change it, else None.
+    verdict_from_score is monotonic, so checking both ends is enough.
+    """
+    low, high = reachable_score_range(base_score)
+    verdict = verdict_from_score(low)
+    return verdict if verdict_from_score(high) == verdict else None
+
+
+# confidence_level of a decision whose verdict the base score fixed: no judge
+# assessed the arguments, so none of the debate's high/medium/low applies
+SETTLED_CONFIDENCE = "settled"
+
+
 def confidence_from_debate(judgement: DebateJudgement)-> str:
     if judgement.argument_quality == "high":
         return "high"
@@ -64,18 +95,50 @@ def confidence_from_debate(judgement: DebateJudgement)-> str:
 
 
 
+def _score_breakdown(market, competition, economics, execution) -> Dict[str, float]:
+    return {
+        "market_demand": market.score * 10,
+        "competition_moat": competition.score * 10,
+        "economics": economics.score * 10,
+        "execution": execution.score * 10,
+    }
+
+
+def _settled_decision(market, competition, economics, execution, base_score: float) -> FinalDecision:
+    positives = market.strengths + competition.strengths + economics.strengths + execution.strengths
+    negatives = market.concerns + competition.concerns + economics.concerns + execution.concerns
+
+    return FinalDecision(
+        final_score=base_score,
+        verdict=verdict_from_score(base_score),
+        score_breakdown=_score_breakdown(market, competition, economics, execution),
+        judge_adjustment=0.0,
+        key_positive_factors=list(dict.fromkeys(positives))[:5],
+        key_negative_factors=list(dict.fromkeys(negatives))[:5],
+        confidence_level=SETTLED_CONFIDENCE,
+        debate_skipped=True,
+    )
+
+
 def build_final_decision(
     market: MarketDemandAnalysis,
     competition: CompetitionMoatAnalysis,
     economics: EconomicsMonetizationAnalysis,
     execution: ExecutionRiskAnalysis,
-    judgement: DebateJudgement,
+    judgement: Optional[DebateJudgement],
 ) -> FinalDecision:
+    """
+    `judgement` is None when the debate was skipped because the base score
+    settled the verdict; the base score then stands unadjusted.
+    """
 
     base_score = aggregate_base_score(
         market, competition, economics, execution
     )
 
+    if judgement is None:
+        return _settled_decision(market, competition, economics, execution, base_score)
+
     final_score = apply_judge_adjustment(base_score, judgement)
 
     verdict = verdict_from_score(final_score)
@@ -99,12 +162,7 @@ def build_final_decision(
     return FinalDecision(
         final_score=final_score,
         verdict=verdict,
-        score_breakdown={
-            "market_demand": market.score * 10,
-            "competition_moat": competition.score * 10,
-            "economics": economics.score * 10,
-            "execution": execution.score * 10,
-        },
+        score_breakdown=_score_breakdown(market, competition, economics, execution),
         judge_adjustment=judgement.confidence_shift,
         key_positive_factors=list(dict.fromkeys(positives))[:5],
         key_negative_factors=list(dict.fromkeys(negatives))[:5],
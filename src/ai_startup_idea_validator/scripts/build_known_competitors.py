@@ -1,28 +1,146 @@
+"""
+Refreshes the known-competitor catalogue from the list pages in WIKI_PAGES.
+
+    python -m ai_startup_idea_validator.scripts.build_known_competitors [-o known_competitors.json]
+
+Pages are fetched concurrently over one pooled session and revalidated with
+ETag / Last-Modified against an on-disk cache, so an unchanged page costs a
+304 and is not parsed again. Changed pages are parsed on a process pool.
+Scraped names are deduplicated by normalized name and merged into the
+existing catalogue: curated records are kept as they are, new companies get
+schema-valid defaults. The JSON and its compiled column store are replaced
+atomically, and only when something was added (or the store is missing or
+stale).
+"""
+import argparse
+import hashlib
 import json
-import requests
-from bs4 import BeautifulSoup
+import logging
+import os
 import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ai_startup_idea_validator.tools.competition_signal_builder import DOMINANCE_WEIGHT, STYLE_PENALTY
+from ai_startup_idea_validator.tools.competitor_store import write_competitor_store
+from ai_startup_idea_validator.tools.reference_data import (
+    COMPILED_COMPETITORS_FILE,
+    KNOWN_COMPETITORS_FILE,
+    data_dir,
+)
+
+logger = logging.getLogger(__name__)
 
 
-WIKI_PAGES = {
+# category -> list page(s); categories must be ones the signal builder knows
+WIKI_PAGES: Dict[str, Union[str, Sequence[str]]] = {
     "fintech": "https://en.wikipedia.org/w/index.php?fulltext=1&search=List+of+fintech+companies&title=Special%3ASearch&ns0=1",
-    "saas": "https://en.wikipedia.org/wiki/List_of_software_companies",
+    "enterprise_software": "https://en.wikipedia.org/wiki/List_of_software_companies",
+}
+
+
+# ---- configuration (env) ----
+
+COMPETITOR_HTTP_CACHE_DIR_ENV = "COMPETITOR_HTTP_CACHE_DIR"
+
+DEFAULT_HTTP_CACHE_DIR = Path.home() / ".cache" / "ai_startup_idea_validator" / "http"
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_PARSE_WORKERS = os.cpu_count() or 1
+DEFAULT_TIMEOUT = 10.0
+
+USER_AGENT = "ai_startup_idea_validator-competitor-builder/0.1"
+
+
+# ---- schema ----
+
+COMPETITION_ROLES = ("dominant_incumbent", "strong_incumbent", "platform_gatekeeper", "fragmented_player")
+
+
+def validate_record(record: Mapping[str, Any]) -> None:
+    """
+    Raises ValueError if `record` is not what competition_signal_builder reads.
+    """
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"competitor without a name: {record!r}")
+    if not isinstance(record.get("primary_category"), str) or not record["primary_category"]:
+        raise ValueError(f"{name}: missing primary_category")
+    for key in ("secondary_categories", "moat_sources", "entry_barriers"):
+        values = record.get(key)
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"{name}: {key} must be a list of strings")
+    if record.get("competition_role") not in COMPETITION_ROLES:
+        raise ValueError(f"{name}: unknown competition_role {record.get('competition_role')!r}")
+    if record.get("dominance_level") not in DOMINANCE_WEIGHT:
+        raise ValueError(f"{name}: unknown dominance_level {record.get('dominance_level')!r}")
+    if record.get("competition_style") not in STYLE_PENALTY:
+        raise ValueError(f"{name}: unknown competition_style {record.get('competition_style')!r}")
+
+
+def scraped_record(name: str, category: str, source: str) -> Dict[str, Any]:
+    """
+    A new name gets the weakest profile until someone curates it.
+    """
+    return {
+        "name": name,
+        "primary_category": category,
+        "secondary_categories": [],
+        "competition_role": "fragmented_player",
+        "dominance_level": "low",
+        "moat_sources": [],
+        "entry_barriers": [],
+        "competition_style": "fragmented",
+        "notes": f"Listed on {source}",
+    }
+
+
+# ---- name normalization ----
+
+_CORPORATE_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "llc", "plc", "sa", "ag", "gmbh", "nv", "bv", "ab", "group", "holdings",
 }
+_NON_WORD = re.compile(r"[^\w\s]")
+
 
-OUTPUT_PATH = Path("data/known_competitors.json")
+def normalize_name(name: str) -> str:
+    """
+    Dedup key: case- and accent-folded, punctuation dropped, trailing
+    corporate suffixes removed ("Stripe, Inc." and "STRIPE" collide).
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    # dots join abbreviations ("S.A." -> "sa") rather than splitting them
+    text = text.replace(".", "").replace("&", " and ")
+    words = _NON_WORD.sub(" ", text).split()
+    while len(words) > 1 and words[-1] in _CORPORATE_SUFFIXES:
+        words.pop()
+    return " ".join(words)
 
 
+# ---- parsing ----
+
 def clean(text: str) -> str:
     return re.sub(r"\s+", " ", text.strip())
 
 
-def extract_companies(url: str, industry: str):
-    res = requests.get(url, timeout=10)
-    soup = BeautifulSoup(res.text, "html.parser")
-
-    competitors = set()
+def parse_names(html: str) -> List[str]:
+    """
+    Company names linked from list items, in page order. Top-level so it can
+    run in a worker process.
+    """
+    soup = BeautifulSoup(html, "html.parser")
 
+    names = {}
     # Common Wikipedia patterns
     for a in soup.select("div.mw-parser-output li a"):
         name = clean(a.get_text())
@@ -35,34 +153,290 @@ def extract_companies(url: str, industry: str):
         if any(char.isdigit() for char in name):
             continue
 
-        competitors.add(name)
+        names.setdefault(name, None)
 
-    return [
-        {
-            "name": name,
-            "industry": industry,
-            "problem": "industry-specific problem",
-            "solution": "industry-specific solution",
-            "positioning": "Not specified"
+    return list(names)
+
+
+# ---- HTTP cache ----
+
+@dataclass
+class CachedPage:
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    sha256: str = ""
+    # names parsed from this body, so an unchanged page is not parsed again
+    names: Optional[List[str]] = None
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    """
+    One metadata JSON and one body file per URL, keyed by the URL's sha256.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.html"
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        if hashlib.sha256(body.encode("utf-8")).hexdigest() != meta.get("sha256"):
+            # torn write or edited by hand: treat as a miss
+            return None
+        return CachedPage(url=url, body=body, **{k: meta.get(k) for k in ("etag", "last_modified", "sha256", "names")})
+
+    def put(self, page: CachedPage) -> None:
+        meta_path, body_path = self._paths(page.url)
+        # body first: a crash in between leaves a sha mismatch, i.e. a miss
+        _atomic_write(body_path, page.body.encode("utf-8"))
+        meta = {
+            "url": page.url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "sha256": page.sha256,
+            "names": page.names,
         }
-        for name in competitors
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+
+# ---- fetching ----
+
+@dataclass
+class FetchResult:
+    category: str
+    url: str
+    # "fetched", "not_modified", "stale" (served from cache after an error) or "failed"
+    status: str
+    page: Optional[CachedPage] = None
+
+
+def make_session(pool_size: int = DEFAULT_FETCH_WORKERS) -> requests.Session:
+    """
+    One keep-alive connection pool shared by every fetch thread, with
+    backoff on transient errors.
+    """
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def fetch(session: requests.Session, cache: HttpCache, category: str, url: str, timeout: float = DEFAULT_TIMEOUT) -> FetchResult:
+    cached = cache.get(url)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    try:
+        res = session.get(url, headers=headers, timeout=timeout)
+        if res.status_code == 304 and cached is not None:
+            return FetchResult(category, url, "not_modified", cached)
+        res.raise_for_status()
+    except requests.RequestException as e:
+        if cached is not None:
+            logger.warning("fetching %s failed, using cached copy: %s", url, e)
+            return FetchResult(category, url, "stale", cached)
+        logger.warning("fetching %s failed: %s", url, e)
+        return FetchResult(category, url, "failed")
+
+    body = res.text
+    sha = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    page = CachedPage(
+        url=url,
+        body=body,
+        etag=res.headers.get("ETag"),
+        last_modified=res.headers.get("Last-Modified"),
+        sha256=sha,
+        # same bytes under a new validator: keep the parse
+        names=cached.names if cached is not None and cached.sha256 == sha else None,
+    )
+    cache.put(page)
+    return FetchResult(category, url, "fetched", page)
+
+
+# ---- build ----
+
+@dataclass
+class BuildReport:
+    pages: int = 0
+    statuses: Dict[str, int] = field(default_factory=dict)
+    parsed: int = 0
+    scraped_names: int = 0
+    added: int = 0
+    total: int = 0
+    seconds: float = 0.0
+
+
+def _page_list(pages: Mapping[str, Union[str, Sequence[str]]]) -> List[Tuple[str, str]]:
+    return [
+        (category, url)
+        for category, urls in pages.items()
+        for url in ([urls] if isinstance(urls, str) else urls)
     ]
 
 
+def merge_competitors(
+    existing: Sequence[Mapping[str, Any]],
+    scraped: Sequence[Tuple[str, str, Sequence[str]]],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    `existing` plus one record per new normalized name in `scraped`
+    ((category, source, names) triples). Existing records are never
+    modified; a new name seen under several categories keeps the first as
+    primary and lists the rest as secondary.
+    """
+    records = [dict(record) for record in existing]
+    by_key = {}
+    for record in records:
+        by_key.setdefault(normalize_name(record["name"]), record)
+
+    added: Dict[str, Dict[str, Any]] = {}
+    for category, source, names in scraped:
+        for name in names:
+            key = normalize_name(name)
+            if not key:
+                continue
+            record = added.get(key)
+            if record is not None:
+                if category != record["primary_category"] and category not in record["secondary_categories"]:
+                    record["secondary_categories"].append(category)
+                continue
+            if key in by_key:
+                continue
+            added[key] = scraped_record(name, category, source)
+
+    records.extend(added.values())
+    return records, len(added)
+
+
+def _is_fresh(compiled: Path, source: Path) -> bool:
+    try:
+        return compiled.stat().st_mtime >= source.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def build_known_competitors(
+    output: Path,
+    pages: Mapping[str, Union[str, Sequence[str]]] = WIKI_PAGES,
+    cache_dir: Optional[Path] = None,
+    fetch_workers: int = DEFAULT_FETCH_WORKERS,
+    parse_workers: int = DEFAULT_PARSE_WORKERS,
+    compile_store: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> BuildReport:
+    """
+    Fetches, parses and merges `pages` into the catalogue at `output`
+    (read first if it exists). `parse_workers=0` parses in this process.
+    """
+    start = time.perf_counter()
+    output = Path(output)
+    cache = HttpCache(cache_dir or Path(os.getenv(COMPETITOR_HTTP_CACHE_DIR_ENV, DEFAULT_HTTP_CACHE_DIR)))
+    page_list = _page_list(pages)
+    report = BuildReport(pages=len(page_list))
+
+    with make_session(max(1, fetch_workers)) as session, ThreadPoolExecutor(max(1, fetch_workers)) as pool:
+        results = list(pool.map(lambda page: fetch(session, cache, *page, timeout=timeout), page_list))
+    for result in results:
+        report.statuses[result.status] = report.statuses.get(result.status, 0) + 1
+
+    to_parse = [r.page for r in results if r.page is not None and r.page.names is None]
+    if to_parse:
+        bodies = [page.body for page in to_parse]
+        if parse_workers > 0 and len(bodies) > 1:
+            with ProcessPoolExecutor(min(parse_workers, len(bodies))) as pool:
+                parsed = list(pool.map(parse_names, bodies))
+        else:
+            parsed = [parse_names(body) for body in bodies]
+        for page, names in zip(to_parse, parsed):
+            page.names = names
+            cache.put(page)
+        report.parsed = len(to_parse)
+
+    scraped = [(r.category, r.url, r.page.names) for r in results if r.page is not None]
+    report.scraped_names = sum(len(names) for _, _, names in scraped)
+
+    existing = []
+    if output.exists():
+        with open(output, "r", encoding="utf-8") as f:
+            existing = json.load(f)
+    records, report.added = merge_competitors(existing, scraped)
+    for record in records:
+        validate_record(record)
+    report.total = len(records)
+
+    # nothing new and the existing catalogue validated above: leave the files
+    # (and their mtimes, which trigger hot reload) alone
+    unchanged = report.added == 0 and output.exists()
+    if not unchanged:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(output, json.dumps(records, indent=2, ensure_ascii=False).encode("utf-8"))
+    store_path = output.with_name(COMPILED_COMPETITORS_FILE)
+    if compile_store and not (unchanged and _is_fresh(store_path, output)):
+        # written after the JSON so the reference data sees it as fresh
+        write_competitor_store(records, store_path)
+
+    report.seconds = time.perf_counter() - start
+    return report
+
 
-def main():
-    all_competitors = []
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", default=str(data_dir() / KNOWN_COMPETITORS_FILE))
+    parser.add_argument("--pages", help="JSON file mapping category -> URL or list of URLs (default: WIKI_PAGES)")
+    parser.add_argument("--cache-dir", help=f"HTTP cache directory (default: ${COMPETITOR_HTTP_CACHE_DIR_ENV} or {DEFAULT_HTTP_CACHE_DIR})")
+    parser.add_argument("--fetch-workers", type=int, default=DEFAULT_FETCH_WORKERS)
+    parser.add_argument("--parse-workers", type=int, default=DEFAULT_PARSE_WORKERS, help="0 parses in-process")
+    parser.add_argument("--no-compile", action="store_true", help=f"skip writing {COMPILED_COMPETITORS_FILE}")
+    args = parser.parse_args(argv)
 
-    for industry, url in WIKI_PAGES.items():
-        print(f"Scraping {industry}...")
-        comps = extract_companies(url, industry)
-        all_competitors.extend(comps)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
-    OUTPUT_PATH.parent.mkdir(exist_ok=True)
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(all_competitors, f, indent=2)
+    pages = WIKI_PAGES
+    if args.pages:
+        with open(args.pages, "r", encoding="utf-8") as f:
+            pages = json.load(f)
 
-    print(f"Saved {len(all_competitors)} competitors to {OUTPUT_PATH}")
+    report = build_known_competitors(
+        Path(args.output),
+        pages=pages,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers,
+        compile_store=not args.no_compile,
+    )
+    statuses = ", ".join(f"{count} {status}" for status, count in sorted(report.statuses.items()))
+    print(
+        f"{report.pages} pages ({statuses}), {report.parsed} parsed, {report.scraped_names} names scraped, "
+        f"{report.added} new; saved {report.total} competitors to {args.output} in {report.seconds:.2f}s"
+    )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
 from ai_startup_idea_validator.evidence.evidence_runner import run_evidence_phase
+from ai_startup_idea_validator.pipeline.warmup import load_environment
 
 
 def main():
+    load_environment()
+
     # --- mock extracted startup idea ---
     startup = StartupIdea(
         problem="Small businesses manually track expenses using spreadsheets",
@@ -1,5 +1,3 @@
-from openai import OpenAI
-
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
 from ai_startup_idea_validator.evidence.evidence_runner import run_evidence_phase
 from ai_startup_idea_validator.tools.competition_signal_builder import (
@@ -24,12 +22,10 @@ from ai_startup_idea_validator.agents.execution_risk_agent import (
 )
 from pathlib import Path
 
-from dotenv import load_dotenv
-load_dotenv()
-import os
-print(os.getenv("OPENAI_API_KEY"))
+from ai_startup_idea_validator.pipeline.warmup import load_environment
 
 def main():
+    load_environment()
     LLM_MODEL = "gpt-4o-mini"
 
     print("\n================ STARTUP IDEA VALIDATION ================\n")
@@ -56,16 +52,13 @@ def main():
     # --- 3. Competition Signals (Python-only) ---
     competition_signals = build_competition_signals(startup)
 
-    # --- 4. Build LLM client ---
-    client = OpenAI()
-
-    # --- 5. Build agents ---
+    # --- 4. Build agents ---
     market_agent = build_market_demand_agent(LLM_MODEL)
     competition_agent = build_competition_moat_agent(LLM_MODEL)
     economics_agent = build_economics_monetization_agent(LLM_MODEL)
     execution_agent = build_execution_risk_agent(LLM_MODEL)
 
-    # --- 6. Run analysis agents ---
+    # --- 5. Run analysis agents ---
     print(">>> Running Market & Demand Analysis...\n")
     market_analysis = run_market_demand_analysis(
         market_agent,
@@ -95,7 +88,7 @@ def main():
         startup,
     )
 
-    # --- 7. Print results ---
+    # --- 6. Print results ---
     print("\n================ ANALYSIS RESULTS ================\n")
 
     print("Market & Demand:")
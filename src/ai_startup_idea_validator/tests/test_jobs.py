@@ -0,0 +1,189 @@
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from ai_startup_idea_validator.api.jobs import (
+    JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV,
+    QUEUED,
+    RUNNING,
+    JobStore,
+    WebhookNotAllowedError,
+    _post_webhook,
+    check_webhook_url,
+)
+
+
+@contextmanager
+def allowed_networks(value):
+    saved = os.environ.get(JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV)
+    if value is None:
+        os.environ.pop(JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV, None)
+    else:
+        os.environ[JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV] = value
+    try:
+        yield
+    finally:
+        if saved is None:
+            os.environ.pop(JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV, None)
+        else:
+            os.environ[JOBS_WEBHOOK_ALLOWED_NETWORKS_ENV] = saved
+
+
+@contextmanager
+def receiver(host, redirect_to=None):
+    """
+    A local webhook endpoint recording the paths it was POSTed to; with
+    `redirect_to` it answers every request with a 302 there instead.
+    """
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            hits.append(self.path)
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if redirect_to:
+                self.send_response(302)
+                self.send_header("Location", redirect_to)
+            else:
+                self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}/hook", hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ---- queue ----
+
+def test_racing_claims_take_each_job_once():
+    path = Path(tempfile.mkdtemp()) / "jobs.sqlite3"
+    stores = [JobStore(path), JobStore(path)]
+    job_ids = {stores[0].create({"n": n}, None) for n in range(40)}
+
+    claimed = [[], []]
+    start = threading.Barrier(len(stores))
+
+    def drain(i):
+        start.wait()
+        while True:
+            job = stores[i].claim_next()
+            if job is None:
+                return
+            claimed[i].append(job["id"])
+
+    threads = [threading.Thread(target=drain, args=(i,)) for i in range(len(stores))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    together = claimed[0] + claimed[1]
+    assert len(together) == len(set(together)), "a job was claimed twice"
+    assert set(together) == job_ids
+    for i, store in enumerate(stores):
+        for job_id in claimed[i]:
+            assert store.get(job_id)["owner"] == store.owner
+
+
+def test_requeue_only_dead_owners():
+    path = Path(tempfile.mkdtemp()) / "jobs.sqlite3"
+    dead = JobStore(path, heartbeat_timeout=0.2)
+    alive = JobStore(path, heartbeat_timeout=0.2)
+    dead_job = dead.create({}, None)
+    alive_job = alive.create({}, None)
+    assert dead.claim_next()["id"] == dead_job
+    assert alive.claim_next()["id"] == alive_job
+
+    # a new store on the same database leaves fresh running jobs alone
+    assert JobStore(path, heartbeat_timeout=0.2).get(alive_job)["status"] == RUNNING
+
+    time.sleep(0.3)
+    alive.heartbeat()
+    assert alive.requeue_stale() == 1
+    assert alive.get(dead_job)["status"] == QUEUED
+    assert alive.get(alive_job)["status"] == RUNNING
+
+    # the requeued job went to another owner: the old one's outcome is dropped
+    assert alive.claim_next()["id"] == dead_job
+    assert dead.finish(dead_job, result={"late": True}) is False
+    assert alive.finish(dead_job, result={"ok": True}) is True
+    assert alive.get(dead_job)["result"] == {"ok": True}
+
+
+# ---- webhooks ----
+
+def test_webhook_urls_to_internal_addresses_are_refused():
+    with allowed_networks(None):
+        for url in (
+            "http://127.0.0.1/hook",
+            "http://10.1.2.3/hook",
+            "http://169.254.169.254/latest/meta-data",
+            "http://[::1]/hook",
+            "file:///etc/passwd",
+            "ftp://example.com/hook",
+        ):
+            try:
+                check_webhook_url(url)
+            except WebhookNotAllowedError:
+                continue
+            raise AssertionError(f"{url} was accepted")
+        check_webhook_url("https://example.com/hook")
+
+    with allowed_networks("127.0.0.1/32, 10.0.0.0/8"):
+        check_webhook_url("http://127.0.0.1/hook")
+        check_webhook_url("http://10.1.2.3/hook")
+        try:
+            check_webhook_url("http://192.168.1.1/hook")
+        except WebhookNotAllowedError:
+            pass
+        else:
+            raise AssertionError("192.168.1.1 was accepted")
+
+
+def test_webhook_delivery_is_checked_against_the_peer():
+    with receiver("127.0.0.1") as (url, hits):
+        with allowed_networks(None):
+            _post_webhook(url, {"job": 1})
+            # a hostname passes the submit-time check but resolves to loopback
+            _post_webhook(url.replace("127.0.0.1", "localhost"), {"job": 2})
+        assert hits == []
+
+        with allowed_networks("127.0.0.1/32"):
+            _post_webhook(url, {"job": 3})
+        assert hits == ["/hook"]
+
+
+def test_webhook_redirects_are_not_followed():
+    with receiver("127.0.0.2") as (target, target_hits):
+        with receiver("127.0.0.1", redirect_to=target) as (url, hits):
+            with allowed_networks("127.0.0.1/32"):
+                _post_webhook(url, {"job": 1})
+    assert hits == ["/hook"]
+    assert target_hits == []
+
+
+def main():
+    for test in (
+        test_racing_claims_take_each_job_once,
+        test_requeue_only_dead_owners,
+        test_webhook_urls_to_internal_addresses_are_refused,
+        test_webhook_delivery_is_checked_against_the_peer,
+        test_webhook_redirects_are_not_followed,
+    ):
+        test()
+        print(f"ok  {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import os
+
+from ai_startup_idea_validator.tools.demand_signal_tool import (
+    DEMAND_LEXICAL_BAND_HIGH_ENV,
+    DEMAND_LEXICAL_BAND_LOW_ENV,
+    demand_signal_tool,
+)
+from ai_startup_idea_validator.tools.lexical_matcher import (
+    PhraseAutomaton,
+    get_demand_automaton,
+    lemma,
+    phrase_variants,
+)
+
+
+def test_failure_links():
+    automaton = PhraseAutomaton({
+        "slow": ["slow process", "process bottleneck"],
+        "bare": ["process"],
+        "chain": ["a b c", "b c d"],
+    })
+
+    # "process" is only reachable from the "slow process" state through its failure link
+    match = automaton.scan("slow process bottleneck")
+    assert match.phrases["slow"] == ["slow process", "process bottleneck"], match
+    assert match.phrases["bare"] == ["process"], match
+
+    # after "a b c", "d" is not a child: the scan must fall back to "b c" and continue
+    match = automaton.scan("a b c d")
+    assert match.phrases["chain"] == ["a b c", "b c d"], match
+
+    assert automaton.scan("slow bottleneck").phrases == {}
+
+
+def test_hyphen_and_closed_compound_variants():
+    assert phrase_variants("ai-powered") == [("ai", "power"), ("aipower",)]
+    assert phrase_variants("end-to-end platform") == [("end", "to", "end", "platform"), ("endtoend", "platform")]
+
+    automaton = PhraseAutomaton({"buzzword": ["ai-powered", "end-to-end platform"]})
+    for text in ("AI-powered", "ai powered", "AIPowered", "end to end platform", "an EndToEnd platform"):
+        assert automaton.scan(text).phrases.get("buzzword"), text
+
+
+def test_lemma_collisions():
+    # inflections meet on both sides of the match
+    for group in (
+        ("workflow", "workflows"),
+        ("reduce", "reduced", "reduces", "reducing"),
+        ("process", "processes"),
+        ("company", "companies"),
+        ("save", "saves", "saving", "savings"),
+    ):
+        assert len({lemma(word) for word in group}) == 1, group
+
+    # short tokens and -ss words are left alone
+    for word in ("ai", "is", "ml", "business", "less"):
+        assert lemma(word) == word, word
+
+    automaton = get_demand_automaton()
+    assert "reduce errors" in automaton.scan("it reduced errors").phrases["outcome"]
+    assert "streamline processes" in automaton.scan("a streamlined process").phrases["outcome"]
+
+
+def test_density_scaling():
+    automaton = PhraseAutomaton({"pain": ["slow process", "expensive"]})
+    filler = ["word"] * 28
+
+    # two covered tokens out of 15 saturate; out of 30 they score half
+    assert automaton.scan(" ".join(["slow", "process"] + filler[:13])).scores["pain"] == 1.0
+    assert automaton.scan(" ".join(["slow", "process"] + filler)).scores["pain"] == 0.5
+    # one covered token out of 10
+    assert automaton.scan(" ".join(["expensive"] + filler[:9])).scores["pain"] == 0.75
+    # overlapping hits count each covered token once
+    assert automaton.scan(" ".join(["slow", "process", "slow", "process"] + filler[:26])).scores["pain"] == 1.0
+    assert automaton.scan(" ".join(filler)).scores["pain"] == 0.0
+    assert automaton.scan("").scores["pain"] == 0.0
+
+
+def test_full_band_escalates_every_bucket():
+    asked = []
+
+    def matcher(text, concepts):
+        return 0.0
+
+    def match_buckets(text, buckets):
+        asked.extend(buckets)
+        return {name: 0.0 for name in buckets}
+
+    matcher.match_buckets = match_buckets
+
+    saved = {name: os.environ.get(name) for name in (DEMAND_LEXICAL_BAND_LOW_ENV, DEMAND_LEXICAL_BAND_HIGH_ENV)}
+    os.environ[DEMAND_LEXICAL_BAND_LOW_ENV] = "0"
+    os.environ[DEMAND_LEXICAL_BAND_HIGH_ENV] = "1"
+    try:
+        result = demand_signal_tool(
+            "An AI-powered platform to save time",
+            "A manual process that is time consuming and error prone",
+            semantic_matcher=matcher,
+            score_solution=True,
+        )
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    assert sorted(result.escalated) == sorted([
+        "problem.pain", "problem.outcome", "problem.buzzword", "solution.outcome", "solution.buzzword",
+    ]), result.escalated
+    assert sorted(asked) == sorted(["pain", "outcome", "buzzword", "outcome", "buzzword"]), asked
+
+
+def test_default_band_keeps_paraphrased_pain():
+    asked = []
+
+    def matcher(text, concepts):
+        return 0.0
+
+    def match_buckets(text, buckets):
+        asked.extend(buckets)
+        return {name: 0.9 for name in buckets}
+
+    matcher.match_buckets = match_buckets
+
+    # no literal concept phrase: pain and outcome are still asked, buzzword is not
+    result = demand_signal_tool(
+        "",
+        "Small clinics spend hours every week chasing unpaid invoices by hand, "
+        "and billing staff keep making costly mistakes.",
+        semantic_matcher=matcher,
+    )
+    assert asked == ["pain", "outcome"], asked
+    assert result.demand_score == 6.0, result
+
+
+def main():
+    for test in (
+        test_failure_links,
+        test_hyphen_and_closed_compound_variants,
+        test_lemma_collisions,
+        test_density_scaling,
+        test_full_band_escalates_every_bucket,
+        test_default_band_keeps_paraphrased_pain,
+    ):
+        test()
+        print(f"ok  {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
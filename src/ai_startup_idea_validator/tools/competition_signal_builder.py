@@ -1,16 +1,10 @@
-import json
+import threading
 from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Mapping, Optional, Sequence, Tuple
 
 from ai_startup_idea_validator.models.startup_idea import StartupIdea
-
-from pathlib import Path
-
-BASE_DIR = Path(__file__).resolve().parents[1]  
-# points to src/ai_startup_idea_validator/
-
-KNOWN_COMPETITORS_PATH = BASE_DIR / "data" / "known_competitors.json"
+from ai_startup_idea_validator.tools.competitor_store import CompetitorStore, ranked
+from ai_startup_idea_validator.tools.reference_data import ReferenceData, get_reference_data
 
 
 @dataclass
@@ -39,55 +33,61 @@ STYLE_PENALTY = {
 }
 
 
-def load_known_competitors() -> List[Dict]:
-    with open(KNOWN_COMPETITORS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_known_competitors() -> Sequence[Mapping]:
+    return get_reference_data().competitors
 
 
-def build_competition_signals(startup: StartupIdea) -> CompetitionSignals:
-    competitors = load_known_competitors()
+# ---- columnar category index ----
 
-    relevant = [
-        c for c in competitors
-        if c["primary_category"] == startup.industry
-        or startup.industry in c.get("secondary_categories", [])
-    ]
+_index: Optional[Tuple[int, CompetitorStore]] = None
+_index_lock = threading.Lock()
 
-    direct_count = len(relevant)
 
-    dominance_levels = [c["dominance_level"] for c in relevant]
-    highest_dominance = (
-        max(dominance_levels, key=lambda d: DOMINANCE_WEIGHT[d])
-        if dominance_levels else "low"
-    )
+def get_competitor_index(reference: Optional[ReferenceData] = None) -> CompetitorStore:
+    """
+    Returns the competitor columns for `reference` (default: the current
+    snapshot): the memory-mapped compiled store when the snapshot has one,
+    otherwise columns built from the JSON records once per version.
+    """
+    global _index
+
+    reference = reference or get_reference_data()
+    if reference.competitor_store is not None:
+        return reference.competitor_store
+
+    index = _index
+    if index is not None and index[0] == reference.version:
+        return index[1]
+
+    with _index_lock:
+        if _index is None or _index[0] != reference.version:
+            _index = (reference.version, CompetitorStore.from_records(reference.competitors))
+        return _index[1]
+
+
+# ---- signal construction ----
+
+def _signals_for(store: CompetitorStore, category: Optional[str]) -> CompetitionSignals:
+    """
+    Aggregates over the category's posting list; ties among moats, barriers
+    and styles resolve in catalogue order.
+    """
+    rows = store.category_rows(category)
+    direct_count = len(rows)
+
+    highest_dominance = "low"
+    if direct_count:
+        levels = store.decode("dominance", ranked(store.columns["dominance"][rows]))
+        highest_dominance = max(levels, key=DOMINANCE_WEIGHT.__getitem__)
 
     dominant_present = highest_dominance in {"high", "extreme"}
 
-    moat_counter: Dict[str, int] = {}
-    barrier_counter: Dict[str, int] = {}
-    style_counter: Dict[str, int] = {}
-
-    for c in relevant:
-        for m in c.get("moat_sources", []):
-            moat_counter[m] = moat_counter.get(m, 0) + 1
-        for b in c.get("entry_barriers", []):
-            barrier_counter[b] = barrier_counter.get(b, 0) + 1
-        style = c.get("competition_style")
-        if style:
-            style_counter[style] = style_counter.get(style, 0) + 1
-
-    common_moats = sorted(
-        moat_counter, key=moat_counter.get, reverse=True
-    )[:3]
-
-    common_barriers = sorted(
-        barrier_counter, key=barrier_counter.get, reverse=True
-    )[:3]
-
-    dominant_style = (
-        max(style_counter, key=style_counter.get)
-        if style_counter else "fragmented"
-    )
+    common_moats = store.decode("moat", ranked(store.moat_codes(rows), 3))
+    common_barriers = store.decode("barrier", ranked(store.barrier_codes(rows), 3))
+
+    styles = store.columns["style"][rows]
+    top_style = store.decode("style", ranked(styles[styles >= 0], 1))
+    dominant_style = top_style[0] if top_style else "fragmented"
 
     # ---- pressure score (structural, not arbitrary) ----
     pressure = 0.0
@@ -108,3 +108,18 @@ def build_competition_signals(startup: StartupIdea) -> CompetitionSignals:
         competition_style=dominant_style,
         competition_pressure_score=pressure,
     )
+
+
+def build_competition_signals(startup: StartupIdea) -> CompetitionSignals:
+    return _signals_for(get_competitor_index(), startup.industry)
+
+
+def build_competition_signals_batch(industries: Iterable[Optional[str]]) -> Dict[Optional[str], CompetitionSignals]:
+    """
+    Builds signals for many industries against a single store snapshot.
+    """
+    store = get_competitor_index()
+    return {
+        industry: _signals_for(store, industry)
+        for industry in dict.fromkeys(industries)
+    }
@@ -1,8 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Mapping, Sequence, Tuple
 from dataclasses import dataclass
-import json
-import os
+import heapq
+import math
 import re
+import threading
+
+from ai_startup_idea_validator.tools.reference_data import ReferenceData, get_reference_data
 
 
 @dataclass
@@ -10,6 +13,7 @@ class Competitor:
     name: str
     positioning: str
     source: str
+    match_score: float = 0.0
 
 
 @dataclass
@@ -19,20 +23,143 @@ class CompetitorDiscoveryResult:
     data_sources_used: List[str]
 
 
-# ---- helpers ----
+# ---- ranking parameters ----
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# name hits say more about a competitor than a word buried in its notes
+FIELD_WEIGHTS = {
+    "name": 2.0,
+    "categories": 1.5,
+    "notes": 1.0,
+}
+
+DEFAULT_TOP_K = 10
 
-def load_known_competitors():
-    path = "data/known_competitors.json"
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            return json.load(f)
-    return []
+# keeps query cost bounded regardless of catalogue size:
+# only the most selective terms are scored, each over its highest-impact postings
+MAX_QUERY_TERMS = 16
+MAX_POSTINGS_PER_TERM = 128
 
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "into", "is", "it", "its", "of", "on", "or", "that", "the", "their", "this",
+    "to", "too", "was", "we", "with", "without", "who", "which", "while", "will",
+    "our", "your", "they", "them", "can", "using", "use", "via", "more", "most",
+    "not", "no", "so", "than", "then", "these", "those", "very", "all", "any",
+}
+
+
+# ---- helpers ----
 
 def normalize(text: str) -> str:
     return re.sub(r"[^a-z0-9 ]", "", text.lower())
 
 
+def tokenize(text: str) -> List[str]:
+    # underscores split too, so "supply_chain" indexes as "supply" + "chain"
+    return [
+        t for t in re.findall(r"[a-z0-9]+", text.lower())
+        if len(t) > 1 and t not in STOPWORDS
+    ]
+
+
+# ---- inverted index ----
+
+class CompetitorSearchIndex:
+    """
+    BM25 inverted index over competitor name, notes and categories.
+    Postings are stored as (impact, doc_id) sorted by impact, where impact is the
+    full BM25 contribution of the term to that document, so a query only sums
+    precomputed weights.
+    """
+
+    def __init__(self, competitors: Sequence[Mapping], version: int = 0):
+        self.version = version
+        self.competitors = competitors
+
+        doc_terms: List[Dict[str, float]] = []
+        doc_freq: Dict[str, int] = {}
+
+        for entry in competitors:
+            fields = {
+                "name": entry.get("name", ""),
+                "categories": " ".join(
+                    [entry.get("primary_category", "")] + list(entry.get("secondary_categories", []))
+                ),
+                "notes": entry.get("notes", ""),
+            }
+
+            tf: Dict[str, float] = {}
+            for field_name, text in fields.items():
+                weight = FIELD_WEIGHTS[field_name]
+                for term in tokenize(text):
+                    tf[term] = tf.get(term, 0.0) + weight
+
+            doc_terms.append(tf)
+            for term in tf:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        n_docs = len(competitors)
+        lengths = [sum(tf.values()) for tf in doc_terms]
+        avg_len = (sum(lengths) / n_docs) if n_docs else 1.0
+
+        postings: Dict[str, List[Tuple[float, int]]] = {}
+        for doc_id, tf in enumerate(doc_terms):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avg_len)
+            for term, freq in tf.items():
+                df = doc_freq[term]
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                impact = idf * freq * (BM25_K1 + 1) / (freq + norm)
+                postings.setdefault(term, []).append((impact, doc_id))
+
+        for plist in postings.values():
+            plist.sort(reverse=True)
+
+        self.postings = postings
+        self.doc_freq = doc_freq
+
+    def search(self, query: str, top_k: int = DEFAULT_TOP_K) -> List[Tuple[float, Mapping]]:
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self.postings]
+        if not terms or top_k <= 0:
+            return []
+
+        # rarest terms first: they discriminate best
+        terms.sort(key=lambda t: self.doc_freq[t])
+        terms = terms[:MAX_QUERY_TERMS]
+
+        scores: Dict[int, float] = {}
+        for term in terms:
+            for impact, doc_id in self.postings[term][:MAX_POSTINGS_PER_TERM]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + impact
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(score, self.competitors[doc_id]) for doc_id, score in best]
+
+
+_search_index: Optional[CompetitorSearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index(reference: Optional[ReferenceData] = None) -> CompetitorSearchIndex:
+    """
+    Returns the process-wide search index for `reference` (default: the
+    current snapshot), rebuilding it only when the reference data was reloaded.
+    """
+    global _search_index
+
+    reference = reference or get_reference_data()
+    index = _search_index
+    if index is not None and index.version == reference.version:
+        return index
+
+    with _search_index_lock:
+        if _search_index is None or _search_index.version != reference.version:
+            _search_index = CompetitorSearchIndex(reference.competitors, version=reference.version)
+        return _search_index
+
+
 # ---- main tool ----
 
 def competitor_discovery_tool(
@@ -40,27 +167,25 @@ def competitor_discovery_tool(
     solution: str,
     geography: str,
     industry: Optional[str] = None,
+    top_k: int = DEFAULT_TOP_K,
+    reference: Optional[ReferenceData] = None,
 ) -> CompetitorDiscoveryResult:
 
-    known_competitors = load_known_competitors()
+    index = get_search_index(reference)
     results: List[Competitor] = []
     sources = []
 
-    key_terms = normalize(problem + " " + solution).split()
-
-    for entry in known_competitors:
-        haystack = normalize(
-            f"{entry.get('problem','')} {entry.get('solution','')} {entry.get('industry','')}"
-        )
+    query = f"{problem} {solution} {industry or ''}"
 
-        if any(term in haystack for term in key_terms):
-            results.append(
-                Competitor(
-                    name=entry["name"],
-                    positioning=entry.get("positioning", "Not specified"),
-                    source="offline_dataset",
-                )
+    for score, entry in index.search(query, top_k=top_k):
+        results.append(
+            Competitor(
+                name=entry["name"],
+                positioning=entry.get("positioning") or entry.get("notes") or "Not specified",
+                source="offline_dataset",
+                match_score=round(score, 3),
             )
+        )
 
     if results:
         sources.append("known_competitors_dataset")
@@ -0,0 +1,325 @@
+"""
+Columnar, memory-mappable form of the known-competitor catalogue.
+
+    python -m ai_startup_idea_validator.tools.competitor_store [known_competitors.json] [-o out.cols]
+
+Categories, roles, dominance levels, styles, moats and barriers are
+interned as integer codes; list fields are stored CSR-style (an offsets
+array plus a flat codes array), names and notes as offsets into UTF-8
+bytes, and a category -> rows posting list is precomputed. Opening a
+compiled file parses only the small JSON header and maps the rest
+read-only, so start-up cost does not grow with the catalogue and worker
+processes share the pages. `CompetitorRecords` decodes rows back into
+record mappings on demand for consumers that want them.
+
+File layout: MAGIC, little-endian uint64 header length, JSON header
+(vocabularies, column dtypes / shapes / offsets), then each column's raw
+bytes at a 64-byte aligned offset.
+"""
+import argparse
+import json
+import os
+import struct
+from collections.abc import Sequence as SequenceABC
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC = b"KCOLS002"
+ALIGNMENT = 64
+
+# interned string columns, in header order
+VOCABULARIES = ("category", "role", "dominance", "style", "moat", "barrier")
+
+
+def _intern(vocab: Dict[str, int], value: str) -> int:
+    code = vocab.get(value)
+    if code is None:
+        code = vocab[value] = len(vocab)
+    return code
+
+
+def _csr(lists: Sequence[Sequence[int]]):
+    import numpy as np
+
+    lengths = np.fromiter((len(values) for values in lists), dtype=np.int64, count=len(lists))
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    codes = np.fromiter((code for values in lists for code in values), dtype=np.int32, count=int(offsets[-1]))
+    return offsets, codes
+
+
+def _text(values: Sequence[str]):
+    import numpy as np
+
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(value) for value in encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _columns(records: Sequence[Mapping[str, Any]]) -> Tuple[Dict[str, List[str]], Dict[str, "np.ndarray"]]:
+    """
+    Interns `records` into vocabularies and numpy columns.
+    """
+    import numpy as np
+
+    vocab: Dict[str, Dict[str, int]] = {name: {} for name in VOCABULARIES}
+    categories, moats, barriers = [], [], []
+    role = np.empty(len(records), dtype=np.int16)
+    dominance = np.empty(len(records), dtype=np.int16)
+    style = np.empty(len(records), dtype=np.int16)
+
+    for row, record in enumerate(records):
+        keys = [record["primary_category"]] + list(record.get("secondary_categories", []))
+        # a competitor counts once per category even if listed twice
+        categories.append([_intern(vocab["category"], key) for key in dict.fromkeys(keys)])
+        competition_role = record.get("competition_role")
+        role[row] = _intern(vocab["role"], competition_role) if competition_role else -1
+        dominance[row] = _intern(vocab["dominance"], record["dominance_level"])
+        competition_style = record.get("competition_style")
+        style[row] = _intern(vocab["style"], competition_style) if competition_style else -1
+        moats.append([_intern(vocab["moat"], m) for m in record.get("moat_sources", [])])
+        barriers.append([_intern(vocab["barrier"], b) for b in record.get("entry_barriers", [])])
+
+    category_offsets, category_codes = _csr(categories)
+    moat_offsets, moat_codes = _csr(moats)
+    barrier_offsets, barrier_codes = _csr(barriers)
+    name_offsets, name_bytes = _text([record.get("name", "") for record in records])
+    notes_offsets, notes_bytes = _text([record.get("notes", "") for record in records])
+
+    # posting lists: rows of each category, ascending (= catalogue order)
+    category_rows_all = np.repeat(np.arange(len(records), dtype=np.int32), np.diff(category_offsets))
+    order = np.argsort(category_codes, kind="stable")
+    posting_offsets = np.zeros(len(vocab["category"]) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(category_codes, minlength=len(vocab["category"])), out=posting_offsets[1:])
+
+    columns = {
+        "role": role,
+        "dominance": dominance,
+        "style": style,
+        "category_offsets": category_offsets,
+        "category_codes": category_codes,
+        "moat_offsets": moat_offsets,
+        "moat_codes": moat_codes,
+        "barrier_offsets": barrier_offsets,
+        "barrier_codes": barrier_codes,
+        "posting_offsets": posting_offsets,
+        "posting_rows": category_rows_all[order],
+        "name_offsets": name_offsets,
+        "name_bytes": name_bytes,
+        "notes_offsets": notes_offsets,
+        "notes_bytes": notes_bytes,
+    }
+    vocabularies = {name: list(values) for name, values in vocab.items()}
+    return vocabularies, columns
+
+
+def _gather(offsets, values, rows):
+    """
+    values[offsets[r]:offsets[r + 1]] for every r in `rows`, concatenated in order.
+    """
+    import numpy as np
+
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return values[:0]
+    block_starts = np.cumsum(lengths) - lengths
+    return values[np.repeat(starts - block_starts, lengths) + np.arange(total)]
+
+
+def ranked(codes, top: Optional[int] = None):
+    """
+    Distinct codes by descending count, ties in first-seen order (the order
+    a stable sort over an insertion-ordered counter gives).
+    """
+    import numpy as np
+
+    if codes.size == 0:
+        return codes[:0]
+    unique, first, counts = np.unique(codes, return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))
+    return unique[order[:top]]
+
+
+class CompetitorStore:
+    """
+    Read-only columns over the competitor catalogue, either memory-mapped
+    from a compiled file (`open`) or built in memory (`from_records`).
+    """
+
+    def __init__(self, vocabularies: Dict[str, List[str]], columns: Dict[str, Any]):
+        self.vocabularies = vocabularies
+        self.codes = {name: {value: code for code, value in enumerate(values)} for name, values in vocabularies.items()}
+        self.columns = columns
+        self.size = len(columns["dominance"])
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "CompetitorStore":
+        vocabularies, columns = _columns(records)
+        return cls(vocabularies, columns)
+
+    @classmethod
+    def open(cls, path: Path) -> "CompetitorStore":
+        import numpy as np
+
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a compiled competitor store")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len))
+
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        columns = {}
+        for name, spec in header["columns"].items():
+            dtype = np.dtype(spec["dtype"])
+            nbytes = int(np.prod(spec["shape"], dtype=np.int64)) * dtype.itemsize
+            start = spec["offset"]
+            columns[name] = buffer[start:start + nbytes].view(dtype).reshape(spec["shape"])
+        return cls(header["vocabularies"], columns)
+
+    # ---- queries ----
+
+    def category_rows(self, category: Optional[str]):
+        """
+        Rows listing `category` as primary or secondary, in catalogue order.
+        """
+        code = self.codes["category"].get(category)
+        posting_rows = self.columns["posting_rows"]
+        if code is None:
+            return posting_rows[:0]
+        offsets = self.columns["posting_offsets"]
+        return posting_rows[offsets[code]:offsets[code + 1]]
+
+    def moat_codes(self, rows):
+        return _gather(self.columns["moat_offsets"], self.columns["moat_codes"], rows)
+
+    def barrier_codes(self, rows):
+        return _gather(self.columns["barrier_offsets"], self.columns["barrier_codes"], rows)
+
+    def decode(self, vocabulary: str, codes) -> List[str]:
+        values = self.vocabularies[vocabulary]
+        return [values[code] for code in codes.tolist()]
+
+    def _string(self, column: str, row: int) -> str:
+        offsets = self.columns[f"{column}_offsets"]
+        return bytes(self.columns[f"{column}_bytes"][offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def _codes(self, column: str, row: int):
+        offsets = self.columns[f"{column}_offsets"]
+        return self.columns[f"{column}_codes"][offsets[row]:offsets[row + 1]]
+
+    def name(self, row: int) -> str:
+        return self._string("name", row)
+
+    def record(self, row: int) -> Mapping[str, Any]:
+        """
+        Row `row` decoded back into the JSON record shape (duplicate
+        categories and empty optional fields are not reproduced).
+        """
+        categories = self.decode("category", self._codes("category", row))
+        record: Dict[str, Any] = {
+            "name": self.name(row),
+            "primary_category": categories[0],
+            "secondary_categories": tuple(categories[1:]),
+            "dominance_level": self.vocabularies["dominance"][int(self.columns["dominance"][row])],
+            "moat_sources": tuple(self.decode("moat", self._codes("moat", row))),
+            "entry_barriers": tuple(self.decode("barrier", self._codes("barrier", row))),
+        }
+        for key, column in (("competition_role", "role"), ("competition_style", "style")):
+            code = int(self.columns[column][row])
+            if code >= 0:
+                record[key] = self.vocabularies[column][code]
+        notes = self._string("notes", row)
+        if notes:
+            record["notes"] = notes
+        return MappingProxyType(record)
+
+
+class CompetitorRecords(SequenceABC):
+    """
+    Read-only sequence of competitor records backed by a store, decoded per
+    access, so holding the catalogue costs no more than the mapped file.
+    """
+
+    def __init__(self, store: CompetitorStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return self.store.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self.store.record(row) for row in range(*index.indices(self.store.size)))
+        if index < 0:
+            index += self.store.size
+        if not 0 <= index < self.store.size:
+            raise IndexError("competitor index out of range")
+        return self.store.record(index)
+
+
+def write_competitor_store(records: Sequence[Mapping[str, Any]], path: Path) -> None:
+    """
+    Compiles `records` to `path`, atomically (temp file + rename).
+    """
+    vocabularies, columns = _columns(records)
+
+    specs = {
+        name: {"dtype": array.dtype.str, "shape": list(array.shape), "offset": 0}
+        for name, array in columns.items()
+    }
+
+    # the header records the offsets, which depend on the header's length
+    header = b""
+    while True:
+        position = len(MAGIC) + 8 + len(header)
+        for name, array in columns.items():
+            position += -position % ALIGNMENT
+            specs[name]["offset"] = position
+            position += array.nbytes
+        encoded = json.dumps({"vocabularies": vocabularies, "columns": specs}).encode("utf-8")
+        if len(encoded) == len(header):
+            header = encoded
+            break
+        header = encoded
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for name, array in columns.items():
+            f.write(b"\0" * (specs[name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    from ai_startup_idea_validator.tools.reference_data import (
+        COMPILED_COMPETITORS_FILE,
+        KNOWN_COMPETITORS_FILE,
+        data_dir,
+    )
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default=str(data_dir() / KNOWN_COMPETITORS_FILE))
+    parser.add_argument("-o", "--output", help=f"default: {COMPILED_COMPETITORS_FILE} next to the input")
+    args = parser.parse_args(argv)
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    output = Path(args.output) if args.output else Path(args.input).with_name(COMPILED_COMPETITORS_FILE)
+    write_competitor_store(records, output)
+    print(f"wrote {len(records)} competitors to {output} ({output.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
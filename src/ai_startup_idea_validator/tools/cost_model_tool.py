@@ -1,5 +1,48 @@
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# ---- cost heuristics ----
+
+BASE_INFRA_COST = 200.0 # assuming for server, storage and monitoring
+COMPLEXITY_COST_PER_KEYWORD = 100.0
+COST_PER_USER = 0.02  # infra + support proxy
+
+COMPLEXITY_KEYWORDS = ["real-time", "analytics", "ai", "ml", "streaming"]
+
+INDUSTRY_COST_MULTIPLIERS = {
+    "fintech":1.4,
+    "healthtech":1.5,
+    "saas":1.2,
+    "edtech":1.1,
+}
+
+GEOGRAPHY_COST_MULTIPLIERS = {
+    "india":0.6,
+    "usa":1.0,
+    "europe":1.1,
+    "global":1.2,
+}
+
+# user counts the economics agent sees costs for
+PROFILE_USER_COUNTS = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+@dataclass
+class ScalingProfile:
+    """
+    How monthly cost grows with users, and where a price covers it.
+    `break_even_users` is None when the price does not exceed the variable
+    cost per user (or no price was given).
+    """
+    user_counts: List[int]
+    total_monthly_cost_usd: List[float]
+    cost_per_user_usd: List[float]
+    price_per_user_month_usd: Optional[float] = None
+    break_even_users: Optional[int] = None
+
 
 @dataclass
 class CostModelResult:
@@ -9,42 +52,207 @@ class CostModelResult:
     cost_breakdown: Dict[str, float]
     assumptions: Dict[str, str]
     confidence: str
+    scaling: Optional[ScalingProfile] = None
 
 
-def cost_model_tool(solution:str, industry: Optional[str], geography: str, expected_users: int = 1000, cloud_provider: str = "generic") -> CostModelResult:
+@dataclass
+class CostSweep:
     """
-    Estimate startup operating costs using transparent heuristic, No paid APIs and deterministic
+    Cost matrices of shape (geographies, industries, user_counts).
     """
+    user_counts: "np.ndarray"
+    geographies: List[str]
+    industries: List[Optional[str]]
+    fixed: "np.ndarray"
+    variable: "np.ndarray"
+    total: "np.ndarray"
 
-    base_infra_cost = 200.0 # assuming for server, storage and monitoring
 
+@dataclass
+class CostCurve:
+    """
+    Month-by-month users, cost and revenue over a horizon.
+    """
+    months: "np.ndarray"
+    users: "np.ndarray"
+    total_cost: "np.ndarray"
+    revenue: "np.ndarray"
+    cumulative_profit: "np.ndarray"
+    # first month whose revenue covers that month's cost
+    break_even_month: Optional[int]
+
+
+def _industry_multiplier(industry: Optional[str]) -> float:
     industry_key = industry.lower() if industry else ""
-    industry_multiplier={
-        "fintech":1.4,
-        "healthtech":1.5,
-        "saas":1.2,
-        "edtech":1.1,
-    }.get(industry_key,1.0)
+    return INDUSTRY_COST_MULTIPLIERS.get(industry_key,1.0)
 
-    geography_key= geography.lower() if geography else ""
-    geo_multiplier={
-        "india":0.6,
-        "usa":1.0,
-        "europe":1.1,
-        "global":1.2,
-    }.get(geography_key,1.0)
 
+def _geography_multiplier(geography: Optional[str]) -> float:
+    geography_key= geography.lower() if geography else ""
+    return GEOGRAPHY_COST_MULTIPLIERS.get(geography_key,1.0)
 
 
-    complexity_keywords = ["real-time", "analytics", "ai", "ml", "streaming"]
+def _complexity_cost(solution: str) -> float:
     complexity_cost = 0.0
-    for kw in complexity_keywords:
+    for kw in COMPLEXITY_KEYWORDS:
         if kw in solution.lower():
-            complexity_cost += 100.0
+            complexity_cost += COMPLEXITY_COST_PER_KEYWORD
+    return complexity_cost
+
+
+# ---- vectorized scenarios ----
+
+def cost_sweep(
+    solution: str,
+    user_counts: Sequence[float],
+    geographies: Sequence[str],
+    industries: Sequence[Optional[str]],
+) -> CostSweep:
+    """
+    Fixed, variable and total monthly cost for every (geography, industry,
+    user count) combination in one broadcast. Each cell equals what
+    `cost_model_tool` returns for that scenario, before rounding.
+    """
+    import numpy as np
+
+    users = np.asarray(user_counts, dtype=float)
+    geo = np.array([_geography_multiplier(g) for g in geographies])
+    ind = np.array([_industry_multiplier(i) for i in industries])
+
+    base = BASE_INFRA_COST + _complexity_cost(solution)
+    shape = (len(geo), len(ind), len(users))
+    fixed = np.broadcast_to(base * geo[:, None, None] * ind[None, :, None], shape)
+    variable = np.broadcast_to(users[None, None, :] * COST_PER_USER, shape)
+
+    return CostSweep(
+        user_counts=users,
+        geographies=list(geographies),
+        industries=list(industries),
+        fixed=fixed,
+        variable=variable,
+        total=fixed + variable,
+    )
+
+
+def break_even_users(fixed_cost, price_per_user_month: float):
+    """
+    Users needed for monthly revenue to cover monthly cost, elementwise over
+    `fixed_cost`; inf where the price does not beat the variable cost per user.
+    """
+    import numpy as np
+
+    margin = price_per_user_month - COST_PER_USER
+    fixed_cost = np.asarray(fixed_cost, dtype=float)
+    if margin <= 0:
+        return np.full(fixed_cost.shape, np.inf)
+    return np.ceil(fixed_cost / margin)
+
+
+def cost_curve(
+    solution: str,
+    industry: Optional[str],
+    geography: str,
+    price_per_user_month: float,
+    starting_users: float = 1000,
+    monthly_growth: float = 0.1,
+    horizon_months: int = 24,
+) -> CostCurve:
+    """
+    Users compounding at `monthly_growth` from `starting_users`, with the
+    monthly cost and revenue that implies, over `horizon_months`.
+    """
+    import numpy as np
+
+    months = np.arange(horizon_months)
+    users = starting_users * (1 + monthly_growth) ** months
+    fixed = (BASE_INFRA_COST + _complexity_cost(solution)) * _industry_multiplier(industry) * _geography_multiplier(geography)
+    total_cost = fixed + users * COST_PER_USER
+    revenue = users * price_per_user_month
+
+    covered = np.flatnonzero(revenue >= total_cost)
+    return CostCurve(
+        months=months,
+        users=users,
+        total_cost=total_cost,
+        revenue=revenue,
+        cumulative_profit=np.cumsum(revenue - total_cost),
+        break_even_month=int(covered[0]) if covered.size else None,
+    )
+
+
+def scaling_profile(
+    solution: str,
+    industry: Optional[str],
+    geography: str,
+    price_per_user_month: Optional[float] = None,
+    user_counts: Sequence[int] = PROFILE_USER_COUNTS,
+) -> ScalingProfile:
+    sweep = cost_sweep(solution, user_counts, [geography], [industry])
+    total = sweep.total[0, 0]
+
+    break_even = None
+    if price_per_user_month is not None:
+        users = float(break_even_users(sweep.fixed[0, 0, 0], price_per_user_month))
+        if users != float("inf"):
+            break_even = int(users)
+
+    # plain floats: the profile ends up in prompts, JSON responses and pickles
+    return ScalingProfile(
+        user_counts=[int(u) for u in user_counts],
+        total_monthly_cost_usd=total.round(2).tolist(),
+        cost_per_user_usd=(total / sweep.user_counts).round(4).tolist(),
+        price_per_user_month_usd=price_per_user_month,
+        break_even_users=break_even,
+    )
+
+
+def format_scaling(profile: Optional[ScalingProfile], indent: str = "") -> str:
+    """
+    Prompt lines for a scaling profile, or "" without one. Lines after the
+    first are prefixed with `indent` to line up inside an indented prompt.
+    """
+    if profile is None:
+        return ""
+    points = "; ".join(
+        f"{users:,} users: ${cost:,.0f} (${per_user:,.3f}/user)"
+        for users, cost, per_user in zip(
+            profile.user_counts, profile.total_monthly_cost_usd, profile.cost_per_user_usd
+        )
+    )
+    lines = [f"- Monthly cost by scale: {points}"]
+    if profile.price_per_user_month_usd is not None:
+        price = profile.price_per_user_month_usd
+        if profile.break_even_users is None:
+            lines.append(f"- Break-even: never at an assumed ${price:,.2f}/user/month (below variable cost per user)")
+        else:
+            lines.append(f"- Break-even: ~{profile.break_even_users:,} users at an assumed ${price:,.2f}/user/month")
+    return ("\n" + indent).join(lines)
+
+
+def cost_model_tool(
+    solution:str,
+    industry: Optional[str],
+    geography: str,
+    expected_users: int = 1000,
+    cloud_provider: str = "generic",
+    price_per_user_month: Optional[float] = None,
+    include_scaling: bool = True,
+) -> CostModelResult:
+    """
+    Estimate startup operating costs using transparent heuristic, No paid APIs and deterministic
+    """
+
+    base_infra_cost = BASE_INFRA_COST
+
+    industry_multiplier=_industry_multiplier(industry)
+
+    geo_multiplier=_geography_multiplier(geography)
+
+    complexity_cost = _complexity_cost(solution)
 
 
     # ---- variable costs ----
-    cost_per_user = 0.02  # infra + support proxy
+    cost_per_user = COST_PER_USER
     variable_cost = expected_users * cost_per_user
 
     fixed_cost = (base_infra_cost + complexity_cost) * industry_multiplier * geo_multiplier
@@ -68,7 +276,11 @@ def cost_model_tool(solution:str, industry: Optional[str], geography: str, expec
         assumptions={
             "expected_users": str(expected_users),
             "cloud_provider": cloud_provider,
-            "cost_per_user": "0.02 USD",
+            "cost_per_user": f"{cost_per_user} USD",
         },
         confidence=confidence,
-    )
\ No newline at end of file
+        scaling=(
+            scaling_profile(solution, industry, geography, price_per_user_month)
+            if include_scaling else None
+        ),
+    )
@@ -1,6 +1,10 @@
-from dataclasses import dataclass
-from typing import List, Dict
-from ai_startup_idea_validator.tools.semantic_matcher import semantic_matcher
+import asyncio
+import os
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+from ai_startup_idea_validator.monitoring.metrics import demand_prescored
+from ai_startup_idea_validator.tools.lexical_matcher import get_demand_automaton
+from ai_startup_idea_validator.tools.semantic_matcher import get_semantic_matcher
 from ai_startup_idea_validator.tools.demand_concepts import (
     BUZZWORD_POSITIONING,
     PAIN_DRIVEN_LANGUAGE,
@@ -13,25 +17,121 @@ class DemandSignalResult:
     signals: List[str]
     confidence: str
     semantic_scores: Dict[str, float]
+    # concept phrases found verbatim, and the "text.bucket" scores the matcher had to settle
+    lexical_phrases: Dict[str, List[str]] = field(default_factory=dict)
+    escalated: List[str] = field(default_factory=list)
 
 
+# ---- configuration (env) ----
 
-def demand_signal_tool(
-    solution_text: str,
+DEMAND_LEXICAL_BAND_LOW_ENV = "DEMAND_LEXICAL_BAND_LOW"
+DEMAND_LEXICAL_BAND_HIGH_ENV = "DEMAND_LEXICAL_BAND_HIGH"
+
+# lexical scores inside [low, high] are ambiguous and go to the semantic
+# matcher; above high counts as a match, below low as no match. High sits at
+# the strictest threshold in _score_demand so a settled match always clears
+# it. Pain and outcome are often paraphrased ("chasing invoices by hand"),
+# so a text with no literal phrase is still ambiguous for them (low 0); only
+# buzzword positioning is taken as absent when no phrase is found.
+# DEMAND_LEXICAL_BAND_LOW overrides low for every bucket; 0 and 1 send
+# everything to the matcher.
+DEFAULT_BAND_LOWS = {
+    "pain": 0.0,
+    "outcome": 0.0,
+    "buzzword": 0.01,
+}
+DEFAULT_BAND_HIGH = 0.7
+
+
+PROBLEM_BUCKETS = {
+    "pain": PAIN_DRIVEN_LANGUAGE,
+    "outcome": OUTCOME_DRIVEN_LANGUAGE,
+    "buzzword": BUZZWORD_POSITIONING,
+}
+
+# pain language belongs to the problem statement, so the solution is only
+# checked for outcomes and buzzwords
+SOLUTION_BUCKETS = {
+    "outcome": OUTCOME_DRIVEN_LANGUAGE,
+    "buzzword": BUZZWORD_POSITIONING,
+}
+
+
+def lexical_band() -> Dict[str, Tuple[float, float]]:
+    """
+    (low, high) per bucket.
+    """
+    low = os.getenv(DEMAND_LEXICAL_BAND_LOW_ENV)
+    high = float(os.getenv(DEMAND_LEXICAL_BAND_HIGH_ENV, DEFAULT_BAND_HIGH))
+    return {
+        name: (float(low) if low is not None else default_low, high)
+        for name, default_low in DEFAULT_BAND_LOWS.items()
+    }
+
+
+def prescore(text: str, buckets: Dict[str, List[str]], band: Dict[str, Tuple[float, float]]):
+    """
+    Lexical scores for `buckets`, the phrases behind them, and the subset of
+    buckets whose score falls inside their band and needs the semantic matcher.
+    """
+    match = get_demand_automaton().scan(text)
+    scores = {name: match.scores[name] for name in buckets}
+    ambiguous = {
+        name: concepts for name, concepts in buckets.items()
+        if band[name][0] <= scores[name] <= band[name][1]
+    }
+    phrases = {name: found for name, found in match.phrases.items() if name in buckets}
+    demand_prescored("escalated" if ambiguous else "lexical")
+    return scores, phrases, ambiguous
+
+
+def match_buckets(semantic_matcher, text: str, buckets: Dict[str, List[str]]) -> Dict[str, float]:
+    """
+    Uses the matcher's single-request `match_buckets` when it has one,
+    otherwise falls back to one call per bucket.
+    """
+    multi = getattr(semantic_matcher, "match_buckets", None)
+    if multi is not None:
+        return multi(text, buckets)
+    return {name: semantic_matcher(text, concepts) for name, concepts in buckets.items()}
+
+
+async def amatch_buckets(semantic_matcher, text: str, buckets: Dict[str, List[str]]) -> Dict[str, float]:
+    """
+    Async counterpart of `match_buckets`. Matchers without a native async
+    path are run on a worker thread so the event loop never blocks.
+    """
+    amulti = getattr(semantic_matcher, "amatch_buckets", None)
+    if amulti is not None:
+        return await amulti(text, buckets)
+    return await asyncio.to_thread(match_buckets, semantic_matcher, text, buckets)
+
+
+def _score_demand(
     problem_text: str,
-    semantic_matcher) -> DemandSignalResult:
+    problem_scores: Dict[str, float],
+    solution_scores: Optional[Dict[str, float]],
+    lexical_phrases: Optional[Dict[str, List[str]]] = None,
+    escalated: Optional[List[str]] = None) -> DemandSignalResult:
     signals=[]
     semantic_scores={}
     score=0.0
 
-    pain_score=semantic_matcher(problem_text, PAIN_DRIVEN_LANGUAGE)
-    outcome_score=semantic_matcher(problem_text, OUTCOME_DRIVEN_LANGUAGE)
-    buzzword_score=semantic_matcher(problem_text, BUZZWORD_POSITIONING)
+    pain_score=problem_scores["pain"]
+    outcome_score=problem_scores["outcome"]
+    buzzword_score=problem_scores["buzzword"]
 
     semantic_scores["pain"]=pain_score
     semantic_scores["outcome"]=outcome_score
     semantic_scores["buzzword"]=buzzword_score
 
+    if solution_scores is not None:
+        semantic_scores["solution_outcome"]=solution_scores["outcome"]
+        semantic_scores["solution_buzzword"]=solution_scores["buzzword"]
+
+        outcome_score=max(outcome_score, solution_scores["outcome"])
+        buzzword_score=max(buzzword_score, solution_scores["buzzword"])
+
     if pain_score > 0.6:
         score+=3
         signals.append("Strong pain-driven language detected")
@@ -56,6 +156,61 @@ def demand_signal_tool(
         demand_score=round(score,2),
         signals=signals,
         confidence=confidence,
-        semantic_scores=semantic_scores
+        semantic_scores=semantic_scores,
+        lexical_phrases=lexical_phrases or {},
+        escalated=escalated or [],
+    )
+
+
+def demand_signal_tool(
+    solution_text: str,
+    problem_text: str,
+    semantic_matcher=None,
+    score_solution: bool = False) -> DemandSignalResult:
+    band = lexical_band()
+    texts = {"problem": (problem_text, PROBLEM_BUCKETS)}
+    if score_solution and solution_text:
+        texts["solution"] = (solution_text, SOLUTION_BUCKETS)
+
+    scores, phrases, escalated = {}, {}, []
+    for label, (text, buckets) in texts.items():
+        scores[label], found, ambiguous = prescore(text, buckets, band)
+        phrases.update({f"{label}.{name}": p for name, p in found.items()})
+        if ambiguous:
+            if semantic_matcher is None:
+                semantic_matcher=get_semantic_matcher()
+            scores[label].update(match_buckets(semantic_matcher, text, ambiguous))
+            escalated.extend(f"{label}.{name}" for name in ambiguous)
+
+    return _score_demand(problem_text, scores["problem"], scores.get("solution"), phrases, escalated)
+
+
+async def demand_signal_tool_async(
+    solution_text: str,
+    problem_text: str,
+    semantic_matcher=None,
+    score_solution: bool = False) -> DemandSignalResult:
+    band = lexical_band()
+    texts = {"problem": (problem_text, PROBLEM_BUCKETS)}
+    if score_solution and solution_text:
+        texts["solution"] = (solution_text, SOLUTION_BUCKETS)
+
+    scores, phrases, escalations = {}, {}, {}
+    for label, (text, buckets) in texts.items():
+        scores[label], found, ambiguous = prescore(text, buckets, band)
+        phrases.update({f"{label}.{name}": p for name, p in found.items()})
+        if ambiguous:
+            escalations[label] = (text, ambiguous)
+
+    if escalations:
+        if semantic_matcher is None:
+            semantic_matcher=get_semantic_matcher()
+        # the problem and solution escalations run concurrently
+        results = await asyncio.gather(*(
+            amatch_buckets(semantic_matcher, text, ambiguous) for text, ambiguous in escalations.values()
+        ))
+        for label, result in zip(escalations, results):
+            scores[label].update(result)
 
-    )
\ No newline at end of file
+    escalated = [f"{label}.{name}" for label, (_, ambiguous) in escalations.items() for name in ambiguous]
+    return _score_demand(problem_text, scores["problem"], scores.get("solution"), phrases, escalated)
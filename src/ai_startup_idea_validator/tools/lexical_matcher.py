@@ -0,0 +1,160 @@
+"""
+Deterministic lexical pre-scorer for the demand concept buckets.
+
+Every concept phrase (plus its closed-compound variant) is tokenized,
+lemmatized and compiled into one word-level Aho-Corasick automaton, so a
+text is scanned once, in time linear in its length, for all buckets at
+once. A bucket's score is its hit density: the share of the text's tokens
+covered by the bucket's phrases, scaled so that DENSITY_SATURATION coverage
+(a two-word phrase in a fifteen-word sentence) scores 1.0.
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from ai_startup_idea_validator.tools.demand_concepts import (
+    BUZZWORD_POSITIONING,
+    PAIN_DRIVEN_LANGUAGE,
+    OUTCOME_DRIVEN_LANGUAGE,
+)
+
+DEMAND_BUCKETS = {
+    "pain": PAIN_DRIVEN_LANGUAGE,
+    "outcome": OUTCOME_DRIVEN_LANGUAGE,
+    "buzzword": BUZZWORD_POSITIONING,
+}
+
+# covered-token share at which a bucket scores 1.0
+DENSITY_SATURATION = 1 / 7.5
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_HYPHEN = re.compile(r"(?<=[a-z0-9])-(?=[a-z0-9])")
+
+
+# ---- normalization ----
+
+def lemma(token: str) -> str:
+    """
+    Crude suffix-stripping lemma, applied to phrases and text alike so that
+    "workflows" / "workflow" and "reduce" / "reduced" / "reducing" meet.
+    """
+    if len(token) <= 3:
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        token = token[:-3] + "y"
+    elif token.endswith(("sses", "shes", "ches", "xes")):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = token[:-1]
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [lemma(token) for token in _TOKEN.findall(text.lower())]
+
+
+def phrase_variants(phrase: str) -> List[Tuple[str, ...]]:
+    """
+    Token sequences a phrase is matched as: the phrase itself ("ai-powered"
+    and "ai powered" tokenize the same) and, if hyphenated, the closed
+    compound ("aipowered", "endtoend platform").
+    """
+    text = phrase.lower()
+    variants = {tuple(tokenize(text)), tuple(tokenize(_HYPHEN.sub("", text)))}
+    return sorted(variant for variant in variants if variant)
+
+
+# ---- automaton ----
+
+@dataclass
+class LexicalMatch:
+    """
+    Per-bucket hit-density scores in [0, 1] and the concept phrases found.
+    """
+    scores: Dict[str, float]
+    phrases: Dict[str, List[str]] = field(default_factory=dict)
+    tokens: int = 0
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick over lemmatized tokens. States are dicts of token -> state;
+    each state's outputs include those reachable through its failure links.
+    """
+
+    def __init__(self, buckets: Mapping[str, Sequence[str]]):
+        self.buckets = list(buckets)
+        self.goto: List[Dict[str, int]] = [{}]
+        # (bucket, phrase, length in tokens) per state
+        self.outputs: List[List[Tuple[str, str, int]]] = [[]]
+
+        for bucket, phrases in buckets.items():
+            for phrase in phrases:
+                for variant in phrase_variants(phrase):
+                    state = 0
+                    for token in variant:
+                        nxt = self.goto[state].get(token)
+                        if nxt is None:
+                            nxt = len(self.goto)
+                            self.goto[state][token] = nxt
+                            self.goto.append({})
+                            self.outputs.append([])
+                        state = nxt
+                    self.outputs[state].append((bucket, phrase, len(variant)))
+
+        # breadth-first failure links
+        self.fail = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for token, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(token, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.outputs[nxt] = self.outputs[nxt] + self.outputs[self.fail[nxt]]
+
+    def scan(self, text: str) -> LexicalMatch:
+        tokens = tokenize(text)
+        covered: Dict[str, Set[int]] = {bucket: set() for bucket in self.buckets}
+        phrases: Dict[str, Dict[str, None]] = {bucket: {} for bucket in self.buckets}
+
+        state = 0
+        for end, token in enumerate(tokens):
+            while state and token not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(token, 0)
+            for bucket, phrase, length in self.outputs[state]:
+                covered[bucket].update(range(end - length + 1, end + 1))
+                phrases[bucket].setdefault(phrase, None)
+
+        denominator = max(len(tokens), 1) * DENSITY_SATURATION
+        return LexicalMatch(
+            scores={bucket: round(min(1.0, len(covered[bucket]) / denominator), 3) for bucket in self.buckets},
+            phrases={bucket: list(found) for bucket, found in phrases.items() if found},
+            tokens=len(tokens),
+        )
+
+
+_automaton: Optional[PhraseAutomaton] = None
+_automaton_lock = threading.Lock()
+
+
+def get_demand_automaton() -> PhraseAutomaton:
+    """
+    The automaton over DEMAND_BUCKETS, built on first use.
+    """
+    global _automaton
+    if _automaton is None:
+        with _automaton_lock:
+            if _automaton is None:
+                _automaton = PhraseAutomaton(DEMAND_BUCKETS)
+    return _automaton
@@ -0,0 +1,128 @@
+import re
+import threading
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ai_startup_idea_validator.tools.demand_concepts import (
+    BUZZWORD_POSITIONING,
+    PAIN_DRIVEN_LANGUAGE,
+    OUTCOME_DRIVEN_LANGUAGE,
+)
+
+
+# ---- hashed character n-gram embeddings ----
+
+class HashedNgramEmbedder:
+    """
+    Embeds text as L2-normalised counts of hashed character n-grams.
+    Stateless and offline: no vocabulary, no model download.
+    """
+
+    def __init__(self, dim: int = 2048, ngram_range: Tuple[int, int] = (3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def _features(self, text: str) -> List[int]:
+        padded = f" {text} "
+        lo, hi = self.ngram_range
+        return [
+            # crc32 is stable across processes, unlike hash()
+            zlib.crc32(padded[i:i + n].encode("utf-8")) % self.dim
+            for n in range(lo, hi + 1)
+            for i in range(len(padded) - n + 1)
+        ]
+
+    def embed(self, texts: Iterable[str]) -> np.ndarray:
+        texts = list(texts)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            feats = self._features(text)
+            rows.extend([row] * len(feats))
+            cols.extend(feats)
+
+        np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+# ---- matcher backend ----
+
+class LocalSemanticMatcher:
+    """
+    Offline drop-in for `semantic_matcher`.
+
+    Concept phrases are embedded once into a matrix. The input text is split into
+    short word windows (phrase-sized), all windows are embedded together, and the
+    bucket score is the best cosine similarity between any window and any phrase,
+    rescaled so that the similarity unrelated text gets by chance maps to 0.
+    """
+
+    def __init__(
+        self,
+        embedder: HashedNgramEmbedder | None = None,
+        window_sizes: Tuple[int, ...] = (1, 2, 3, 4, 5),
+        concept_buckets: Iterable[List[str]] = (),
+        noise_floor: float = 0.35,
+    ):
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.window_sizes = window_sizes
+        self.noise_floor = noise_floor
+        self._concept_matrices: Dict[Tuple[str, ...], np.ndarray] = {}
+        self._lock = threading.Lock()
+        # the same text is usually scored against several buckets in a row
+        self.window_matrix = lru_cache(maxsize=64)(self._window_matrix)
+
+        for concepts in concept_buckets:
+            self.concept_matrix(concepts)
+
+    def concept_matrix(self, concept_list: List[str]) -> np.ndarray:
+        key = tuple(concept_list)
+        matrix = self._concept_matrices.get(key)
+        if matrix is None:
+            matrix = self.embedder.embed(normalize_text(c) for c in concept_list)
+            with self._lock:
+                self._concept_matrices[key] = matrix
+        return matrix
+
+    def _window_matrix(self, text: str) -> np.ndarray:
+        words = normalize_text(text).split()
+        windows = [
+            " ".join(words[i:i + size])
+            for size in self.window_sizes
+            for i in range(len(words) - size + 1)
+        ]
+        return self.embedder.embed(windows)
+
+    def __call__(self, text: str, concept_list: List[str]) -> float:
+        windows = self.window_matrix(text)
+        if not len(windows) or not concept_list:
+            return 0.0
+
+        best = float((windows @ self.concept_matrix(concept_list).T).max())
+        score = (best - self.noise_floor) / (1.0 - self.noise_floor)
+        return round(min(1.0, max(0.0, score)), 4)
+
+    def match_buckets(self, text: str, buckets: Dict[str, List[str]]) -> Dict[str, float]:
+        return {name: self(text, concepts) for name, concepts in buckets.items()}
+
+
+DEMAND_CONCEPT_BUCKETS = (
+    PAIN_DRIVEN_LANGUAGE,
+    OUTCOME_DRIVEN_LANGUAGE,
+    BUZZWORD_POSITIONING,
+)
+
+# built at import so the demand buckets are embedded once per process
+local_semantic_matcher = LocalSemanticMatcher(concept_buckets=DEMAND_CONCEPT_BUCKETS)
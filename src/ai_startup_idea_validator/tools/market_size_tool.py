@@ -1,9 +1,42 @@
-from token import OP
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
-import json
+import hashlib
 import os
 
+from ai_startup_idea_validator.tools.reference_data import ReferenceData, get_reference_data
+
+
+# ---- distribution mode (env) ----
+
+MARKET_SIZE_SAMPLES_ENV = "MARKET_SIZE_MC_SAMPLES"
+
+# yearly revenue per user assumed when the idea gives no price
+DEFAULT_AVG_ANNUAL_PRICE_USD = 100.0
+
+# Monte Carlo draws per idea; 0 returns the point estimate only
+DEFAULT_SAMPLES = 20_000
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# (low, high) as factors of the point assumption. Price is unknown to an
+# order of magnitude, so it is drawn log-uniformly; the rest are triangular
+# with the point assumption as the mode.
+PRICE_RANGE = (0.5, 2.0)
+ADOPTION_RANGE = (0.5, 1.5)
+REACHABLE_RANGE = (0.5, 1.5)
+INDUSTRY_MULTIPLIER_RANGE = (0.8, 1.2)
+
+
+@dataclass
+class MarketSizeBands:
+    """
+    Percentile bands ("p5" ... "p95") of TAM, SAM and SOM in USD.
+    """
+    tam_usd: Dict[str, float]
+    sam_usd: Dict[str, float]
+    som_usd: Dict[str, float]
+    samples: int
+
+
 @dataclass
 class MarketSizeResult:
     tam_usd: float
@@ -13,25 +46,88 @@ class MarketSizeResult:
     confidence: str
     enriched: bool
     data_source_used:List[str]
+    bands: Optional[MarketSizeBands] = None
+
+
+def format_band(bands: Optional[MarketSizeBands], metric: str) -> str:
+    """
+    "p5–p95: low – high (median m)" for a prompt, or "" without bands.
+    """
+    if bands is None:
+        return ""
+    band = getattr(bands, metric)
+    return f" (p5–p95: {band['p5']:,.0f} – {band['p95']:,.0f}, median {band['p50']:,.0f})"
 
 
 
 def load_population_data():
-    path="data/population.json"
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            return json.load(f)
-    return {}
+    return get_reference_data().population
 
 
 
 def load_industry_multipliers():
-    path="data/industry_multipliers.json"
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            return json.load(f)
-    return {}
-
+    return get_reference_data().industry_multipliers
+
+
+
+def _seed(*parts) -> int:
+    # same inputs -> same bands, so prompts built from them stay cacheable
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def _triangular(rng, point: float, factors: Tuple[float, float], size: int):
+    import numpy as np
+
+    low, high = point * factors[0], point * factors[1]
+    if high <= low:
+        # zero (or negative) point assumption: nothing to spread
+        return np.full(size, float(point))
+    return rng.triangular(low, point, high, size)
+
+
+def simulate_market_size(
+    population: float,
+    avg_annual_price_usd: float,
+    adoption_rate: float,
+    reachable_market_fraction: float,
+    industry_multiplier: float,
+    samples: int = DEFAULT_SAMPLES,
+    seed: Optional[int] = None,
+) -> MarketSizeBands:
+    """
+    Percentile bands of TAM/SAM/SOM from `samples` joint draws of price,
+    adoption, reachable fraction and industry multiplier, in one vectorized pass.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    if avg_annual_price_usd > 0:
+        log_price = np.log(avg_annual_price_usd)
+        price = np.exp(rng.uniform(
+            log_price + np.log(PRICE_RANGE[0]), log_price + np.log(PRICE_RANGE[1]), samples
+        ))
+    else:
+        price = np.full(samples, float(avg_annual_price_usd))
+    multiplier = _triangular(rng, industry_multiplier, INDUSTRY_MULTIPLIER_RANGE, samples)
+    adoption = np.clip(_triangular(rng, adoption_rate, ADOPTION_RANGE, samples), 0.0, 1.0)
+    reachable = np.clip(_triangular(rng, reachable_market_fraction, REACHABLE_RANGE, samples), 0.0, 1.0)
+
+    tam = population * price * multiplier
+    sam = tam * adoption
+    som = sam * reachable
+
+    # nearest-rank percentiles; one vectorized sort beats np.percentile's
+    # repeated partitioning at these sizes. rows: tam, sam, som
+    ranks = [round(p / 100 * (samples - 1)) for p in PERCENTILES]
+    bands = np.sort(np.stack([tam, sam, som]), axis=1)[:, ranks].round(2)
+    labels = [f"p{p}" for p in PERCENTILES]
+    tam_band, sam_band, som_band = (dict(zip(labels, row.tolist())) for row in bands)
+    return MarketSizeBands(tam_usd=tam_band, sam_usd=sam_band, som_usd=som_band, samples=samples)
+
+
+def samples_from_env() -> int:
+    return max(0, int(os.getenv(MARKET_SIZE_SAMPLES_ENV, DEFAULT_SAMPLES)))
 
 
 #### MAIN TOOL
@@ -39,10 +135,18 @@ def market_size_tool(
     geography: str,
     industry: Optional[str],
     target_user: Optional[str],
-    avg_annual_price_usd: float = 100.0,
+    avg_annual_price_usd: float = DEFAULT_AVG_ANNUAL_PRICE_USD,
     adoption_rate : float = 0.05,
-    reachable_market_fraction: float=0.2 )-> MarketSizeResult:
-    
+    reachable_market_fraction: float=0.2,
+    reference: Optional[ReferenceData] = None,
+    samples: Optional[int] = None)-> MarketSizeResult:
+    """
+    Point estimate of TAM/SAM/SOM, plus Monte Carlo percentile bands unless
+    `samples` (default: MARKET_SIZE_MC_SAMPLES env var) is 0.
+    """
+
+    # one snapshot for every lookup below
+    reference = reference or get_reference_data()
     data_sources=[]
     enriched=False
     
@@ -59,7 +163,7 @@ def market_size_tool(
         geography.lower(), 100_000_000
     )
 
-    population_data = load_population_data()
+    population_data = reference.population
     if geography.lower() in population_data:
         population=population_data[geography.lower()]
         data_sources.append("world_back_population")
@@ -67,7 +171,7 @@ def market_size_tool(
 
     
     industry_multiplier=1.0
-    industry_data=load_industry_multipliers()
+    industry_data=reference.industry_multipliers
     if industry and industry.lower() in industry_data:
         industry_multiplier = industry_data[industry.lower()]
         data_sources.append("industry_size_proxy")
@@ -81,6 +185,20 @@ def market_size_tool(
     confidence="medium"
     if not enriched or industry is None or target_user is None:
         confidence="low"
+
+    if samples is None:
+        samples = samples_from_env()
+    bands = None
+    if samples > 0:
+        bands = simulate_market_size(
+            population,
+            avg_annual_price_usd,
+            adoption_rate,
+            reachable_market_fraction,
+            industry_multiplier,
+            samples=samples,
+            seed=_seed(population, avg_annual_price_usd, adoption_rate, reachable_market_fraction, industry_multiplier),
+        )
     
     return MarketSizeResult(
         tam_usd=round(tam,2),
@@ -96,4 +214,5 @@ def market_size_tool(
         confidence=confidence,
         enriched=enriched,
         data_source_used=data_sources,
+        bands=bands,
     )
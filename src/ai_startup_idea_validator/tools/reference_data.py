@@ -0,0 +1,202 @@
+"""
+Process-wide reference data: population by geography, industry size
+multipliers and the known-competitor catalogue.
+
+Files are resolved relative to the package (or REFERENCE_DATA_DIR), loaded
+once into read-only structures and published as a single `ReferenceData`
+snapshot. A compiled competitor store (see competitor_store) next to the
+JSON catalogue is memory-mapped instead of reading the JSON when it is at
+least as new; the competitor records are then decoded from it on access.
+A daemon thread polls the files' mtimes and swaps in a freshly
+loaded snapshot when one changes, so tools never touch the filesystem and a
+caller holding a snapshot sees every table from the same version.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence
+
+if TYPE_CHECKING:
+    from ai_startup_idea_validator.tools.competitor_store import CompetitorStore
+
+logger = logging.getLogger(__name__)
+
+
+# ---- configuration (env) ----
+
+REFERENCE_DATA_DIR_ENV = "REFERENCE_DATA_DIR"
+REFERENCE_DATA_RELOAD_INTERVAL_ENV = "REFERENCE_DATA_RELOAD_SECONDS"
+
+PACKAGE_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+# seconds between mtime checks; 0 disables hot reload
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+POPULATION_FILE = "population.json"
+INDUSTRY_MULTIPLIERS_FILE = "industry_multipliers.json"
+KNOWN_COMPETITORS_FILE = "known_competitors.json"
+COMPILED_COMPETITORS_FILE = "known_competitors.cols"
+FILES = (POPULATION_FILE, INDUSTRY_MULTIPLIERS_FILE, KNOWN_COMPETITORS_FILE, COMPILED_COMPETITORS_FILE)
+
+
+def data_dir() -> Path:
+    path = os.getenv(REFERENCE_DATA_DIR_ENV)
+    return Path(path) if path else PACKAGE_DATA_DIR
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """
+    One immutable version of every reference table. `version` increases with
+    each reload, so derived indexes can be cached per snapshot.
+    """
+    version: int
+    population: Mapping[str, float]
+    industry_multipliers: Mapping[str, float]
+    # a tuple from JSON, or a CompetitorRecords view over `competitor_store`
+    competitors: Sequence[Mapping[str, Any]]
+    mtimes: Mapping[str, float]
+    # memory-mapped columns of the same catalogue, when a fresh compiled file exists
+    competitor_store: Optional["CompetitorStore"] = None
+
+
+def _mtimes(directory: Path) -> Dict[str, float]:
+    mtimes = {}
+    for name in FILES:
+        try:
+            mtimes[name] = os.stat(directory / name).st_mtime
+        except FileNotFoundError:
+            mtimes[name] = 0.0
+    return mtimes
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _open_competitor_store(directory: Path, mtimes: Mapping[str, float]) -> Optional["CompetitorStore"]:
+    """
+    The compiled store if it exists and is at least as new as the JSON;
+    None (read the JSON) otherwise.
+    """
+    if not mtimes[COMPILED_COMPETITORS_FILE]:
+        return None
+    if mtimes[COMPILED_COMPETITORS_FILE] < mtimes[KNOWN_COMPETITORS_FILE]:
+        logger.warning("%s is older than %s; ignoring it until recompiled", COMPILED_COMPETITORS_FILE, KNOWN_COMPETITORS_FILE)
+        return None
+
+    from ai_startup_idea_validator.tools.competitor_store import CompetitorStore
+
+    try:
+        return CompetitorStore.open(directory / COMPILED_COMPETITORS_FILE)
+    except ValueError as e:
+        # e.g. compiled by an older format version
+        logger.warning("cannot use %s, reading %s instead: %s", COMPILED_COMPETITORS_FILE, KNOWN_COMPETITORS_FILE, e)
+        return None
+
+
+def load_reference_data(directory: Optional[Path] = None, version: int = 1) -> ReferenceData:
+    """
+    Reads every file from `directory` (default: `data_dir()`); missing files
+    load as empty tables.
+    """
+    directory = Path(directory) if directory is not None else data_dir()
+    mtimes = _mtimes(directory)
+
+    population = _read_json(directory / POPULATION_FILE, {})
+    multipliers = _read_json(directory / INDUSTRY_MULTIPLIERS_FILE, {})
+
+    store = _open_competitor_store(directory, mtimes)
+    if store is not None:
+        from ai_startup_idea_validator.tools.competitor_store import CompetitorRecords
+
+        competitors = CompetitorRecords(store)
+    else:
+        competitors = _freeze(_read_json(directory / KNOWN_COMPETITORS_FILE, []))
+
+    return ReferenceData(
+        version=version,
+        # lookups are by lower-cased geography / industry
+        population=MappingProxyType({str(k).lower(): v for k, v in population.items()}),
+        industry_multipliers=MappingProxyType({str(k).lower(): v for k, v in multipliers.items()}),
+        competitors=competitors,
+        mtimes=MappingProxyType(mtimes),
+        competitor_store=store,
+    )
+
+
+_current: Optional[ReferenceData] = None
+_current_lock = threading.Lock()
+_init_lock = threading.Lock()
+_watcher: Optional[threading.Thread] = None
+
+
+def reload_reference_data() -> ReferenceData:
+    """
+    Loads the files again and publishes the result. A file that fails to
+    parse (e.g. caught mid-write) leaves the previous snapshot in place.
+    """
+    global _current
+    with _current_lock:
+        version = _current.version + 1 if _current is not None else 1
+        try:
+            data = load_reference_data(version=version)
+        except (OSError, ValueError) as e:
+            if _current is None:
+                raise
+            logger.warning("reference data reload failed, keeping version %d: %s", _current.version, e)
+            return _current
+        # a single reference assignment: readers see the old or the new snapshot, never a mix
+        _current = data
+        return data
+
+
+def _watch(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        current = _current
+        try:
+            if current is not None and _mtimes(data_dir()) != dict(current.mtimes):
+                reload_reference_data()
+        except Exception:
+            # the watcher must outlive a transient filesystem error
+            logger.exception("reference data watcher check failed")
+
+
+def _start_watcher() -> None:
+    global _watcher
+    interval = float(os.getenv(REFERENCE_DATA_RELOAD_INTERVAL_ENV, DEFAULT_RELOAD_INTERVAL))
+    if interval <= 0 or _watcher is not None:
+        return
+    _watcher = threading.Thread(target=_watch, args=(interval,), name="reference-data-watcher", daemon=True)
+    _watcher.start()
+
+
+def get_reference_data() -> ReferenceData:
+    """
+    The current snapshot. The first call loads it and starts the watcher;
+    after that this is a plain attribute read.
+    """
+    data = _current
+    if data is not None:
+        return data
+    with _init_lock:
+        if _current is None:
+            reload_reference_data()
+        _start_watcher()
+    return _current
@@ -1,20 +1,94 @@
-import json
-from openai import OpenAI
-from dotenv import load_dotenv
-load_dotenv()
+from __future__ import annotations
 
+import asyncio
+import os
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, TypeVar
 
-client=OpenAI()
+from ai_startup_idea_validator.agents.structured_output import OUTPUT_ERRORS, extract_json
+from ai_startup_idea_validator.cache.llm_cache import (
+    acached_completion,
+    cached_completion,
+    invalidate_completion,
+)
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
+SEMANTIC_MATCHER_MODEL = "gpt-4o-mini"
+SEMANTIC_MATCHER_TEMPERATURE = 0.0
 
-def semantic_matcher(text: str, concept_list: list[str]) -> float:
+SEMANTIC_MATCHER_BACKEND_ENV = "SEMANTIC_MATCHER_BACKEND"
+DEFAULT_BACKEND = "openai"
+
+SemanticMatcher = Callable[[str, List[str]], float]
+
+T = TypeVar("T")
+
+_client: Optional[OpenAI] = None
+_async_client: Optional[AsyncOpenAI] = None
+
+
+def _get_client() -> OpenAI:
+    global _client
+    if _client is None:
+        from openai import OpenAI
+
+        _client = OpenAI()
+    return _client
+
+
+def _get_async_client() -> AsyncOpenAI:
+    global _async_client
+    if _async_client is None:
+        from openai import AsyncOpenAI
+
+        _async_client = AsyncOpenAI()
+    return _async_client
+
+
+def _complete(prompt: str) -> str:
+    response = _get_client().chat.completions.create(
+        model=SEMANTIC_MATCHER_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=SEMANTIC_MATCHER_TEMPERATURE,
+    )
+    return response.choices[0].message.content
+
+
+async def _acomplete(prompt: str) -> str:
+    response = await _get_async_client().chat.completions.create(
+        model=SEMANTIC_MATCHER_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=SEMANTIC_MATCHER_TEMPERATURE,
+    )
+    return response.choices[0].message.content
+
+
+def _parse_or_invalidate(prompt: str, content: str, parse: Callable[[str], T], fallback: T) -> T:
     """
-    Returns a similarity score in [0, 1] indicating whether `text`
-    semantically matches the given concept bucket.
+    `parse(content)`, or `fallback` when the completion is not the promised
+    JSON; the completion is then dropped from the cache so the next call
+    asks again instead of replaying it for the whole TTL.
     """
+    try:
+        return parse(content)
+    except OUTPUT_ERRORS:
+        invalidate_completion(SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt)
+        return fallback
+
+
+async def _aparse_or_invalidate(prompt: str, content: str, parse: Callable[[str], T], fallback: T) -> T:
+    try:
+        return parse(content)
+    except OUTPUT_ERRORS:
+        await asyncio.to_thread(invalidate_completion, SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt)
+        return fallback
+
+
+# ---- single bucket ----
 
-    prompt = f"""
+def _bucket_prompt(text: str, concept_list: list[str]) -> str:
+    return f"""
 You are a semantic classifier.
 
 Text:
@@ -33,16 +107,115 @@ Return ONLY valid JSON:
 }}
 """
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.0,
+
+def _parse_similarity(content: str) -> float:
+    return min(1.0, max(0.0, float(extract_json(content).get("similarity_score", 0.0))))
+
+
+def semantic_matcher(text: str, concept_list: list[str]) -> float:
+    """
+    Returns a similarity score in [0, 1] indicating whether `text`
+    semantically matches the given concept bucket.
+    """
+    prompt = _bucket_prompt(text, concept_list)
+    content = cached_completion(
+        SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt, lambda: _complete(prompt)
     )
+    # Fail safe: no match if parsing fails
+    return _parse_or_invalidate(prompt, content, _parse_similarity, 0.0)
 
-    try:
-        content = response.choices[0].message.content
-        data = json.loads(content)
-        return float(data.get("similarity_score", 0.0))
-    except Exception:
-        # Fail safe: no match if parsing fails
-        return 0.0
+
+async def semantic_matcher_async(text: str, concept_list: list[str]) -> float:
+    prompt = _bucket_prompt(text, concept_list)
+    content = await acached_completion(
+        SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt, lambda: _acomplete(prompt)
+    )
+    return await _aparse_or_invalidate(prompt, content, _parse_similarity, 0.0)
+
+
+# ---- several buckets in one request ----
+
+def _multi_bucket_prompt(text: str, buckets: Dict[str, list[str]]) -> str:
+    bucket_lines = "\n".join(f"- {name}: {concepts}" for name, concepts in buckets.items())
+    shape = ",\n".join(f'  "{name}": number between 0 and 1' for name in buckets)
+
+    return f"""
+You are a semantic classifier.
+
+Text:
+\"\"\"{text}\"\"\"
+
+Concept buckets:
+{bucket_lines}
+
+Task:
+For EACH bucket independently, decide how strongly the text matches the *meaning* of that bucket.
+Do NOT judge quality, usefulness, or business value.
+
+Return ONLY valid JSON with one key per bucket:
+{{
+{shape}
+}}
+"""
+
+
+def _parse_bucket_scores(content: str, buckets: Dict[str, list[str]]) -> Dict[str, float]:
+    data = extract_json(content)
+    if not isinstance(data, dict):
+        data = {}
+
+    scores = {}
+    for name in buckets:
+        try:
+            scores[name] = min(1.0, max(0.0, float(data.get(name, 0.0))))
+        except (TypeError, ValueError):
+            scores[name] = 0.0
+    return scores
+
+
+def semantic_bucket_matcher(text: str, buckets: Dict[str, list[str]]) -> Dict[str, float]:
+    """
+    Scores `text` against several named concept buckets in a single request.
+    Returns {bucket_name: similarity in [0, 1]}.
+    """
+    prompt = _multi_bucket_prompt(text, buckets)
+    content = cached_completion(
+        SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt, lambda: _complete(prompt)
+    )
+    # Fail safe: no match if parsing fails
+    return _parse_or_invalidate(
+        prompt, content, lambda c: _parse_bucket_scores(c, buckets), {name: 0.0 for name in buckets}
+    )
+
+
+async def semantic_bucket_matcher_async(text: str, buckets: Dict[str, list[str]]) -> Dict[str, float]:
+    prompt = _multi_bucket_prompt(text, buckets)
+    content = await acached_completion(
+        SEMANTIC_MATCHER_MODEL, SEMANTIC_MATCHER_TEMPERATURE, prompt, lambda: _acomplete(prompt)
+    )
+    return await _aparse_or_invalidate(
+        prompt, content, lambda c: _parse_bucket_scores(c, buckets), {name: 0.0 for name in buckets}
+    )
+
+
+# matchers that can score several buckets at once expose it as `match_buckets`,
+# and as `amatch_buckets` when they can do it without blocking the event loop
+semantic_matcher.match_buckets = semantic_bucket_matcher
+semantic_matcher.amatch_buckets = semantic_bucket_matcher_async
+
+
+def get_semantic_matcher(backend: Optional[str] = None) -> SemanticMatcher:
+    """
+    Resolves the matcher backend: "openai" (LLM call per bucket) or
+    "local" (offline hashed n-gram embeddings). Defaults to the
+    SEMANTIC_MATCHER_BACKEND environment variable.
+    """
+    backend = (backend or os.getenv(SEMANTIC_MATCHER_BACKEND_ENV) or DEFAULT_BACKEND).lower()
+
+    if backend == "openai":
+        return semantic_matcher
+    if backend == "local":
+        from ai_startup_idea_validator.tools.local_semantic_matcher import local_semantic_matcher
+        return local_semantic_matcher
+
+    raise ValueError(f"Unknown semantic matcher backend: {backend}")
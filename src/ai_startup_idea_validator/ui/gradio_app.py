@@ -1,7 +1,38 @@
+import time
+
 import gradio as gr
 import requests
 
-API_URL="http://127.0.0.1:8000/validate"
+API_BASE_URL="http://127.0.0.1:8000"
+JOBS_URL=f"{API_BASE_URL}/jobs"
+
+POLL_INTERVAL_SECONDS=2
+MAX_WAIT_SECONDS=900
+
+
+def wait_for_job(payload):
+    """
+    Submits the idea as a background job and polls until it finishes,
+    so no single HTTP request has to outlive the pipeline.
+    """
+    response = requests.post(JOBS_URL, json=payload, timeout=30)
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "a few")
+        raise gr.Error(f"The validator is busy. Please retry in {retry_after} seconds.")
+    response.raise_for_status()
+    job_id = response.json()["job_id"]
+
+    deadline = time.monotonic() + MAX_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        job = requests.get(f"{JOBS_URL}/{job_id}", timeout=30).json()
+        if job["status"] == "succeeded":
+            return job["result"]
+        if job["status"] == "failed":
+            raise gr.Error(f"Validation failed: {job['error']}")
+        time.sleep(POLL_INTERVAL_SECONDS)
+
+    raise gr.Error(f"Validation {job_id} is still running; check back later.")
+
 
 def validate_startup(
     problem, solution, geography, industry, target_user, differentiation, monetization_model, founder_expertise,):
@@ -16,21 +47,19 @@ def validate_startup(
         "founder_expertise":founder_expertise,
     }
 
-    response = requests.post(API_URL, json=payload, timeout=300)
-    response.raise_for_status()
-
-    data=response.json()
+    result = wait_for_job(payload)
 
-    explanation=data["explanation"]
+    final_decision=result["final_decision"]
+    explanation=result["final_explanation"]
 
     return (
-        data["final_score"],
-        data["verdict"],
+        final_decision["final_score"],
+        final_decision["verdict"],
         explanation["summary"],
         "\n".join(f"- {x}" for x in explanation["key_reasons_for_score"]),
         "\n".join(f"- {x}" for x in explanation["key_risks"]),
         "\n".join(f"- {x}" for x in explanation["recommended_next_steps"]),
-        data["confidence_level"],
+        final_decision["confidence_level"],
     )
 
 